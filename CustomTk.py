@@ -1,12 +1,13 @@
 import customtkinter as ctk
-import requests
+from requests.exceptions import RequestException
+from http_client import fetch, fetch_media
 from bs4 import BeautifulSoup
 import os
 import zipfile
 import io
 from urllib.parse import urljoin, urlparse
 import re
-from PIL import Image, ImageTk
+from PIL import ImageTk
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict
@@ -16,7 +17,9 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+from chromedriver import chromedriver_path
+from image_pipeline import fetch_thumbnail, thumbnail_for, to_image
+from image_store import ImageStore
 import logging
 import platform
 import json
@@ -40,7 +43,8 @@ class WebScraperApp:
         self.root.title("Web Scraper")
         self.root.geometry("1200x800")
         
-        self.image_data: Dict[str, bytes] = {}
+        # Original image bytes for export and preview; bounded, spills to disk and re-fetches
+        self.image_data = ImageStore()
         self.gallery_images: List[Tuple[ImageTk.PhotoImage, str, Tuple[int, int]]] = []
         self.all_image_urls: List[str] = []
         self.text_content: str = ""
@@ -353,7 +357,7 @@ class WebScraperApp:
                     self.update_content()
             elif data_type == "Text":
                 self.result_label.configure(text="Scraping text...")
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = fetch(url, headers=self.headers)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
                 self.text_content = soup.get_text(separator="\n", strip=True)
@@ -418,7 +422,7 @@ class WebScraperApp:
 
     def scrape_tables(self, url):
         try:
-            response = requests.get(url, timeout=10)
+            response = fetch(url)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             tables = soup.find_all('table')
@@ -438,13 +442,13 @@ class WebScraperApp:
                 if table_rows:
                     table_data.append(table_rows)
             return table_data
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
     def scrape_images(self, url, image_format):
         try:
-            response = requests.get(url, timeout=10)
+            response = fetch(url)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             images = soup.find_all(['img', 'image'])
@@ -458,7 +462,7 @@ class WebScraperApp:
                 logger.info(f"No images found with BS4 at {url}, trying Selenium")
                 chrome_options = Options()
                 chrome_options.add_argument("--headless")
-                driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+                driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
                 driver.get(url)
                 WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "img")))
                 soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -470,7 +474,7 @@ class WebScraperApp:
                         image_urls.append(full_url)
                 driver.quit()
             return image_urls if image_urls else None
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
@@ -480,14 +484,14 @@ class WebScraperApp:
         }
         try:
             search_url = f"https://www.imdb.com/find?q={movie_name.replace(' ', '+')}&ref_=nv_sr_sm"
-            search_response = requests.get(search_url, headers=headers, timeout=10)
+            search_response = fetch(search_url, headers=headers)
             search_response.raise_for_status()
             search_soup = BeautifulSoup(search_response.content, 'html.parser')
             first_result = search_soup.select_one('.ipc-metadata-list-summary-item a')
             if not first_result:
                 return {"error": "No movie found with that name."}
             movie_url = "https://www.imdb.com" + first_result.get('href', '')
-            movie_response = requests.get(movie_url, headers=headers, timeout=10)
+            movie_response = fetch(movie_url, headers=headers)
             movie_response.raise_for_status()
             soup = BeautifulSoup(movie_response.content, 'html.parser')
             title_elem = soup.select_one('h1')
@@ -513,7 +517,7 @@ class WebScraperApp:
             }
             logger.info(f"Scraped movie details for '{movie_name}': {movie_details}")
             return movie_details
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             error_msg = {"error": f"Network error: {e}"}
             logger.error(f"Network error in scrape_movie_details: {error_msg}")
             return error_msg
@@ -526,7 +530,7 @@ class WebScraperApp:
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
         try:
             search_url = f"https://openlibrary.org/search?q={book_name.replace(' ', '+')}&mode=everything"
-            search_response = requests.get(search_url, headers=headers, timeout=10)
+            search_response = fetch(search_url, headers=headers)
             search_response.raise_for_status()
             search_soup = BeautifulSoup(search_response.content, 'html.parser')
             first_result = search_soup.select_one('li.searchResultItem')
@@ -546,7 +550,7 @@ class WebScraperApp:
             detail_url = f"https://openlibrary.org{book_link}" if book_link != "N/A" else "N/A"
             description = "N/A"
             if detail_url != "N/A":
-                detail_response = requests.get(detail_url, headers=headers, timeout=10)
+                detail_response = fetch(detail_url, headers=headers)
                 detail_response.raise_for_status()
                 detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
                 description_elem = detail_soup.select_one('div.read-more__content')
@@ -561,14 +565,14 @@ class WebScraperApp:
                 "book_link": detail_url
             }
             return book_details
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             return {"error": f"Network error: {e}"}
         except Exception as e:
             return {"error": f"An error occurred: {e}"}
 
     def scrape_videos(self, url, video_format):
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = fetch(url, headers=self.headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             videos = soup.find_all('video')
@@ -591,7 +595,7 @@ class WebScraperApp:
                 logger.info(f"No videos found with BS4 at {url}, trying Selenium")
                 chrome_options = Options()
                 chrome_options.add_argument("--headless")
-                driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+                driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
                 driver.get(url)
                 WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "video")))
                 soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -612,7 +616,7 @@ class WebScraperApp:
                             video_urls.append(video_url)
                 driver.quit()
             return tuple(video_urls) if video_urls else ()
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
         except Exception as e:
@@ -626,7 +630,7 @@ class WebScraperApp:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+        driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
         try:
             driver.get(search_url)
             WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'li.s-item')))
@@ -677,7 +681,7 @@ class WebScraperApp:
     def scrape_news_headlines(self, url):
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = fetch(url, headers=headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             headlines = soup.find_all(['h1', 'h2', 'h3'])
@@ -695,14 +699,14 @@ class WebScraperApp:
                 if text and is_valid_headline(text) and text not in headline_texts:
                     headline_texts.append(text)
             return tuple(headline_texts) if headline_texts else None
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
     def scrape_pdf_links(self, url):
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = fetch(url, headers=headers)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             pdf_links = []
@@ -715,7 +719,7 @@ class WebScraperApp:
                 seen_urls = set()
                 unique_pdf_links = [link for link in pdf_links if not (link['url'] in seen_urls or seen_urls.add(link['url']))]
                 return unique_pdf_links
-        except requests.exceptions.RequestException as e:
+        except RequestException as e:
             logger.error(f"BS4 request failed: {e}")
 
         logger.info("No PDFs found with BS4, falling back to Selenium")
@@ -728,7 +732,7 @@ class WebScraperApp:
 
         driver = None
         try:
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+            driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
             driver.set_page_load_timeout(30)
             logger.info(f"Navigating to URL: {url}")
             driver.get(url)
@@ -776,7 +780,7 @@ class WebScraperApp:
 
     def download_image(self, img_url: str) -> Tuple[str, bytes]:
         try:
-            img_response = requests.get(img_url, headers=self.headers, timeout=5)
+            img_response = fetch_media(img_url, headers=self.headers)
             img_response.raise_for_status()
             return img_url, img_response.content
         except Exception:
@@ -815,9 +819,8 @@ class WebScraperApp:
         
         for img_url, content in results:
             if content:
-                self.image_data[img_url] = content
-                img = Image.open(io.BytesIO(content))
-                img.thumbnail((400, 400), Image.Resampling.LANCZOS)
+                self.image_data.put(img_url, content)
+                img = to_image(thumbnail_for(img_url, content, (400, 400)))
                 photo = ImageTk.PhotoImage(img)
                 self.gallery_images.append((photo, img_url, img.size))
         
@@ -938,10 +941,8 @@ class WebScraperApp:
         
         if self.movie_details.get("poster_url", "N/A") != "N/A":
             try:
-                img_response = requests.get(self.movie_details["poster_url"], headers=self.headers, timeout=5)
-                img_response.raise_for_status()
-                img = Image.open(io.BytesIO(img_response.content))
-                img.thumbnail((400, 600), Image.Resampling.LANCZOS)
+                _, decoded = fetch_thumbnail(self.movie_details["poster_url"], (400, 600), headers=self.headers)
+                img = to_image(decoded)
                 photo = ImageTk.PhotoImage(img)
                 self.image_label.configure(image=photo)
                 self.image_label.image = photo
@@ -990,10 +991,8 @@ class WebScraperApp:
         
         if self.book_details.get("cover_url", "N/A") != "N/A":
             try:
-                img_response = requests.get(self.book_details["cover_url"], headers=self.headers, timeout=5)
-                img_response.raise_for_status()
-                img = Image.open(io.BytesIO(img_response.content))
-                img.thumbnail((400, 600), Image.Resampling.LANCZOS)
+                _, decoded = fetch_thumbnail(self.book_details["cover_url"], (400, 600), headers=self.headers)
+                img = to_image(decoded)
                 photo = ImageTk.PhotoImage(img)
                 self.image_label.configure(image=photo)
                 self.image_label.image = photo
@@ -1072,10 +1071,8 @@ class WebScraperApp:
 
                 if item.get("image_url", "N/A") != "N/A":
                     try:
-                        img_response = requests.get(item["image_url"], headers=self.headers, timeout=5)
-                        img_response.raise_for_status()
-                        img = Image.open(io.BytesIO(img_response.content))
-                        img.thumbnail((100, 100), Image.Resampling.LANCZOS)
+                        _, decoded = fetch_thumbnail(item["image_url"], (100, 100), headers=self.headers)
+                        img = to_image(decoded)
                         photo = ImageTk.PhotoImage(img)
                         img_label = ctk.CTkLabel(item_frame, image=photo, text="")
                         img_label.image = photo
@@ -1183,32 +1180,40 @@ class WebScraperApp:
         popup.transient(self.root)
         popup.grab_set()
         
-        img_data = self.image_data.get(img_url)
-        if not img_data:
+        img_label = ctk.CTkLabel(popup, text="Loading...", width=500, height=500)
+        img_label.pack(pady=10)
+        
+        def work():
+            # A stored original is only decoded; otherwise the download goes through the thumbnail store
             try:
-                img_response = requests.get(img_url, headers=self.headers, timeout=5)
-                img_response.raise_for_status()
-                img_data = img_response.content
-                self.image_data[img_url] = img_data
+                img_data = self.image_data.get(img_url, fetch=False)
+                if img_data:
+                    decoded = thumbnail_for(img_url, img_data, (500, 500))
+                else:
+                    img_data, decoded = fetch_thumbnail(img_url, (500, 500), headers=self.headers)
+                    if img_data:
+                        self.image_data.put(img_url, img_data)
             except Exception as e:
                 logger.error(f"Failed to load image for popup: {str(e)}")
-                popup.destroy()
+                self.root.after(0, lambda: popup.winfo_exists() and popup.destroy())
                 return
+            self.root.after(0, show, decoded)
         
-        img = Image.open(io.BytesIO(img_data))
-        img.thumbnail((500, 500), Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(img)
+        def show(decoded):
+            if popup.winfo_exists():
+                photo = ImageTk.PhotoImage(to_image(decoded))
+                img_label.configure(image=photo, text="")
+                img_label.image = photo
         
-        img_label = ctk.CTkLabel(popup, image=photo, text="")
-        img_label.image = photo
-        img_label.pack(pady=10)
+        threading.Thread(target=work, daemon=True).start()
         
         copy_button = ctk.CTkButton(popup, text="Copy URL", command=lambda: self.copy_to_clipboard(img_url))
         copy_button.pack(pady=5)
 
     def download_pdf(self, url: str, name: str) -> None:
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            # PDFs can be large; keep them out of the page cache
+            response = fetch(url, headers=self.headers, cache=False)
             response.raise_for_status()
             downloads_dir = os.path.join(os.path.expanduser("~"), "Downloads")
             os.makedirs(downloads_dir, exist_ok=True)
@@ -1221,7 +1226,7 @@ class WebScraperApp:
 
     def extract_pdf_info(self, url: str) -> None:
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = fetch(url, headers=self.headers, cache=False)
             response.raise_for_status()
             pdf_file = io.BytesIO(response.content)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
@@ -1258,6 +1263,20 @@ class WebScraperApp:
         pyperclip.copy(text)
         self.update_status("Link copied to clipboard", "green")
 
+    def export_images_zip(self, file_path: str, image_urls: List[str]) -> None:
+        """Write the original images to a zip file; runs on a worker thread since evicted images are re-downloaded."""
+        try:
+            with zipfile.ZipFile(file_path, 'w') as zipf:
+                for img_url in image_urls:
+                    img_data = self.image_data.get(img_url, headers=self.headers)
+                    if img_data:
+                        img_name = img_url.split('/')[-1]
+                        zipf.writestr(img_name, img_data)
+        except Exception as e:
+            self.root.after(0, self.update_status, f"Export failed: {str(e)}", "red")
+            return
+        self.root.after(0, self.update_status, f"Images exported to {file_path}", "green")
+
     def export_data(self) -> None:
         data_type = self.data_type_var.get()
         export_format = self.export_format_var.get()
@@ -1267,12 +1286,9 @@ class WebScraperApp:
         try:
             if data_type == "Images" and export_format == "zip":
                 file_path = os.path.join(downloads_dir, "scraped_images.zip")
-                with zipfile.ZipFile(file_path, 'w') as zipf:
-                    for img_url, img_data in self.image_data.items():
-                        if img_data:
-                            img_name = img_url.split('/')[-1]
-                            zipf.writestr(img_name, img_data)
-                self.update_status(f"Images exported to {file_path}", "green")
+                image_urls = [img_url for _, img_url, _ in self.gallery_images]
+                self.update_status(f"Exporting {len(image_urls)} images...")
+                threading.Thread(target=self.export_images_zip, args=(file_path, image_urls), daemon=True).start()
             elif export_format == "csv":
                 file_path = os.path.join(downloads_dir, f"scraped_{data_type.lower().replace(' ', '_')}.csv")
                 with open(file_path, 'w', newline='', encoding='utf-8') as f:
@@ -0,0 +1,188 @@
+import asyncio
+import csv
+import queue
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterable, Iterator, NamedTuple, Optional
+from urllib.parse import urlparse
+import logging
+
+from registry import get_scraper
+from cancellation import CancelToken, CancelledError
+
+logger = logging.getLogger(__name__)
+
+
+class BatchResult(NamedTuple):
+    target: str
+    result: Any
+    error: Optional[str]
+
+
+# Header names read_targets looks for in a CSV file, in order of preference
+TARGET_COLUMNS = ("title", "name", "query", "url")
+
+
+def read_targets(path: str) -> list:
+    """
+    Read URLs or search terms from a text or CSV file.
+
+    Text files hold one target per line. In a .csv file the first column
+    named title, name, query or url (any case) is used; without such a
+    header row, the first column of every row is.
+
+    Args:
+        path (str): File to read; blank lines and lines starting with '#' are skipped
+
+    Returns:
+        list: Targets in file order
+    """
+    if path.lower().endswith(".csv"):
+        return _read_csv_targets(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def _read_csv_targets(path: str) -> list:
+    # utf-8-sig drops the byte order mark spreadsheet programs put in front of the header
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        rows = [row for row in csv.reader(f) if any(cell.strip() for cell in row) and not row[0].lstrip().startswith('#')]
+    if not rows:
+        return []
+    header = [cell.strip().lower() for cell in rows[0]]
+    column = next((header.index(name) for name in TARGET_COLUMNS if name in header), None)
+    if column is None:
+        column = 0
+    else:
+        rows = rows[1:]
+    return [row[column].strip() for row in rows if len(row) > column and row[column].strip()]
+
+
+def _host_key(target: str) -> str:
+    return urlparse(target).netloc.lower() or target
+
+
+async def scrape_batch(targets: Iterable[str], data_type: str, concurrency: int = 16,
+                       per_host: int = 4, cancel: CancelToken = None, **options) -> AsyncIterator[BatchResult]:
+    """
+    Run one scraper over many targets concurrently.
+
+    The event loop schedules the work; each scrape runs on a dedicated
+    worker thread so the blocking scrapers share the pooled HTTP client.
+    A target is only started once its host has a free slot, and targets
+    for a busy host queue behind it while other hosts keep going.
+
+    Args:
+        targets (Iterable[str]): URLs or search terms, consumed lazily
+        data_type (str): Registry key or GUI label of the scraper to run
+        concurrency (int): Maximum number of scrapes in flight overall
+        per_host (int): Maximum number of scrapes in flight per host
+        cancel (CancelToken): Aborts in-flight scrapes and stops starting new ones
+        **options: format/headers passed to registry.get_scraper
+
+    Yields:
+        BatchResult: One result per target, in completion order
+    """
+    scraper = get_scraper(data_type, cancel=cancel, **options)
+    loop = asyncio.get_running_loop()
+    pending = iter(targets)
+    # Targets whose host is at its per_host limit wait here instead of holding up other hosts
+    waiting = defaultdict(deque)
+    waiting_count = 0
+    in_flight = defaultdict(int)
+    running = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch")
+
+    def next_target() -> Optional[str]:
+        nonlocal pending, waiting_count
+        for host, queued in waiting.items():
+            if queued and in_flight[host] < per_host:
+                waiting_count -= 1
+                return queued.popleft()
+        # Read ahead for a free host, but only so far that a lazy target list stays lazy
+        while pending is not None and waiting_count < concurrency:
+            target = next(pending, None)
+            if target is None:
+                pending = None
+            elif in_flight[_host_key(target)] < per_host:
+                return target
+            else:
+                waiting[_host_key(target)].append(target)
+                waiting_count += 1
+        return None
+
+    async def scrape(target: str) -> BatchResult:
+        try:
+            return BatchResult(target, await loop.run_in_executor(executor, scraper, target), None)
+        except CancelledError as e:
+            return BatchResult(target, None, str(e))
+        except Exception as e:
+            logger.error(f"Batch scrape failed for {target}: {e}")
+            return BatchResult(target, None, str(e))
+
+    try:
+        while True:
+            while len(running) < concurrency and not (cancel is not None and cancel.cancelled):
+                target = next_target()
+                if target is None:
+                    break
+                in_flight[_host_key(target)] += 1
+                running[asyncio.ensure_future(scrape(target))] = target
+            if not running:
+                break
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                in_flight[_host_key(running.pop(task))] -= 1
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_batch(targets: Iterable[str], data_type: str, **kwargs) -> Iterator[BatchResult]:
+    """
+    Synchronous wrapper around scrape_batch for scripts and threads.
+
+    Args:
+        targets (Iterable[str]): URLs or search terms
+        data_type (str): Registry key or GUI label of the scraper to run
+        **kwargs: concurrency, per_host, cancel and scraper options
+
+    Yields:
+        BatchResult: One result per target, in completion order
+    """
+    # Scrapes still in flight when the caller stops iterating are aborted
+    own_token = kwargs.get("cancel") is None
+    if own_token:
+        kwargs["cancel"] = CancelToken()
+    results = queue.Queue()
+    stop = threading.Event()
+    done = object()
+
+    async def run():
+        try:
+            async for item in scrape_batch(targets, data_type, **kwargs):
+                results.put(item)
+                if stop.is_set():
+                    break
+        except Exception as e:
+            results.put(e)
+        finally:
+            results.put(done)
+
+    thread = threading.Thread(target=lambda: asyncio.run(run()), daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = results.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        if own_token:
+            kwargs["cancel"].cancel()
@@ -0,0 +1,114 @@
+import csv
+import json
+from typing import Dict, Iterable, Iterator, List, NamedTuple
+import logging
+from batch import iter_batch
+from cancellation import CancelToken, check_cancelled
+from progress import ProgressReporter, report_items, report_stage
+
+logger = logging.getLogger(__name__)
+
+# Detail fields of each lookup kind, in export column order
+BULK_FIELDS = {
+    "book": ["name", "author", "year", "rating", "description", "cover_url", "book_link"],
+    "movie": ["name", "year", "rating", "genre", "plot", "poster_url", "movie_link"],
+}
+
+# Subset shown in the GUI table; long text stays in the export
+TABLE_FIELDS = {
+    "book": ["name", "author", "year", "rating"],
+    "movie": ["name", "year", "rating", "genre"],
+}
+
+
+class TitleResult(NamedTuple):
+    index: int        # position of the title in the input
+    title: str
+    details: Dict     # scrape_*_details result; {"error": ...} on failure
+
+
+def lookup_titles(titles: Iterable[str], kind: str, concurrency: int = 8, cancel: CancelToken = None,
+                  progress: ProgressReporter = None) -> Iterator[TitleResult]:
+    """
+    Look up the best match of every title concurrently.
+
+    Lookups go through the batch engine and so share the pooled HTTP
+    client and its per-host rate limits. A title repeated in the input is
+    looked up once and yielded for each of its positions.
+
+    Args:
+        titles (Iterable[str]): Book or movie titles
+        kind (str): "book" or "movie"
+        concurrency (int): Lookups in flight at once; requests are further paced per host
+        cancel (CancelToken): Aborts in-flight lookups and stops starting new ones
+        progress (ProgressReporter): Receives one item per title resolved
+
+    Yields:
+        TitleResult: One per input title, in completion order
+
+    Raises:
+        CancelledError: If `cancel` fires before every title is resolved
+    """
+    if kind not in BULK_FIELDS:
+        raise ValueError(f"Unknown lookup kind: {kind}")
+    titles = [title.strip() for title in titles]
+    positions: Dict[str, List[int]] = {}
+    for index, title in enumerate(titles):
+        positions.setdefault(title, []).append(index)
+
+    done = 0
+    report_stage(progress, f"Looking up {kind}s")
+    report_items(progress, done, len(titles))
+    for item in iter_batch(list(positions), kind, concurrency=concurrency, cancel=cancel):
+        check_cancelled(cancel)
+        details = item.result if item.error is None else {"error": item.error}
+        if not details:
+            details = {"error": "No data found!"}
+        for index in positions[item.target]:
+            yield TitleResult(index, item.target, details)
+        done += len(positions[item.target])
+        report_items(progress, done, len(titles))
+
+
+def bulk_rows(kind: str, results: Iterable[TitleResult], fields: List[str] = None) -> List[List[str]]:
+    """
+    Flatten lookup results into table rows in input order.
+
+    Args:
+        kind (str): "book" or "movie"
+        results (Iterable[TitleResult]): Results of lookup_titles
+        fields (list): Detail fields to include; defaults to BULK_FIELDS[kind]
+
+    Returns:
+        list: One [title, *fields, error] row per result
+    """
+    fields = fields or BULK_FIELDS[kind]
+    return [[result.title] + [result.details.get(field, "") for field in fields] + [result.details.get("error", "")]
+            for result in sorted(results, key=lambda result: result.index)]
+
+
+def bulk_header(kind: str, fields: List[str] = None) -> List[str]:
+    """Column names matching bulk_rows."""
+    return ["query"] + (fields or BULK_FIELDS[kind]) + ["error"]
+
+
+def export_bulk(path: str, kind: str, results: Iterable[TitleResult]) -> None:
+    """
+    Write lookup results to a .csv or .json file, in input order.
+
+    Args:
+        path (str): Output file; the extension picks the format
+        kind (str): "book" or "movie"
+        results (Iterable[TitleResult]): Results of lookup_titles
+    """
+    header = bulk_header(kind)
+    rows = bulk_rows(kind, results)
+    if path.lower().endswith(".json"):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([dict(zip(header, row)) for row in rows], f, indent=4, ensure_ascii=False)
+    else:
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+    logger.info(f"Exported {len(rows)} {kind} lookups to {path}")
@@ -0,0 +1,77 @@
+import threading
+from contextlib import contextmanager
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CancelledError(Exception):
+    """Raised inside a scrape whose CancelToken has been cancelled."""
+
+
+class CancelToken:
+    """
+    One-shot cancellation signal shared by a scrape and everything it starts.
+
+    Long blocking calls register a callback with `on_cancel()` that
+    interrupts them (closing a response, quitting a browser); loops call
+    `raise_if_cancelled()` between steps.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Signal cancellation and run the registered callbacks once."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Cancel callback failed: {e}")
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise CancelledError("Scrape cancelled")
+
+    def wait(self, timeout: float = None) -> bool:
+        """Sleep until cancelled or the timeout expires; returns True if cancelled."""
+        return self._event.wait(timeout)
+
+    @contextmanager
+    def on_cancel(self, callback):
+        """
+        Run `callback` if the token is cancelled while the with-block runs.
+
+        Args:
+            callback (callable): Interrupts the blocking work, called with no arguments
+
+        Raises:
+            CancelledError: If the token was already cancelled on entry
+        """
+        with self._lock:
+            if self._event.is_set():
+                raise CancelledError("Scrape cancelled")
+            self._callbacks.append(callback)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+
+def check_cancelled(cancel: CancelToken = None) -> None:
+    """Raise CancelledError if `cancel` is given and has been cancelled."""
+    if cancel is not None:
+        cancel.raise_if_cancelled()
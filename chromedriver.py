@@ -0,0 +1,144 @@
+import os
+import re
+import json
+import shutil
+import subprocess
+import threading
+import platform
+import logging
+from disk_cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+
+# CHROMEDRIVER_PATH pins a local binary; SCRAPER_OFFLINE forbids downloads
+_settings = {
+    "pinned_path": os.environ.get("CHROMEDRIVER_PATH") or None,
+    "offline": os.environ.get("SCRAPER_OFFLINE", "").lower() in ("1", "true", "yes"),
+}
+
+_resolved_path = None
+_resolve_lock = threading.Lock()
+
+
+def configure_chromedriver(pinned_path: str = None, offline: bool = None) -> None:
+    """
+    Override the chromedriver resolution settings.
+
+    Args:
+        pinned_path (str): Local chromedriver binary to use without any lookup
+        offline (bool): Never contact the network to resolve a driver
+    """
+    global _resolved_path
+    with _resolve_lock:
+        if pinned_path is not None:
+            _settings["pinned_path"] = pinned_path
+        if offline is not None:
+            _settings["offline"] = offline
+        _resolved_path = None
+
+
+def _major_version(text: str) -> str:
+    match = re.search(r"(\d+)\.\d+", text or "")
+    return match.group(1) if match else None
+
+
+def _run_version(binary: str) -> str:
+    try:
+        output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return _major_version(output)
+
+
+def browser_major_version() -> str:
+    """
+    Detect the major version of the installed Chrome browser.
+
+    Returns:
+        str: Major version such as "124", or None if it cannot be determined
+    """
+    system = platform.system()
+    if system == "Windows":
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+            return _major_version(winreg.QueryValueEx(key, "version")[0])
+        except OSError:
+            return None
+    if system == "Darwin":
+        candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    else:
+        candidates = [shutil.which(name) for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")]
+    for binary in candidates:
+        if binary and os.path.exists(binary):
+            version = _run_version(binary)
+            if version:
+                return version
+    return None
+
+
+def _load_cache() -> dict:
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(entry: dict) -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=4)
+    except OSError as e:
+        logger.warning(f"Could not write chromedriver cache: {e}")
+
+
+def _resolve() -> str:
+    pinned = _settings["pinned_path"]
+    if pinned:
+        if not os.path.exists(pinned):
+            raise FileNotFoundError(f"Pinned chromedriver not found: {pinned}")
+        logger.info(f"Using pinned chromedriver at {pinned}")
+        return pinned
+
+    cached = _load_cache()
+    cached_path = cached.get("path")
+    if cached_path and os.path.exists(cached_path):
+        browser_version = browser_major_version()
+        if browser_version is None or browser_version == cached.get("driver_version"):
+            logger.info(f"Using cached chromedriver at {cached_path}")
+            return cached_path
+        if _settings["offline"]:
+            logger.warning(f"Cached chromedriver {cached.get('driver_version')} does not match Chrome {browser_version}, using it anyway (offline)")
+            return cached_path
+        logger.info(f"Cached chromedriver {cached.get('driver_version')} does not match Chrome {browser_version}, resolving again")
+
+    if _settings["offline"]:
+        raise RuntimeError("Offline mode: set CHROMEDRIVER_PATH to a local chromedriver binary")
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    _save_cache({"path": path, "driver_version": _run_version(path)})
+    return path
+
+
+def chromedriver_path() -> str:
+    """
+    Return the chromedriver binary path, resolving it at most once per process.
+
+    Resolution order is the pinned path, then the on-disk cache if its
+    driver matches the installed Chrome major version, then
+    webdriver-manager (skipped in offline mode).
+
+    Returns:
+        str: Path to the chromedriver binary
+    """
+    global _resolved_path
+    if _resolved_path is None:
+        with _resolve_lock:
+            if _resolved_path is None:
+                _resolved_path = _resolve()
+    return _resolved_path
@@ -0,0 +1,135 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.environ.get("SCRAPER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "scraper-gui"))
+
+
+class DiskLRU:
+    """
+    Size-bounded on-disk key/value store with least-recently-used eviction.
+
+    Each entry is a body file plus a small JSON metadata file, both named
+    by the SHA-256 of the key. Recency is kept in memory and mirrored in
+    file modification times so it survives restarts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None  # digest -> size, oldest first
+        self._total = 0
+
+    def _digest(self, key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _paths(self, digest: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, digest)
+        return base + ".body", base + ".json"
+
+    def _load_index(self) -> None:
+        if self._index is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".body"):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name[:-5], stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((digest, size) for _, digest, size in entries)
+        self._total = sum(self._index.values())
+
+    def get(self, key: str) -> Optional[Tuple[bytes, dict]]:
+        """
+        Read an entry and mark it as recently used.
+
+        Args:
+            key (str): Entry key
+
+        Returns:
+            tuple: (body, metadata) or None on a miss
+        """
+        digest = self._digest(key)
+        body_path, meta_path = self._paths(digest)
+        with self._lock:
+            self._load_index()
+            if digest not in self._index:
+                return None
+            try:
+                with open(body_path, 'rb') as f:
+                    body = f.read()
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                os.utime(body_path)
+            except (OSError, ValueError):
+                self._remove(digest)
+                return None
+            self._index.move_to_end(digest)
+            return body, meta
+
+    def put(self, key: str, body: bytes, meta: dict = None) -> None:
+        """
+        Store an entry, evicting least-recently-used entries over the byte budget.
+
+        Args:
+            key (str): Entry key
+            body (bytes): Payload
+            meta (dict): JSON-serializable metadata stored alongside
+        """
+        if len(body) > self.max_bytes:
+            return
+        digest = self._digest(key)
+        body_path, meta_path = self._paths(digest)
+        with self._lock:
+            self._load_index()
+            try:
+                for path, data, mode in ((body_path, body, 'wb'), (meta_path, json.dumps(meta or {}), 'w')):
+                    fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+                    with os.fdopen(fd, mode) as f:
+                        f.write(data)
+                    os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not write cache entry in {self.directory}: {e}")
+                return
+            self._total -= self._index.pop(digest, 0)
+            self._index[digest] = len(body)
+            self._total += len(body)
+            while self._total > self.max_bytes and self._index:
+                self._remove(next(iter(self._index)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._load_index()
+            self._remove(self._digest(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._load_index()
+            for digest in list(self._index):
+                self._remove(digest)
+
+    def _remove(self, digest: str) -> None:
+        self._total -= self._index.pop(digest, 0)
+        for path in self._paths(digest):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total
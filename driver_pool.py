@@ -0,0 +1,253 @@
+from chromedriver import chromedriver_path
+from cancellation import CancelToken, CancelledError
+from contextlib import contextmanager, nullcontext
+import atexit
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+
+def default_chrome_options():
+    """
+    Build the headless Chrome options shared by every pooled driver.
+
+    Returns:
+        Options: Chrome options
+    """
+    from selenium.webdriver.chrome.options import Options
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    return options
+
+
+class DriverPool:
+    """
+    Bounded pool of warm headless Chrome drivers.
+
+    Drivers are leased with `lease()`, reset between leases, recycled after
+    `max_uses` leases or when they stop responding, and quit on `shutdown()`.
+    """
+
+    def __init__(self, size: int = 2, max_uses: int = 50, page_load_timeout: int = 30):
+        self.size = size
+        self.max_uses = max_uses
+        self.page_load_timeout = page_load_timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._uses = {}
+        self._closed = False
+
+    def _create_driver(self):
+        # Selenium is imported here so importing this module stays cheap
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        logger.info("Starting pooled Chrome driver")
+        return webdriver.Chrome(service=Service(chromedriver_path()), options=default_chrome_options())
+
+    def _checkout(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Driver pool has been shut down")
+            if self._idle:
+                return self._idle.pop()
+        driver = self._create_driver()
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+
+    def _reset(self, driver) -> None:
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass  # about:blank and some origins refuse storage access
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def _checkin(self, driver, discard: bool) -> None:
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            uses = self._uses[driver]
+            closed = self._closed
+        if not discard and not closed and uses < self.max_uses:
+            try:
+                self._reset(driver)
+            except Exception as e:
+                logger.warning(f"Pooled driver failed to reset, recycling it: {e}")
+                discard = True
+        else:
+            discard = True
+        if discard:
+            self._quit(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def _quit(self, driver) -> None:
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting Chrome driver: {e}")
+
+    def _acquire_slot(self, cancel: CancelToken = None) -> None:
+        if cancel is None:
+            self._slots.acquire()
+            return
+        while not self._slots.acquire(timeout=0.2):
+            cancel.raise_if_cancelled()
+        if cancel.cancelled:
+            self._slots.release()
+            cancel.raise_if_cancelled()
+
+    @contextmanager
+    def lease(self, page_load_timeout: int = None, cancel: CancelToken = None):
+        """
+        Lease a driver for the duration of a with-block.
+
+        Cancelling `cancel` during the lease quits the browser, which breaks
+        any call blocked on it; the driver is then discarded rather than
+        returned to the pool.
+
+        Args:
+            page_load_timeout (int): Page load timeout for this lease
+            cancel (CancelToken): Quits the leased driver when cancelled
+
+        Yields:
+            WebDriver: A ready headless Chrome driver
+
+        Raises:
+            CancelledError: If `cancel` fires while waiting for or using the driver
+        """
+        from selenium.common.exceptions import TimeoutException
+        self._acquire_slot(cancel)
+        driver = None
+        discard = False
+        try:
+            driver = self._checkout()
+            driver.set_page_load_timeout(page_load_timeout or self.page_load_timeout)
+            with cancel.on_cancel(driver.quit) if cancel is not None else nullcontext():
+                yield driver
+        except TimeoutException:
+            if cancel is not None and cancel.cancelled:
+                discard = True
+                raise CancelledError("Scrape cancelled") from None
+            raise
+        except CancelledError:
+            discard = True
+            raise
+        except Exception:
+            # Anything else may have left the browser in a broken state
+            discard = True
+            if cancel is not None and cancel.cancelled:
+                raise CancelledError("Scrape cancelled") from None
+            raise
+        finally:
+            if driver is not None:
+                self._checkin(driver, discard)
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        """Quit every driver owned by the pool and refuse further leases."""
+        with self._lock:
+            self._closed = True
+            drivers = list(self._uses)
+            self._idle.clear()
+        for driver in drivers:
+            self._quit(driver)
+        if drivers:
+            logger.info(f"Shut down {len(drivers)} pooled Chrome driver(s)")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """
+    Return the process-wide driver pool, creating it on first use.
+
+    Returns:
+        DriverPool: The shared pool
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = DriverPool()
+    return _pool
+
+
+def configure_driver_pool(size: int = 2, max_uses: int = 50, page_load_timeout: int = 30) -> None:
+    """
+    Replace the shared pool with one using the given limits.
+
+    Args:
+        size (int): Maximum number of concurrent drivers
+        max_uses (int): Leases after which a driver is recycled
+        page_load_timeout (int): Default page load timeout in seconds
+    """
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, DriverPool(size, max_uses, page_load_timeout)
+    if old is not None:
+        old.shutdown()
+
+
+def lease_driver(page_load_timeout: int = None, cancel: CancelToken = None):
+    """
+    Lease a driver from the shared pool.
+
+    Args:
+        page_load_timeout (int): Page load timeout for this lease
+        cancel (CancelToken): Quits the leased driver when cancelled
+
+    Returns:
+        contextmanager: Yields a headless Chrome driver
+    """
+    return get_driver_pool().lease(page_load_timeout, cancel)
+
+
+def wait_until(driver, timeout: float, condition, cancel: CancelToken = None):
+    """
+    WebDriverWait.until that also gives up as soon as `cancel` fires.
+
+    Args:
+        driver (WebDriver): Driver to poll
+        timeout (float): Seconds to wait
+        condition (callable): Expected condition, called with the driver
+        cancel (CancelToken): Stops the wait when cancelled
+
+    Returns:
+        Whatever the condition returned once it was truthy
+
+    Raises:
+        CancelledError: If `cancel` fires during the wait
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    def cancellable_condition(d):
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        return condition(d)
+
+    return WebDriverWait(driver, timeout, poll_frequency=0.25).until(cancellable_condition)
+
+
+def shutdown_driver_pool() -> None:
+    """Quit all pooled drivers; registered to run at interpreter exit."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_driver_pool)
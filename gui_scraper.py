@@ -1,11 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 from bs4 import BeautifulSoup
-import requests
+from requests.exceptions import RequestException
+from http_client import fetch, fetch_media
+from result_cache import cached_parse
+from parsers import make_soup
+from progress import PROGRESS_FRAME_MS, ProgressReporter, ProgressState
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from chromedriver import chromedriver_path
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -17,10 +21,8 @@ import zipfile
 import csv
 from PIL import Image
 import urllib.request
-from functools import lru_cache
 import pyperclip
 import threading
-import time
 import webbrowser  # For opening links in the default browser
 
 # Set up logging
@@ -28,57 +30,63 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Scraping Functions
-@lru_cache(maxsize=100)
-def scrape_tables(url):
+def _parse_tables(content):
+    soup = make_soup(content)
+    tables = soup.find_all('table')
+    table_data = []
+    for table in tables:
+        rows = table.find_all('tr')
+        table_rows = [[col.text.strip() for col in row.find_all(['td', 'th'])] for row in rows if row.find_all(['td', 'th'])]
+        if table_rows:
+            table_data.append(table_rows)
+    return table_data
+
+def scrape_tables(url, progress=None):
     try:
-        response = requests.get(url, timeout=10)
+        response = fetch(url, progress=progress)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        tables = soup.find_all('table')
-        table_data = []
-        for table in tables:
-            rows = table.find_all('tr')
-            table_rows = [[col.text.strip() for col in row.find_all(['td', 'th'])] for row in rows if row.find_all(['td', 'th'])]
-            if table_rows:
-                table_data.append(table_rows)
-        return table_data
-    except requests.exceptions.RequestException as e:
+        return cached_parse("gui_scraper.scrape_tables", {}, response.content, _parse_tables)
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
 
-@lru_cache(maxsize=100)
-def scrape_images(url, image_format):
+def _parse_images(content, url, image_format):
+    soup = make_soup(content)
+    images = soup.find_all('img')
+    allowed_formats = {'png': ['.png'], 'jpg': ['.jpg', '.jpeg'], 'all': ['.png', '.jpg', '.jpeg']}
+    image_urls = []
+    for img in images:
+        img_url = img.get('src') or img.get('data-src')
+        if img_url and any(img_url.endswith(ext) for ext in allowed_formats[image_format]):
+            if not img_url.startswith('http'):
+                base_url = url.rsplit('/', 1)[0]
+                img_url = os.path.join(base_url, img_url)
+            image_urls.append(img_url)
+    return image_urls
+
+def scrape_images(url, image_format, progress=None):
     try:
-        response = requests.get(url, timeout=10)
+        response = fetch(url, progress=progress)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        images = soup.find_all('img')
-        allowed_formats = {'png': ['.png'], 'jpg': ['.jpg', '.jpeg'], 'all': ['.png', '.jpg', '.jpeg']}
-        image_urls = []
-        for img in images:
-            img_url = img.get('src') or img.get('data-src')
-            if img_url and any(img_url.endswith(ext) for ext in allowed_formats[image_format]):
-                if not img_url.startswith('http'):
-                    base_url = url.rsplit('/', 1)[0]
-                    img_url = os.path.join(base_url, img_url)
-                image_urls.append(img_url)
-        return image_urls
-    except requests.exceptions.RequestException as e:
+        # Relative image URLs are resolved against the page URL, so it is part of the key
+        return cached_parse("gui_scraper.scrape_images", {"url": url, "image_format": image_format},
+                            response.content, lambda content: _parse_images(content, url, image_format))
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
 
-def scrape_movie_details(movie_name):
+def scrape_movie_details(movie_name, progress=None):
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
     try:
         search_url = f"https://www.imdb.com/find?q={movie_name.replace(' ', '+')}&ref_=nv_sr_sm"
-        search_response = requests.get(search_url, headers=headers, timeout=10)
+        search_response = fetch(search_url, headers=headers, progress=progress)
         search_response.raise_for_status()
         search_soup = BeautifulSoup(search_response.content, 'html.parser')
         first_result = search_soup.select_one('.ipc-metadata-list-summary-item a.ipc-metadata-list-summary-item__t')
         if not first_result:
             return {"error": "No movie found with that name."}
         movie_url = "https://www.imdb.com" + first_result['href']
-        movie_response = requests.get(movie_url, headers=headers, timeout=10)
+        movie_response = fetch(movie_url, headers=headers, progress=progress)
         movie_response.raise_for_status()
         soup = BeautifulSoup(movie_response.content, 'html.parser')
         title = soup.select_one('h1').text.strip()
@@ -100,12 +108,12 @@ def scrape_movie_details(movie_name):
             "plot": plot,
             "genre": genre
         }
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         return {"error": f"Network error: {e}"}
 
-def scrape_videos(url, video_format):
+def scrape_videos(url, video_format, progress=None):
     try:
-        response = requests.get(url, timeout=10)
+        response = fetch(url, progress=progress)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         videos = soup.find_all('video')
@@ -122,7 +130,7 @@ def scrape_videos(url, video_format):
                         video_url = os.path.join(base_url, video_url)
                     video_urls.append(video_url)
         return video_urls
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
 
@@ -133,7 +141,7 @@ def scrape_ebay_product(product_name):
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
     try:
         driver.get(search_url)
         WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'li.s-item')))
@@ -180,10 +188,10 @@ def scrape_ebay_product(product_name):
     finally:
         driver.quit()
 
-def scrape_news_headlines(url):
+def scrape_news_headlines(url, progress=None):
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = fetch(url, headers=headers, progress=progress)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         headlines = soup.find_all(['h1', 'h2', 'h3'])
@@ -201,14 +209,14 @@ def scrape_news_headlines(url):
             if text and is_valid_headline(text) and text not in headline_texts:
                 headline_texts.append(text)
         return headline_texts if headline_texts else None
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
 
-def scrape_pdf_links(url):
+def scrape_pdf_links(url, progress=None):
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = fetch(url, headers=headers, progress=progress)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         pdf_links = []
@@ -221,10 +229,12 @@ def scrape_pdf_links(url):
             seen_urls = set()
             unique_pdf_links = [link for link in pdf_links if not (link['url'] in seen_urls or seen_urls.add(link['url']))]
             return unique_pdf_links
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         logger.error(f"BS4 request failed: {e}")
 
     logger.info("No PDFs found with BS4, falling back to Selenium")
+    if progress is not None:
+        progress.stage("Rendering page in Chrome")
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
@@ -234,7 +244,7 @@ def scrape_pdf_links(url):
 
     driver = None
     try:
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
         driver.set_page_load_timeout(30)
         logger.info(f"Navigating to URL: {url}")
         driver.get(url)
@@ -282,7 +292,7 @@ def scrape_pdf_links(url):
 
 def extract_pdf_info(pdf_url):
     try:
-        response = requests.get(pdf_url, timeout=10)
+        response = fetch(pdf_url, cache=False)
         response.raise_for_status()
         with open('temp.pdf', 'wb') as f:
             f.write(response.content)
@@ -323,7 +333,7 @@ def export_images_to_zip(images):
         with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
             for i, img_url in enumerate(images):
                 try:
-                    img_data = requests.get(img_url, timeout=5).content
+                    img_data = fetch_media(img_url).content
                     img_name = f'image_{i + 1}.{img_url.split(".")[-1]}'
                     zip_file.writestr(img_name, img_data)
                 except Exception as e:
@@ -340,7 +350,7 @@ def download_pdf(pdf_url, pdf_name):
     if not file_path:
         return
     try:
-        response = requests.get(pdf_url, timeout=10)
+        response = fetch(pdf_url, cache=False)
         response.raise_for_status()
         with open(file_path, 'wb') as f:
             f.write(response.content)
@@ -370,23 +380,72 @@ def scrape_data():
     loading_label.pack(pady=10)
     progress_var.set(0)
     progress_bar.pack(pady=5)
-    root.update()
-
-    # Simulate scraping with a progress bar
+    progress = ProgressReporter()
+    progress_state = ProgressState()
+    # Tk variables are read here, on the Tk thread; the worker only scrapes
+    image_format = image_format_var.get()
+    video_format = video_format_var.get()
+    results = {}
+    finished = []
+
+    # Repaint from the scraper's progress events at a fixed rate while the worker runs
     def update_progress():
-        for i in range(1, 11):
-            progress_var.set(i * 10)
-            root.update()
-            time.sleep(0.3)  # Slower progress for better visibility
+        if finished:
+            return
+        progress_state.apply(progress.drain())
+        if not thread.is_alive():
+            finish()
+            return
+        fraction = progress_state.fraction()
+        if fraction is None:
+            if str(progress_bar.cget("mode")) != "indeterminate":
+                progress_bar.config(mode="indeterminate")
+                progress_bar.start()
+        else:
+            if str(progress_bar.cget("mode")) != "determinate":
+                progress_bar.stop()
+                progress_bar.config(mode="determinate")
+            progress_var.set(fraction * 100)
+        loading_label.config(text=progress_state.describe())
+        root.after(PROGRESS_FRAME_MS, update_progress)
+
+    # Runs on the Tk thread once the worker is done, so only the Tk thread touches widgets
+    def finish():
+        if finished:
+            return
+        finished.append(True)
+        progress_bar.stop()
+        progress_bar.config(mode="determinate")
+        progress_bar.pack_forget()
+        loading_label.destroy()
+        show_results(num_items, results.get("data"))
 
     # Run the scraping in a separate thread
-    def run_scraping(num_items_param):
-        update_progress()  # Simulate progress while scraping
+    def run_scraping():
+        try:
+            if data_type == "Tables":
+                results["data"] = scrape_tables(url, progress=progress)
+            elif data_type == "Images":
+                results["data"] = scrape_images(url, image_format, progress=progress)
+            elif data_type == "Movie Details":
+                results["data"] = scrape_movie_details(url, progress=progress)
+            elif data_type == "Videos":
+                results["data"] = scrape_videos(url, video_format, progress=progress)
+            elif data_type == "eBay Products":
+                results["data"] = scrape_ebay_product(url)
+            elif data_type == "News Headlines":
+                results["data"] = scrape_news_headlines(url, progress=progress)
+            elif data_type == "PDF Links":
+                results["data"] = scrape_pdf_links(url, progress=progress)
+        except Exception as e:
+            logger.error(f"Scraping {url} failed: {e}")
+        finally:
+            root.after(0, finish)
+
+    def show_results(num_items_param, data):
 
         if data_type == "Tables":
-            tables = scrape_tables(url)
-            progress_bar.pack_forget()
-            loading_label.destroy()
+            tables = data
             if tables:
                 for widget in scrollable_frame.winfo_children():
                     widget.destroy()
@@ -409,10 +468,7 @@ def scrape_data():
                 tk.Label(scrollable_frame, text="No tables found.", font=("Arial", 12), bg=scrollable_frame["bg"], fg=fg_color).pack(pady=5)
 
         elif data_type == "Images":
-            image_format = image_format_var.get()
-            images = scrape_images(url, image_format)
-            progress_bar.pack_forget()
-            loading_label.destroy()
+            images = data
             if images:
                 num_items = int(num_items_param) if num_items_param and int(num_items_param) <= len(images) else len(images)
                 for widget in scrollable_frame.winfo_children():
@@ -438,9 +494,7 @@ def scrape_data():
                 tk.Label(scrollable_frame, text="No images found.", font=("Arial", 12), bg=scrollable_frame["bg"], fg=fg_color).pack(pady=5)
 
         elif data_type == "Movie Details":
-            movie_data = scrape_movie_details(url)
-            progress_bar.pack_forget()
-            loading_label.destroy()
+            movie_data = data or {"error": "No movie details found."}
             if "error" in movie_data:
                 for widget in scrollable_frame.winfo_children():
                     widget.destroy()
@@ -466,10 +520,7 @@ def scrape_data():
                 tk.Button(details_frame, text="Copy Details", command=lambda d=f"Name: {movie_data['name']}\nYear: {movie_data['year']}\nRating: {movie_data['rating']}\nPlot: {movie_data['plot']}\nGenre: {movie_data['genre']}": pyperclip.copy(d), bg="green", fg="white").pack(anchor="w", pady=2)
 
         elif data_type == "Videos":
-            video_format = video_format_var.get()
-            videos = scrape_videos(url, video_format)
-            progress_bar.pack_forget()
-            loading_label.destroy()
+            videos = data
             if videos:
                 num_items = int(num_items_param) if num_items_param and int(num_items_param) <= len(videos) else len(videos)
                 for widget in scrollable_frame.winfo_children():
@@ -495,9 +546,7 @@ def scrape_data():
                 tk.Label(scrollable_frame, text="No videos found.", font=("Arial", 12), bg=scrollable_frame["bg"], fg=fg_color).pack(pady=5)
 
         elif data_type == "eBay Products":
-            product_details = scrape_ebay_product(url)
-            progress_bar.pack_forget()
-            loading_label.destroy()
+            product_details = data
             if product_details:
                 num_items = int(num_items_param) if num_items_param and int(num_items_param) <= len(product_details) else len(product_details)
                 for widget in scrollable_frame.winfo_children():
@@ -524,9 +573,7 @@ def scrape_data():
                 tk.Label(scrollable_frame, text="No products found on eBay.", font=("Arial", 12), bg=scrollable_frame["bg"], fg=fg_color).pack(pady=5)
 
         elif data_type == "News Headlines":
-            headlines = scrape_news_headlines(url)
-            progress_bar.pack_forget()
-            loading_label.destroy()
+            headlines = data
             if headlines:
                 num_items = int(num_items_param) if num_items_param and int(num_items_param) <= len(headlines) else len(headlines)
                 for widget in scrollable_frame.winfo_children():
@@ -544,9 +591,7 @@ def scrape_data():
                 tk.Label(scrollable_frame, text="No headlines found.", font=("Arial", 12), bg=scrollable_frame["bg"], fg=fg_color).pack(pady=5)
 
         elif data_type == "PDF Links":
-            pdf_links = scrape_pdf_links(url)
-            progress_bar.pack_forget()
-            loading_label.destroy()
+            pdf_links = data
             if pdf_links:
                 num_items = int(num_items_param) if num_items_param and int(num_items_param) <= len(pdf_links) else len(pdf_links)
                 for widget in scrollable_frame.winfo_children():
@@ -576,9 +621,10 @@ def scrape_data():
         # Re-enable the button after scraping is done
         scrape_button.config(state="normal")
 
-    # Start the scraping in a separate thread with num_items as an argument
-    thread = threading.Thread(target=run_scraping, args=(num_items,))
+    # Start the scraping in a separate thread
+    thread = threading.Thread(target=run_scraping)
     thread.start()
+    root.after(PROGRESS_FRAME_MS, update_progress)
 
 def extract_pdf_info_callback(pdf_url):
     info = extract_pdf_info(pdf_url)
@@ -0,0 +1,160 @@
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import Iterator, Optional
+import requests
+from cancellation import CancelToken, CancelledError
+from http_client import bytes_received, content_length, interrupt_response
+from progress import ProgressReporter
+
+
+# Bytes read before picking an encoding; <meta charset> must appear within them, as in the HTML spec
+SNIFF_BYTES = 1024
+
+_BOMS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""", re.IGNORECASE)
+
+
+def _codec(name) -> Optional[str]:
+    try:
+        return codecs.lookup(name.decode("ascii") if isinstance(name, bytes) else name).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+
+def response_encoding(response: requests.Response, head: bytes = b"") -> str:
+    """
+    Pick the text encoding for a streamed HTML response.
+
+    Checked in the order browsers use: a byte order mark, the charset of
+    the Content-Type header, then a <meta charset> near the top of the
+    page. Without any of them the start of the page is tried as UTF-8,
+    falling back to windows-1252 if it is not. requests' own default
+    (ISO-8859-1 for any text/* without a charset) is never used.
+
+    Args:
+        response (requests.Response): Streamed response
+        head (bytes): First bytes of the body, up to SNIFF_BYTES
+
+    Returns:
+        str: Codec name
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    if "charset=" in response.headers.get("Content-Type", "").lower() and response.encoding:
+        encoding = _codec(response.encoding)
+        if encoding:
+            return encoding
+    match = _META_CHARSET.search(head[:SNIFF_BYTES])
+    if match:
+        encoding = _codec(match.group(1))
+        # A page can't really be UTF-16 if its markup was readable as ASCII
+        if encoding and not encoding.startswith("utf-16"):
+            return encoding
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "windows-1252"
+
+
+def iter_response_text(response: requests.Response, chunk_size: int = 64 * 1024,
+                       progress: ProgressReporter = None) -> Iterator[str]:
+    """
+    Decode a streamed response incrementally.
+
+    The encoding is picked from the first SNIFF_BYTES of the body, see
+    response_encoding().
+
+    Args:
+        response (requests.Response): Response fetched with stream=True
+        chunk_size (int): Bytes read per chunk
+        progress (ProgressReporter): Receives bytes-read events as chunks arrive
+
+    Yields:
+        str: Decoded text chunks
+    """
+    decoder = None
+    head = b""
+    total = content_length(response)
+    read = 0
+    for chunk in response.iter_content(chunk_size):
+        read += len(chunk)
+        if progress is not None:
+            progress.bytes_read(bytes_received(response, read), total)
+        if decoder is None:
+            head += chunk
+            if len(head) < SNIFF_BYTES:
+                continue
+            decoder = codecs.getincrementaldecoder(response_encoding(response, head))(errors="replace")
+            chunk, head = head, b""
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    if decoder is None:
+        decoder = codecs.getincrementaldecoder(response_encoding(response, head))(errors="replace")
+    tail = decoder.decode(head, final=True)
+    if tail:
+        yield tail
+
+
+class EventParser(HTMLParser):
+    """HTMLParser that collects events in `self.events` for stream_events()."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.events = []
+
+
+def stream_events(response: requests.Response, parser: EventParser, cancel: CancelToken = None,
+                  progress: ProgressReporter = None) -> Iterator:
+    """
+    Feed a streamed response through an event parser chunk by chunk.
+
+    Events are yielded as soon as the chunk producing them has been fed,
+    so a consumer that stops early also stops the download. The response
+    is closed when the generator finishes or is closed.
+
+    Args:
+        response (requests.Response): Response fetched with stream=True
+        parser (EventParser): Parser appending events to `parser.events`
+        cancel (CancelToken): Closes the response and stops the stream when cancelled
+        progress (ProgressReporter): Receives bytes-read events while the page streams
+
+    Yields:
+        Whatever events the parser produces
+
+    Raises:
+        CancelledError: If `cancel` fires while the page is streaming
+    """
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    try:
+        for text in _cancellable(iter_response_text(response, progress=progress), response, cancel):
+            parser.feed(text)
+            if parser.events:
+                events, parser.events = parser.events, []
+                yield from events
+        parser.close()
+        yield from parser.events
+        parser.events = []
+    finally:
+        response.close()
+
+
+def _cancellable(chunks: Iterator[str], response: requests.Response, cancel: CancelToken) -> Iterator[str]:
+    if cancel is None:
+        yield from chunks
+        return
+    try:
+        with cancel.on_cancel(lambda: interrupt_response(response)):
+            for chunk in chunks:
+                cancel.raise_if_cancelled()
+                yield chunk
+    except CancelledError:
+        raise
+    except Exception:
+        if cancel.cancelled:
+            raise CancelledError("Scrape cancelled") from None
+        raise
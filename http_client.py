@@ -0,0 +1,341 @@
+import os
+import socket
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+import threading
+from contextlib import nullcontext
+import logging
+from disk_cache import CACHE_DIR, DiskLRU
+from cancellation import CancelToken, CancelledError, check_cancelled
+from progress import ProgressReporter
+from rate_limit import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Connection pool and timeout settings shared by every scraper and front end
+_config = {
+    "pool_connections": 20,   # number of per-host pools kept alive
+    "pool_maxsize": 20,       # keep-alive connections per host
+    "max_retries": 0,
+    "page_timeout": 10,       # HTML pages
+    "media_timeout": 5,       # images, covers, thumbnails
+    "headers": dict(DEFAULT_HEADERS),
+    "cache_enabled": True,    # revalidating page cache used by fetch()
+    "cache_dir": os.path.join(CACHE_DIR, "http"),
+    "cache_max_bytes": 200 * 1024 * 1024,
+    "stream_cache_max_bytes": 64 * 1024 * 1024,  # larger streamed pages are not kept in memory for the cache
+    # Requests per second per hostname; the title lookups hit these hosts hard in bulk
+    "host_rates": {"openlibrary.org": 5.0, "www.imdb.com": 5.0},
+    "host_burst": 5,          # requests a rate-limited host may receive back to back
+}
+
+_session = None
+_session_lock = threading.Lock()
+_response_cache = None
+_rate_limiter = None
+
+
+def configure(**settings) -> None:
+    """
+    Update the shared client settings.
+
+    Args:
+        **settings: Any of pool_connections, pool_maxsize, max_retries,
+            page_timeout, media_timeout, headers, cache_enabled, cache_dir,
+            cache_max_bytes, stream_cache_max_bytes, host_rates or host_burst
+
+    The current session, response cache and rate limiter are dropped so
+    the next request picks up the new settings.
+    """
+    global _response_cache, _rate_limiter
+    unknown = set(settings) - set(_config)
+    if unknown:
+        raise ValueError(f"Unknown HTTP client settings: {', '.join(sorted(unknown))}")
+    if "headers" in settings:
+        settings["headers"] = dict(settings["headers"])
+    if "host_rates" in settings:
+        settings["host_rates"] = dict(settings["host_rates"])
+    _config.update(settings)
+    _response_cache = None
+    _rate_limiter = None
+    close()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide session, creating it on first use.
+
+    Returns:
+        requests.Session: Session with per-host keep-alive connection pools
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=_config["pool_connections"],
+                                      pool_maxsize=_config["pool_maxsize"],
+                                      max_retries=_config["max_retries"])
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(_config["headers"])
+                _session = session
+                logger.debug(f"Created HTTP session (pool_maxsize={_config['pool_maxsize']})")
+    return _session
+
+
+def get_response_cache() -> DiskLRU:
+    """
+    Return the on-disk page cache used by fetch().
+
+    Returns:
+        DiskLRU: Cache of response bodies keyed by URL
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _session_lock:
+            if _response_cache is None:
+                _response_cache = DiskLRU(_config["cache_dir"], _config["cache_max_bytes"])
+    return _response_cache
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """
+    Return the per-host rate limiter every request waits on.
+
+    Returns:
+        HostRateLimiter: Limiter built from the host_rates setting
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _session_lock:
+            if _rate_limiter is None:
+                _rate_limiter = HostRateLimiter(_config["host_rates"], _config["host_burst"])
+    return _rate_limiter
+
+
+def interrupt_response(response: requests.Response) -> None:
+    """
+    Close a response from another thread.
+
+    Closing alone does not wake a read already blocked on the socket, so
+    the socket is shut down first when it can be reached.
+    """
+    try:
+        response.raw._fp.fp.raw._sock.shutdown(socket.SHUT_RDWR)
+    except (AttributeError, OSError):
+        pass
+    response.close()
+
+
+def content_length(response: requests.Response):
+    """Declared body size of a response, or None if the server did not send one."""
+    length = response.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else None
+
+
+def bytes_received(response: requests.Response, fallback: int) -> int:
+    """Bytes read off the wire so far, comparable with Content-Length even when gzipped."""
+    try:
+        return response.raw.tell()
+    except AttributeError:
+        return fallback
+
+
+def _get(url: str, headers: dict, timeout: float, cancel: CancelToken = None,
+         progress: ProgressReporter = None, **kwargs) -> requests.Response:
+    """
+    Session GET that a CancelToken can abort and a ProgressReporter can follow.
+
+    With either of them the body is read in chunks. Cancelling closes the
+    response, which breaks a read blocked on the socket, and every chunk
+    is reported as bytes read against Content-Length. Streamed responses
+    are returned unread; stream_events() does both while they are consumed.
+    Every request first waits its turn on the per-host rate limiter.
+    """
+    session = get_session()
+    get_rate_limiter().acquire(url, cancel)
+    if cancel is None and progress is None:
+        return session.get(url, headers=headers, timeout=timeout, **kwargs)
+    check_cancelled(cancel)
+    stream = kwargs.pop("stream", False)
+    response = session.get(url, headers=headers, timeout=timeout, stream=True, **kwargs)
+    if stream:
+        return response
+    total = content_length(response)
+    chunks = []
+    read = 0
+    try:
+        with cancel.on_cancel(lambda: interrupt_response(response)) if cancel is not None else nullcontext():
+            for chunk in response.iter_content(64 * 1024):
+                check_cancelled(cancel)
+                chunks.append(chunk)
+                read += len(chunk)
+                if progress is not None:
+                    progress.bytes_read(bytes_received(response, read), total)
+    except CancelledError:
+        response.close()
+        raise
+    except Exception:
+        if cancel is not None and cancel.cancelled:
+            raise CancelledError("Scrape cancelled") from None
+        raise
+    response._content = b"".join(chunks)
+    return response
+
+
+def _cached_response(url: str, body: bytes, meta: dict, revalidated: requests.Response) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = meta.get("url", url)
+    response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+    response.headers.update({k: v for k, v in revalidated.headers.items()
+                             if k.lower() not in ("content-length", "content-encoding", "transfer-encoding")})
+    response.encoding = meta.get("encoding")
+    response.request = revalidated.request
+    response.elapsed = revalidated.elapsed
+    response._content = body
+    # Marks the body as read, so iter_content() serves it to streaming readers too
+    response._content_consumed = True
+    response.from_cache = True
+    return response
+
+
+def _cache_meta(response: requests.Response) -> dict:
+    return {
+        "url": response.url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "encoding": response.encoding,
+        "headers": {k: v for k, v in response.headers.items()
+                    if k.lower() in ("content-type", "etag", "last-modified")},
+    }
+
+
+def _cache_when_read(response: requests.Response, cache: DiskLRU, url: str) -> None:
+    """
+    Store a streamed body in the page cache once it has been read to the end.
+
+    A reader that stops early leaves the cache untouched, and so does a
+    body larger than the stream_cache_max_bytes setting.
+    """
+    iter_content = response.iter_content
+    meta = _cache_meta(response)
+    limit = _config["stream_cache_max_bytes"]
+
+    def tee(chunk_size=1, decode_unicode=False):
+        if decode_unicode:
+            yield from iter_content(chunk_size, decode_unicode)
+            return
+        chunks, size = [], 0
+        for chunk in iter_content(chunk_size):
+            if chunks is not None:
+                size += len(chunk)
+                if size > limit:
+                    chunks = None
+                else:
+                    chunks.append(chunk)
+            yield chunk
+        if chunks is not None:
+            cache.put(url, b"".join(chunks), meta)
+
+    response.iter_content = tee
+
+
+def _fetch_with_cache(url: str, headers: dict, timeout: float, cancel: CancelToken = None,
+                      progress: ProgressReporter = None, **kwargs) -> requests.Response:
+    cache = get_response_cache()
+    entry = cache.get(url)
+    request_headers = dict(headers or {})
+    if entry:
+        meta = entry[1]
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = _get(url, request_headers, timeout, cancel, progress, **kwargs)
+    if response.status_code == 304 and entry:
+        logger.debug(f"Not modified, serving {url} from cache")
+        return _cached_response(url, entry[0], entry[1], response)
+
+    if response.status_code == 200 and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+        if kwargs.get("stream"):
+            _cache_when_read(response, cache, url)
+        else:
+            cache.put(url, response.content, _cache_meta(response))
+    elif entry and response.status_code == 200:
+        cache.delete(url)
+    response.from_cache = False
+    return response
+
+
+def fetch(url: str, headers: dict = None, timeout: float = None, cache: bool = True,
+          cancel: CancelToken = None, progress: ProgressReporter = None, **kwargs) -> requests.Response:
+    """
+    GET a page through the shared connection pool.
+
+    Pages that carry an ETag or Last-Modified validator are kept in an
+    on-disk cache; later fetches send a conditional request and a 304
+    answer is served from disk. The response's `from_cache` attribute
+    tells which happened. A streamed page is stored once it has been read
+    to the end, and a cached one streams from memory.
+
+    Args:
+        url (str): URL to fetch
+        headers (dict): Extra headers, merged over the shared defaults
+        timeout (float): Override for the page timeout
+        cache (bool): Use the revalidating page cache
+        cancel (CancelToken): Aborts the download when cancelled
+        progress (ProgressReporter): Receives bytes-read events while the body downloads
+        **kwargs: Passed through to requests.Session.get
+
+    Returns:
+        requests.Response: The response (raise_for_status is left to the caller)
+
+    Raises:
+        CancelledError: If `cancel` fires before the body has been read
+    """
+    if timeout is None:
+        timeout = _config["page_timeout"]
+    if cache and _config["cache_enabled"] and not kwargs.get("params"):
+        return _fetch_with_cache(url, headers, timeout, cancel, progress, **kwargs)
+    return _get(url, headers, timeout, cancel, progress, **kwargs)
+
+
+def fetch_media(url: str, headers: dict = None, timeout: float = None, cancel: CancelToken = None,
+                progress: ProgressReporter = None, **kwargs) -> requests.Response:
+    """
+    GET an image or other binary asset through the shared connection pool.
+
+    Args:
+        url (str): URL to fetch
+        headers (dict): Extra headers, merged over the shared defaults
+        timeout (float): Override for the media timeout
+        cancel (CancelToken): Aborts the download when cancelled
+        progress (ProgressReporter): Receives bytes-read events while the body downloads
+        **kwargs: Passed through to requests.Session.get
+
+    Returns:
+        requests.Response: The response (raise_for_status is left to the caller)
+
+    Raises:
+        CancelledError: If `cancel` fires before the body has been read
+    """
+    if timeout is None:
+        timeout = _config["media_timeout"]
+    return _get(url, headers, timeout, cancel, progress, **kwargs)
+
+
+def close() -> None:
+    """Close the shared session and drop its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,290 @@
+import io
+import os
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional, Tuple
+from PIL import Image
+import logging
+from http_client import fetch_media
+from thumbnail_cache import get_thumbnail, put_thumbnail
+from cancellation import CancelToken
+
+logger = logging.getLogger(__name__)
+
+# Modes ImageTk.PhotoImage can wrap directly; anything else is converted in the worker
+_PHOTO_MODES = ("1", "L", "RGB", "RGBA")
+
+# reducing_gap passed to Image.thumbnail
+REDUCING_GAP = 2.0
+
+
+class DecodedImage(NamedTuple):
+    """Raw pixel buffer produced by a decode worker, ready for Image.frombytes."""
+    mode: str
+    size: Tuple[int, int]
+    data: bytes
+
+
+def resample_filter(size: Tuple[int, int]) -> Image.Resampling:
+    """
+    Pick the resampling filter for a thumbnail of the given size.
+
+    At icon sizes the cheaper filters are indistinguishable from Lanczos.
+
+    Args:
+        size (tuple): Target (width, height)
+
+    Returns:
+        Image.Resampling: Filter to use
+    """
+    longest = max(size)
+    if longest <= 128:
+        return Image.Resampling.BILINEAR
+    if longest <= 256:
+        return Image.Resampling.BICUBIC
+    return Image.Resampling.LANCZOS
+
+
+def thumbnail_image(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """
+    Shrink an opened (not yet loaded) image in place to fit `size`.
+
+    Args:
+        img (Image.Image): Image returned by Image.open
+        size (tuple): Maximum (width, height)
+
+    Returns:
+        Image.Image: The same image, for chaining
+    """
+    img.thumbnail(size, resample_filter(size), reducing_gap=REDUCING_GAP)
+    return img
+
+
+def decode_thumbnail(content: bytes, size: Tuple[int, int]) -> DecodedImage:
+    """
+    Decode an encoded image and shrink it to fit `size`.
+
+    Runs inside a decode worker process, so it only deals in picklable
+    values: encoded bytes in, a raw pixel buffer out.
+
+    Args:
+        content (bytes): Encoded image (PNG, JPEG, WebP, GIF, ...)
+        size (tuple): Maximum (width, height) of the thumbnail
+
+    Returns:
+        DecodedImage: Mode, size and raw pixels of the thumbnail
+    """
+    img = thumbnail_image(Image.open(io.BytesIO(content)), size)
+    if img.mode not in _PHOTO_MODES:
+        has_alpha = "A" in img.getbands() or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+    return DecodedImage(img.mode, img.size, img.tobytes())
+
+
+def to_image(decoded: DecodedImage) -> Image.Image:
+    """
+    Wrap a decoded buffer as a PIL image without decoding again.
+
+    Args:
+        decoded (DecodedImage): Result of decode_thumbnail
+
+    Returns:
+        Image.Image: Image ready for ImageTk.PhotoImage
+    """
+    return Image.frombytes(decoded.mode, decoded.size, decoded.data)
+
+
+def encode_thumbnail(decoded: DecodedImage) -> bytes:
+    """
+    Encode a decoded thumbnail as PNG for the on-disk thumbnail store.
+
+    Args:
+        decoded (DecodedImage): Thumbnail pixels
+
+    Returns:
+        bytes: PNG data
+    """
+    buffer = io.BytesIO()
+    to_image(decoded).save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def cached_thumbnail(url: str, size: Tuple[int, int]) -> Optional[DecodedImage]:
+    """
+    Load a thumbnail from the on-disk store without touching the network.
+
+    Cached thumbnails are small, so they are decoded in the calling thread.
+
+    Args:
+        url (str): Image URL
+        size (tuple): Maximum (width, height) of the thumbnail
+
+    Returns:
+        DecodedImage: The stored thumbnail, or None on a miss
+    """
+    encoded = get_thumbnail(url, size)
+    if encoded is None:
+        return None
+    try:
+        img = Image.open(io.BytesIO(encoded))
+        img.load()
+    except Exception as e:
+        logger.warning(f"Dropping unreadable cached thumbnail for {url}: {e}")
+        return None
+    return DecodedImage(img.mode, img.size, img.tobytes())
+
+
+_config = {
+    "workers": max(1, min(4, (os.cpu_count() or 2) - 1)),
+}
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure_decode_pool(workers: int) -> None:
+    """
+    Change the number of decode worker processes.
+
+    Args:
+        workers (int): Number of worker processes
+    """
+    _config["workers"] = workers
+    shutdown_decode_pool()
+
+
+def get_decode_pool() -> ProcessPoolExecutor:
+    """
+    Return the process-wide decode pool, creating it on first use.
+
+    Workers are spawned rather than forked, since the GUI process already
+    runs Tk and a number of threads when the first image is decoded. A
+    spawned worker imports the GUI's main script as __mp_main__, so the
+    front ends start their window behind an `if __name__ == "__main__"`
+    guard; the decode call itself lives in this module.
+
+    Returns:
+        ProcessPoolExecutor: The shared pool
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=_config["workers"],
+                                            mp_context=multiprocessing.get_context("spawn"))
+                logger.debug(f"Started image decode pool ({_config['workers']} workers)")
+    return _pool
+
+
+def submit_thumbnail(content: bytes, size: Tuple[int, int]) -> Future:
+    """
+    Queue a decode on the worker pool.
+
+    If the pool cannot be used (e.g. a worker died) the decode runs in the
+    calling thread instead, so callers always get a usable future.
+
+    Args:
+        content (bytes): Encoded image
+        size (tuple): Maximum (width, height) of the thumbnail
+
+    Returns:
+        Future: Resolves to a DecodedImage
+    """
+    try:
+        return get_decode_pool().submit(decode_thumbnail, content, size)
+    except (BrokenProcessPool, RuntimeError, OSError) as e:
+        logger.warning(f"Decode pool unavailable, decoding in-thread: {e}")
+        shutdown_decode_pool()
+        future = Future()
+        try:
+            future.set_result(decode_thumbnail(content, size))
+        except Exception as decode_error:
+            future.set_exception(decode_error)
+        return future
+
+
+def decode_in_pool(content: bytes, size: Tuple[int, int]) -> DecodedImage:
+    """
+    Decode on the worker pool and wait for the result.
+
+    Blocks, so call it from a worker thread rather than the Tk thread.
+
+    Args:
+        content (bytes): Encoded image
+        size (tuple): Maximum (width, height) of the thumbnail
+
+    Returns:
+        DecodedImage: Mode, size and raw pixels of the thumbnail
+    """
+    try:
+        return submit_thumbnail(content, size).result()
+    except BrokenProcessPool as e:
+        logger.warning(f"Decode worker died, decoding in-thread: {e}")
+        shutdown_decode_pool()
+        return decode_thumbnail(content, size)
+
+
+def thumbnail_for(url: str, content: bytes, size: Tuple[int, int]) -> DecodedImage:
+    """
+    Return the thumbnail of already downloaded image bytes.
+
+    The on-disk store is checked first; a miss is decoded on the worker
+    pool and stored for next time.
+
+    Args:
+        url (str): Image URL, used as the store key
+        content (bytes): Encoded image
+        size (tuple): Maximum (width, height) of the thumbnail
+
+    Returns:
+        DecodedImage: Mode, size and raw pixels of the thumbnail
+    """
+    decoded = cached_thumbnail(url, size)
+    if decoded is None:
+        decoded = decode_in_pool(content, size)
+        put_thumbnail(url, size, encode_thumbnail(decoded))
+    return decoded
+
+
+def fetch_thumbnail(url: str, size: Tuple[int, int], headers: dict = None,
+                    cancel: CancelToken = None) -> Tuple[Optional[bytes], DecodedImage]:
+    """
+    Return the thumbnail of an image, downloading it only when needed.
+
+    A thumbnail already in the on-disk store is returned without any
+    request; otherwise the image is downloaded, decoded on the worker pool
+    and stored. Blocks, so call it from a worker thread rather than the Tk
+    thread.
+
+    Args:
+        url (str): Image URL
+        size (tuple): Maximum (width, height) of the thumbnail
+        headers (dict): HTTP headers for the request
+        cancel (CancelToken): Aborts the download when cancelled
+
+    Returns:
+        tuple: (encoded bytes, or None when served from the store, DecodedImage)
+    """
+    decoded = cached_thumbnail(url, size)
+    if decoded is not None:
+        return None, decoded
+    response = fetch_media(url, headers=headers, cancel=cancel)
+    response.raise_for_status()
+    decoded = decode_in_pool(response.content, size)
+    put_thumbnail(url, size, encode_thumbnail(decoded))
+    return response.content, decoded
+
+
+def shutdown_decode_pool() -> None:
+    """Stop the decode workers; registered to run at interpreter exit."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_decode_pool)
@@ -0,0 +1,112 @@
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional
+import logging
+from disk_cache import DiskLRU
+from http_client import fetch_media
+
+logger = logging.getLogger(__name__)
+
+
+class ImageStore:
+    """
+    Byte-budgeted store for the original bytes of scraped images.
+
+    The most recently used images stay in memory. Older ones are spilled
+    to a temporary directory, which has its own budget, and images evicted
+    from there are downloaded again on the next `get()`. Memory use stays
+    bounded however large the gallery is.
+    """
+
+    def __init__(self, memory_max_bytes: int = 128 * 1024 * 1024, spill_max_bytes: int = 1024 * 1024 * 1024):
+        self.memory_max_bytes = memory_max_bytes
+        self.spill_max_bytes = spill_max_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._spill = None
+        self._cleanup = None
+
+    def _spill_store(self) -> Optional[DiskLRU]:
+        if self._spill is None and self.spill_max_bytes:
+            spill_dir = tempfile.mkdtemp(prefix="scraper-images-")
+            self._spill = DiskLRU(spill_dir, self.spill_max_bytes)
+            # The directory is removed on clear(), garbage collection or interpreter exit
+            self._cleanup = weakref.finalize(self, shutil.rmtree, spill_dir, ignore_errors=True)
+        return self._spill
+
+    def put(self, url: str, data: bytes) -> None:
+        """
+        Store the bytes of an image, spilling least-recently-used ones to disk.
+
+        Args:
+            url (str): Image URL
+            data (bytes): Original image bytes
+        """
+        evicted = []
+        with self._lock:
+            self._memory_bytes -= len(self._memory.pop(url, b""))
+            if len(data) > self.memory_max_bytes:
+                evicted.append((url, data))
+            else:
+                self._memory[url] = data
+                self._memory_bytes += len(data)
+            while self._memory_bytes > self.memory_max_bytes:
+                old_url, old_data = self._memory.popitem(last=False)
+                self._memory_bytes -= len(old_data)
+                evicted.append((old_url, old_data))
+            spill = self._spill_store() if evicted else None
+        if spill is not None:
+            for old_url, old_data in evicted:
+                spill.put(old_url, old_data)
+
+    def get(self, url: str, headers: dict = None, fetch: bool = True) -> Optional[bytes]:
+        """
+        Return the bytes of an image from memory, the spill directory or the network.
+
+        Args:
+            url (str): Image URL
+            headers (dict): HTTP headers used if the image has to be downloaded again
+            fetch (bool): Download the image when it is not stored
+
+        Returns:
+            bytes: Original image bytes, or None if unavailable
+        """
+        with self._lock:
+            data = self._memory.get(url)
+            if data is not None:
+                self._memory.move_to_end(url)
+                return data
+            spill = self._spill
+        entry = spill.get(url) if spill is not None else None
+        if entry:
+            data = entry[0]
+        elif fetch:
+            try:
+                response = fetch_media(url, headers=headers)
+                response.raise_for_status()
+                data = response.content
+            except Exception as e:
+                logger.error(f"Failed to fetch image {url}: {e}")
+                return None
+        else:
+            return None
+        self.put(url, data)
+        return data
+
+    @property
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return self._memory_bytes
+
+    def clear(self) -> None:
+        """Drop every stored image and remove the spill directory."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            cleanup, self._cleanup, self._spill = self._cleanup, None, None
+        if cleanup is not None:
+            cleanup()
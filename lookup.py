@@ -0,0 +1,129 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+from cancellation import CancelToken, CancelledError
+
+logger = logging.getLogger(__name__)
+
+# Search results whose details are loaded ahead of the user flipping to them
+PREFETCH_CANDIDATES = 5
+
+# Detail pages and covers get separate pools, so queued covers never hold up
+# the detail pages that are shown first
+_config = {
+    "detail_workers": 8,
+    "cover_workers": 4,
+}
+
+_pools: Dict[str, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(name: str) -> ThreadPoolExecutor:
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = ThreadPoolExecutor(max_workers=_config[f"{name}_workers"],
+                                              thread_name_prefix=f"lookup-{name}")
+        return _pools[name]
+
+
+def prefetch_cover(url: str, size: Optional[Tuple[int, int]], cancel: CancelToken = None) -> Optional[Future]:
+    """
+    Start downloading a cover into the thumbnail store.
+
+    Once the returned future is done, the GUI loads the same URL and size
+    with fetch_thumbnail, which then returns from the store without a
+    request.
+
+    Args:
+        url (str): Cover image URL, or "N/A"
+        size (tuple): Thumbnail size the cover is shown at; None skips the prefetch
+        cancel (CancelToken): Aborts the download when cancelled
+
+    Returns:
+        Future: The running prefetch, or None if there was nothing to fetch
+    """
+    if size is None or not url or url == "N/A":
+        return None
+
+    def work():
+        # PIL is only needed once a cover is fetched, so headless lookups never import it
+        from image_pipeline import fetch_thumbnail
+        try:
+            fetch_thumbnail(url, size, cancel=cancel)
+        except CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not prefetch cover {url}: {e}")
+
+    return _get_pool("cover").submit(work)
+
+
+class Candidates:
+    """
+    Search results of one lookup, each loading its details in the background.
+
+    Candidate 0 is what a plain scrape returns; the others are prefetched
+    at the same time so flipping to them does not wait on the network.
+    A candidate's details are available as soon as its page is parsed;
+    its cover keeps loading behind them (see cover()).
+    """
+
+    def __init__(self, futures: List[Future]):
+        self._futures = list(futures)
+
+    @classmethod
+    def of(cls, result: dict) -> "Candidates":
+        """A lookup with a single, already known result (e.g. an error)."""
+        future = Future()
+        future.set_result((result, None))
+        return cls([future])
+
+    @classmethod
+    def load(cls, items: List[dict], loader: Callable[[dict], Tuple[dict, Optional[Future]]]) -> "Candidates":
+        """
+        Load the details of every search result concurrently.
+
+        Args:
+            items (list): Parsed search results, best match first
+            loader (callable): Turns one search result into its details dict
+                and the prefetch_cover future of its cover (or None)
+
+        Returns:
+            Candidates: One pending result per item
+        """
+        pool = _get_pool("detail")
+        return cls([pool.submit(loader, item) for item in items])
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def done(self, index: int) -> bool:
+        return self._futures[index].done()
+
+    def get(self, index: int) -> dict:
+        """
+        Wait for a candidate's details.
+
+        Raises:
+            CancelledError: If the lookup was cancelled before they loaded
+        """
+        return self._futures[index].result()[0]
+
+    def cover(self, index: int) -> Optional[Future]:
+        """
+        Cover prefetch of a candidate, once its details have loaded.
+
+        Returns:
+            Future: Done when the cover is in the thumbnail store, or None if
+                the details are still loading or there is no cover
+        """
+        future = self._futures[index]
+        if not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()[1]
+
+    def add_done_callback(self, index: int, callback: Callable[[int], None]) -> None:
+        """Call `callback(index)` once the candidate has loaded, possibly on a worker thread."""
+        self._futures[index].add_done_callback(lambda _: callback(index))
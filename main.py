@@ -1,27 +1,37 @@
 import customtkinter as ctk
-import requests
+from tkinter import filedialog, ttk
+from http_client import fetch
 from bs4 import BeautifulSoup
 import os
 import zipfile
-import io
 from urllib.parse import urljoin
 import re
-from PIL import Image, ImageTk
+from PIL import ImageTk
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Tuple, Dict
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple, Dict
+from bisect import bisect_right
 import logging
 import json
 import csv
 import pyperclip
 from CTkToolTip import CTkToolTip
+from image_pipeline import DecodedImage, fetch_thumbnail, thumbnail_for, to_image
+from image_store import ImageStore
+from cancellation import CancelToken, CancelledError, check_cancelled
+from progress import PROGRESS_FRAME_MS, ProgressReporter
+from ui_queue import UIDispatcher
+from sessions import CANCELLED, DONE, FAILED, ScrapeSession, SessionScheduler
+from batch import read_targets
+from bulk_lookup import TABLE_FIELDS, bulk_header, bulk_rows, export_bulk, lookup_titles
 
 # Import scraping modules
 from scrape_images import scrape_images
 from scrape_text import scrape_text
 from scrape_tables import scrape_tables
-from scrape_movies import scrape_movie_details
-from scrape_books import scrape_book_details
+from scrape_movies import lookup_movies
+from scrape_books import lookup_books
 from scrape_videos import scrape_videos
 from scrape_ebay import scrape_ebay_product
 from scrape_news import scrape_news_headlines
@@ -30,26 +40,79 @@ from scrape_pdfs import scrape_pdf_links
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Characters inserted per Text.insert call and time spent per after() slice when filling the textbox
+TEXT_RENDER_CHUNK = 64 * 1024
+TEXT_RENDER_SLICE = 0.015
+
+# Scrapes running at once; further ones queue on the shared pool
+MAX_CONCURRENT_SCRAPES = 4
+# Finished sessions beyond this many are closed, oldest first
+MAX_SESSIONS = 8
+
+# Size of movie posters and book covers; lookups prefetch them into the thumbnail store at this size
+COVER_SIZE = (400, 600)
+
+# Data types that look up a file of titles, and the lookup kind each runs
+BULK_LOOKUPS = {"Book List": "book", "Movie List": "movie"}
+# Table rows inserted per UI frame while a title list is displayed
+BULK_ROWS_PER_FRAME = 500
+
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("green")
 
+def _session_field(name: str) -> property:
+    """Result attribute of WebScraperApp that reads and writes the active session."""
+    return property(lambda self: getattr(self.session, name),
+                    lambda self, value: setattr(self.session, name, value))
+
+
 class WebScraperApp:
+    # The views read and filter these; each tab's session holds its own
+    all_image_urls = _session_field("all_image_urls")
+    text_content = _session_field("text_content")
+    table_data = _session_field("table_data")
+    movie_details = _session_field("movie_details")
+    book_details = _session_field("book_details")
+    video_urls = _session_field("video_urls")
+    ebay_products = _session_field("ebay_products")
+    news_headlines = _session_field("news_headlines")
+    pdf_links = _session_field("pdf_links")
+    bulk_results = _session_field("bulk_results")
+    # Original image bytes for export and preview; bounded, spills to disk and re-fetches
+    image_data = _session_field("image_data")
+
     def __init__(self, root: ctk.CTk):
         self.root = root
         self.root.title("Web Scraper")
         self.root.geometry("1200x800")
         
-        self.image_data: Dict[str, bytes] = {}
         self.gallery_images: List[Tuple[ImageTk.PhotoImage, str, Tuple[int, int]]] = []
-        self.all_image_urls: List[str] = []
-        self.text_content: str = ""
-        self.table_data: List[List[List[str]]] = []
-        self.movie_details: Dict = {}
-        self.book_details: Dict = {}
-        self.video_urls: Tuple[str, ...] = ()
-        self.ebay_products: List[Dict] = []
-        self.news_headlines: Tuple[str, ...] = ()
-        self.pdf_links: List[Dict] = []
+        # Bumped whenever the gallery is rebuilt so late downloads of an older list are dropped
+        self.gallery_generation = 0
+        self.gallery_loading = False
+        self.gallery_layout: Dict = {}
+        # Only tiles near the viewport have widgets; hidden ones are kept for reuse
+        self.gallery_tiles: Dict[int, Tuple[ctk.CTkLabel, int]] = {}
+        self.free_gallery_tiles: List[Tuple[ctk.CTkLabel, int]] = []
+        self.gallery_render_pending = None
+        self.gallery_resize_pending = None
+        # Bumped on every view change so covers and thumbnails for a previous view are not shown
+        self.display_generation = 0
+        self.ebay_rows_rendered = 0
+        # Bottom of the visible part of the eBay list, as a fraction of its height
+        self.ebay_view_end = 1.0
+        self.ebay_scroll_watched = False
+        self.ebay_render_pending = None
+        self.bulk_table = None
+        self.bulk_kind = "book"
+        # Input positions of the rows in bulk_table, kept sorted so streamed rows land in input order
+        self.bulk_table_indices: List[int] = []
+        self.media_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="media")
+        # One session per tab; an empty one is shown until the first scrape
+        self.sessions: List[ScrapeSession] = []
+        self.session = ScrapeSession("", "Images")
+        self.session_tabs: Dict[str, ScrapeSession] = {}
+        self.scheduler = SessionScheduler(max_workers=MAX_CONCURRENT_SCRAPES)
         
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124 Safari/537.36'
@@ -58,13 +121,16 @@ class WebScraperApp:
         self.image_formats = ["all", "png", "jpg"]
         self.video_formats = ["all", "mp4", "avi", "mkv", "mov", "webm"]
         
-        self.scraping_thread = None
-        self.cancel_event = threading.Event()
-        self.progress_value = 0
+        self.gallery_cancel = CancelToken()
+        self.progress_polling = False
+        # Worker threads post widget updates here instead of touching Tk directly
+        self.ui = UIDispatcher(self.root)
+        self.ui.start()
         
         self.ebay_scrollable_frame_visible = False
         
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.after(100, self.update_content)
 
     def setup_ui(self):
@@ -89,7 +155,7 @@ class WebScraperApp:
         CTkToolTip(self.data_type_label, message="Choose what to scrape")
         self.data_type_var = ctk.StringVar(value="Images")
         self.data_type_dropdown = ctk.CTkOptionMenu(master=self.data_type_frame, 
-                                                  values=["Images", "Text", "Tables", "Movie Details", "Book Details", "Videos", "eBay Products", "News Headlines", "PDF Links"], 
+                                                  values=["Images", "Text", "Tables", "Movie Details", "Book Details", "Movie List", "Book List", "Videos", "eBay Products", "News Headlines", "PDF Links"], 
                                                   variable=self.data_type_var, 
                                                   command=self.update_content)
         self.data_type_dropdown.pack(side="left", padx=5)
@@ -103,6 +169,16 @@ class WebScraperApp:
         self.cancel_button.pack(side="left", padx=5)
         CTkToolTip(self.cancel_button, message="Cancel ongoing scrape")
 
+        # Packed above the loading label once the first session exists
+        self.session_frame = ctk.CTkFrame(master=self.main_frame)
+        self.session_tabs_button = ctk.CTkSegmentedButton(master=self.session_frame, values=[], command=self.switch_session)
+        self.session_tabs_button.pack(side="left", padx=5)
+        CTkToolTip(self.session_tabs_button, message="Switch between scrapes")
+        self.close_session_button = ctk.CTkButton(master=self.session_frame, text="Close Tab", command=self.close_session,
+                                                  fg_color="#6b7280", hover_color="#4b5563", width=90)
+        self.close_session_button.pack(side="left", padx=5)
+        CTkToolTip(self.close_session_button, message="Cancel this scrape and discard its results")
+
         self.loading_label = ctk.CTkLabel(master=self.main_frame, text="", font=("Helvetica", 14))
         self.loading_label.pack(pady=5)
         
@@ -123,12 +199,13 @@ class WebScraperApp:
 
         self.canvas = ctk.CTkCanvas(self.content_frame, bg="#ffffff")
         self.scrollbar = ctk.CTkScrollbar(self.content_frame, orientation="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self.on_canvas_scroll)
         
         self.image_label = ctk.CTkLabel(self.content_frame, text="", width=200, height=300)
         self.text_box = ctk.CTkTextbox(self.content_frame, width=900, height=400, state="disabled")
         
         self.ebay_scrollable_frame = ctk.CTkScrollableFrame(self.content_frame, width=1100)
+        self.ebay_scroll_watched = self.watch_ebay_scroll()
         self.ebay_scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
         self.ebay_scrollable_frame_visible = True
         self.ebay_scrollable_frame.pack_forget()
@@ -206,10 +283,27 @@ class WebScraperApp:
 
         self.canvas.bind("<Configure>", self.on_canvas_resize)
 
-    def update_status(self, message, color="black"):
+    def update_status(self, message, color="black", session: ScrapeSession = None):
+        # Safe from any thread; a burst of status updates is applied once, with the latest message.
+        # Updates about a session only replace pending ones about the same session.
+        key = "status" if session is None else f"status-{session.id}"
+        self.ui.post(self.apply_status, message, color, key=key)
+
+    def apply_status(self, message, color="black"):
         self.status_label.configure(text=message, text_color=color)
         self.status_detail.configure(text=f"Last operation: {self.result_label.cget('text')}")
 
+    def set_result(self, text: str, color: str = None, session: ScrapeSession = None) -> None:
+        """Post a result_label update from a worker thread; dropped if `session` is no longer shown."""
+        key = "result" if session is None else f"result-{session.id}"
+        self.ui.post(self.apply_result, text, color, session, key=key)
+
+    def apply_result(self, text: str, color: str = None, session: ScrapeSession = None) -> None:
+        if session is not None and session is not self.session:
+            return
+        options = {"text": text} if color is None else {"text": text, "text_color": color}
+        self.result_label.configure(**options)
+
     def update_export_format(self, *args):
         data_type = self.data_type_var.get()
         if data_type == "Images":
@@ -223,6 +317,7 @@ class WebScraperApp:
     def ensure_ebay_scrollable_frame(self):
         if not hasattr(self, 'ebay_scrollable_frame') or not self.ebay_scrollable_frame.winfo_exists():
             self.ebay_scrollable_frame = ctk.CTkScrollableFrame(self.content_frame, width=1100)
+            self.ebay_scroll_watched = self.watch_ebay_scroll()
             self.ebay_scrollable_frame_visible = False
         if not self.ebay_scrollable_frame_visible:
             self.ebay_scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -230,6 +325,7 @@ class WebScraperApp:
 
     def update_content(self, data_type=None) -> None:
         data_type = data_type or self.data_type_var.get()
+        self.display_generation += 1
         
         for widget in self.content_frame.winfo_children():
             if widget not in (self.text_box, self.image_label, self.canvas, self.scrollbar, self.ebay_scrollable_frame):
@@ -255,6 +351,8 @@ class WebScraperApp:
             self.update_movie_display()
         elif data_type == "Book Details":
             self.update_book_display()
+        elif data_type in BULK_LOOKUPS:
+            self.update_bulk_display(data_type)
         elif data_type == "Videos":
             self.update_video_display()
         elif data_type == "eBay Products":
@@ -267,6 +365,8 @@ class WebScraperApp:
 
     def scrape_data(self) -> None:
         url = self.url_entry.get().strip()
+        if self.data_type_var.get() in BULK_LOOKUPS:
+            url = self.choose_title_file(url)
         if not url:
             self.result_label.configure(text="Please enter a URL or search term!", text_color="red")
             self.update_status("URL missing", "red")
@@ -275,118 +375,319 @@ class WebScraperApp:
             self.result_label.configure(text="Please enter a valid movie or book name!", text_color="red")
             self.update_status("Invalid movie/book name", "red")
             return
-        if not self.is_valid_url(url) and self.data_type_var.get() not in ["Movie Details", "Book Details", "eBay Products"]:
+        if not self.is_valid_url(url) and self.data_type_var.get() not in ["Movie Details", "Book Details", "eBay Products", *BULK_LOOKUPS]:
             url = "https://" + url if not url.startswith(("http://", "https://")) else url
             if not self.is_valid_url(url):
                 self.result_label.configure(text="Invalid URL format!", text_color="red")
                 self.update_status("Invalid URL", "red")
                 return
         
-        self.show_loading(True)
-        self.progress_bar.pack(pady=5)
-        self.progress_bar.set(0)
-        self.cancel_event.clear()
-        self.scrape_button.configure(state="disabled")
-        self.cancel_button.configure(state="normal")
-        self.update_status("Scraping started")
+        # Everything the worker needs is read from the widgets here, on the Tk thread
+        data_type = self.data_type_var.get()
+        num_items = self.num_items_entry.get().strip()
+        num_tables = self.num_tables_entry.get().strip()
+        options = {
+            "format": self.format_var.get(),
+            # With an item or table limit the page is streamed and parsing stops once enough matched
+            "limit": int(num_items) if num_items.isdigit() and int(num_items) > 0 else None,
+            "max_tables": int(num_tables) if num_tables.isdigit() and int(num_tables) > 0 else None,
+        }
+        if data_type in BULK_LOOKUPS:
+            try:
+                options["titles"] = read_targets(url)
+            except (OSError, UnicodeDecodeError) as e:
+                options["titles"] = []
+                logger.error(f"Could not read titles from {url}: {e}")
+            if not options["titles"]:
+                self.result_label.configure(text="No titles found in that file!", text_color="red")
+                self.update_status("Empty title list", "red")
+                return
         
-        self.scraping_thread = threading.Thread(target=lambda: self.perform_scrape(url), daemon=True)
-        self.scraping_thread.start()
-        self.root.after(100, self.update_progress)
+        # Other tabs keep running; the new scrape gets its own session and tab
+        session = ScrapeSession(url, data_type, options)
+        self.sessions.append(session)
+        self.prune_sessions()
+        self.scheduler.submit(session, self.perform_scrape, self.on_session_finished)
+        self.show_session(session)
+        self.update_status("Scraping started", session=session)
+        self.start_progress()
+
+    def choose_title_file(self, entry: str) -> str:
+        """Title list for a bulk lookup: the path typed in the entry, or one picked in a file dialog."""
+        if entry and os.path.isfile(entry):
+            return entry
+        return filedialog.askopenfilename(title="Choose a list of titles",
+                                          filetypes=[("Title lists", "*.csv *.txt"), ("All files", "*.*")])
+
+    def prune_sessions(self) -> None:
+        finished = [session for session in self.sessions if not session.active]
+        for session in finished[:max(0, len(self.sessions) - MAX_SESSIONS)]:
+            self.sessions.remove(session)
+            session.image_data.clear()
+
+    def refresh_session_tabs(self) -> None:
+        """Rebuild the tab titles, which carry each session's state."""
+        self.session_tabs = {session.title: session for session in self.sessions}
+        if not self.sessions:
+            self.session_frame.pack_forget()
+            return
+        self.session_tabs_button.configure(values=list(self.session_tabs))
+        self.session_tabs_button.set(self.session.title if self.session in self.sessions else "")
+        if not self.session_frame.winfo_ismapped():
+            self.session_frame.pack(pady=5, before=self.loading_label)
+
+    def refresh_controls(self) -> None:
+        busy = self.session.active or self.gallery_loading
+        self.cancel_button.configure(state="normal" if busy else "disabled")
+        self.show_loading(self.session.active)
+
+    def show_session(self, session: ScrapeSession) -> None:
+        """Make `session` the one the views display."""
+        self.session = session
+        # Stop loading the previous tab's gallery; its tiles are rebuilt if the tab is shown again
+        self.gallery_cancel.cancel()
+        self.gallery_generation += 1
+        self.gallery_loading = False
+        self.gallery_images.clear()
+        self.data_type_var.set(session.data_type)
+        self.refresh_session_tabs()
+        self.refresh_controls()
+        if session.active:
+            self.update_content()
+            self.result_label.configure(text=f"Scraping {session.data_type}...", text_color=self.text_color())
+        elif session.state == FAILED:
+            self.update_content()
+            self.result_label.configure(text=f"Failed to scrape: {session.error}", text_color="red")
+        elif session.state == CANCELLED:
+            self.update_content()
+            self.result_label.configure(text="Scraping cancelled!", text_color="orange")
+        else:
+            self.show_scrape_result(session)
+
+    def switch_session(self, title: str) -> None:
+        session = self.session_tabs.get(title)
+        if session is not None and session is not self.session:
+            self.show_session(session)
+
+    def close_session(self) -> None:
+        session = self.session
+        if session not in self.sessions:
+            return
+        self.scheduler.cancel(session)
+        index = self.sessions.index(session)
+        self.sessions.remove(session)
+        session.image_data.clear()
+        if self.sessions:
+            self.show_session(self.sessions[min(index, len(self.sessions) - 1)])
+        else:
+            self.show_session(ScrapeSession("", self.data_type_var.get()))
+            self.result_label.configure(text="")
+
+    def text_color(self) -> str:
+        """Text colour of plain messages in the current appearance mode."""
+        return "black" if ctk.get_appearance_mode() == "Light" else "white"
+
+    def start_progress(self) -> None:
+        """Show the progress bar and start draining progress events every PROGRESS_FRAME_MS."""
+        if not self.progress_bar.winfo_ismapped():
+            self.progress_bar.pack(pady=5, before=self.result_label)
+            self.set_progress_fraction(0)
+        if not self.progress_polling:
+            self.progress_polling = True
+            self.root.after(PROGRESS_FRAME_MS, self.update_progress)
+
+    def set_progress_fraction(self, fraction) -> None:
+        """Show a determinate fraction, or an animated bar while no total is known."""
+        if fraction is None:
+            if self.progress_bar.cget("mode") != "indeterminate":
+                self.progress_bar.configure(mode="indeterminate")
+                self.progress_bar.start()
+            return
+        if self.progress_bar.cget("mode") != "determinate":
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode="determinate")
+        self.progress_bar.set(fraction)
 
     def update_progress(self):
-        if self.scraping_thread and self.scraping_thread.is_alive():
-            self.progress_value = min(self.progress_value + 0.05, 0.95)
-            self.progress_bar.set(self.progress_value)
-            self.update_status(f"Scraping in progress ({int(self.progress_value * 100)}%)")
-            self.root.after(100, self.update_progress)
+        # Workers only queue events; the bar and status are repainted here at a fixed rate
+        for session in {self.session, *self.sessions}:
+            session.progress_state.apply(session.progress.drain())
+        background = sum(1 for session in self.sessions if session.active and session is not self.session)
+        if self.session.active or self.gallery_loading:
+            self.start_progress()
+            self.set_progress_fraction(self.session.progress_state.fraction())
+            if not self.session.cancel.cancelled:
+                status = self.session.progress_state.describe()
+                self.update_status(f"{status} (+{background} in other tabs)" if background else status,
+                                   session=self.session)
+        elif background:
+            self.progress_bar.pack_forget()
+            self.update_status(f"{background} scrape(s) running in other tabs")
         else:
-            self.progress_bar.set(1.0)
-            self.update_status("Scraping completed", "green")
+            self.progress_polling = False
+            self.set_progress_fraction(1.0)
+            if self.session.state == DONE:
+                self.update_status("Scraping completed", "green", session=self.session)
             self.root.after(500, self.hide_progress)
+            return
+        self.root.after(PROGRESS_FRAME_MS, self.update_progress)
 
     def hide_progress(self):
+        if self.progress_polling:
+            return
+        self.set_progress_fraction(0)
         self.progress_bar.pack_forget()
-        self.scrape_button.configure(state="normal")
-        self.cancel_button.configure(state="disabled")
+        self.refresh_controls()
         self.update_status("Ready")
 
+    def on_close(self) -> None:
+        """Cancel every scrape and stop the worker pools, so closing the window ends the process."""
+        for session in {self.session, *self.sessions}:
+            self.scheduler.cancel(session)
+        self.gallery_cancel.cancel()
+        self.scheduler.shutdown()
+        self.media_executor.shutdown(wait=False, cancel_futures=True)
+        self.ui.stop()
+        self.root.destroy()
+
     def cancel_scrape(self):
-        if self.scraping_thread and self.scraping_thread.is_alive():
-            self.cancel_event.set()
+        if self.gallery_loading:
+            # Keep the tiles that already arrived and stop downloading the rest
+            self.gallery_cancel.cancel()
+            self.finish_gallery(self.gallery_generation)
+            self.gallery_generation += 1
+        if self.session.active:
+            # Aborts in-flight requests and quits any Chrome driver the scrape holds; other tabs keep running
+            self.scheduler.cancel(self.session)
             self.result_label.configure(text="Scraping cancelled!", text_color="orange")
-            self.show_loading(False)
-            self.hide_progress()
-            self.update_status("Scraping cancelled", "orange")
+            self.update_status("Scraping cancelled", "orange", session=self.session)
+        self.refresh_session_tabs()
+        self.refresh_controls()
 
     def is_valid_url(self, url: str) -> bool:
         return bool(re.match(r'^https?://[^\s/$.?#].[^\s]*$', url))
 
-    def perform_scrape(self, url: str) -> None:
-        self.image_data.clear()
-        self.gallery_images.clear()
-        self.all_image_urls.clear()
-        self.text_content = ""
-        self.table_data.clear()
-        self.movie_details.clear()
-        self.book_details.clear()
-        self.video_urls = ()
-        self.ebay_products.clear()
-        self.news_headlines = ()
-        self.pdf_links.clear()
+    def perform_scrape(self, session: ScrapeSession) -> None:
+        """Run one session's scrape on a scheduler thread; every widget update goes through self.ui."""
+        url, data_type, options = session.url, session.data_type, session.options
+        cancel, progress = session.cancel, session.progress
+        self.ui.post(self.refresh_session_tabs, key="session-tabs")
+        if data_type == "Images":
+            self.set_result("Scraping images...", session=session)
+            result = scrape_images(url, options["format"], self.headers, options["limit"], cancel=cancel, progress=progress) or []
+        elif data_type == "Text":
+            self.set_result("Scraping text...", session=session)
+            result = scrape_text(url, self.headers, cancel=cancel, progress=progress) or ""
+        elif data_type == "Tables":
+            self.set_result("Scraping tables...", session=session)
+            result = scrape_tables(url, options["max_tables"], cancel=cancel, progress=progress) or []
+        elif data_type == "Movie Details":
+            self.set_result("Scraping movie details...", session=session)
+            session.candidates = lookup_movies(url, cover_size=COVER_SIZE, cancel=cancel, progress=progress)
+            result = session.candidates.get(0) or {"error": "No data found!"}
+        elif data_type == "Book Details":
+            self.set_result("Scraping book details...", session=session)
+            session.candidates = lookup_books(url, cover_size=COVER_SIZE, cancel=cancel, progress=progress)
+            result = session.candidates.get(0) or {"error": "No data found!"}
+        elif data_type in BULK_LOOKUPS:
+            titles = options["titles"]
+            self.set_result(f"Looking up {len(titles)} titles...", session=session)
+            # Rows stream into the session and its table as lookups finish
+            result = session.bulk_results
+            for row in lookup_titles(titles, BULK_LOOKUPS[data_type], cancel=cancel, progress=progress):
+                result.append(row)
+                self.ui.post(self.append_bulk_rows, session, key=f"bulk-rows-{session.id}")
+        elif data_type == "Videos":
+            self.set_result("Scraping videos...", session=session)
+            result = scrape_videos(url, options["format"], self.headers, cancel=cancel, progress=progress) or ()
+        elif data_type == "eBay Products":
+            self.set_result("Scraping eBay products...", session=session)
+            result = scrape_ebay_product(url, cancel=cancel, progress=progress) or []
+        elif data_type == "News Headlines":
+            self.set_result("Scraping news headlines...", session=session)
+            result = scrape_news_headlines(url, cancel=cancel, progress=progress) or ()
+        elif data_type == "PDF Links":
+            self.set_result("Scraping PDF links...", session=session)
+            result = scrape_pdf_links(url, cancel=cancel, progress=progress) or []
+        else:
+            raise ValueError(f"Unknown data type: {data_type}")
+        # A scraper may have swallowed the abort and returned nothing; don't report that as a result
+        check_cancelled(cancel)
+        session.set_result(result)
+
+    def on_session_finished(self, session: ScrapeSession) -> None:
+        if session.state == CANCELLED:
+            logger.info(f"Scrape of {session.url} cancelled")
+        self.ui.post(self.show_scrape_result, session)
+
+    def show_scrape_result(self, session: ScrapeSession) -> None:
+        """Display a finished session if its tab is shown; runs on the Tk thread."""
+        self.refresh_session_tabs()
+        if session is not self.session:
+            if session.state == DONE and session in self.sessions:
+                self.update_status(f"Tab {session.id} finished: {session.data_type}", "green", session=session)
+            return
+        self.refresh_controls()
+        if session.state == CANCELLED:
+            return
+        if session.state == FAILED:
+            self.result_label.configure(text=f"Failed to scrape: {session.error}", text_color="red")
+            self.update_status(f"Scraping failed: {session.error}", "red", session=session)
+        elif not session.has_results():
+            self.result_label.configure(text=f"No {session.data_type.lower()} found!", text_color="red")
+            self.update_status(f"No {session.data_type.lower()} found", "red", session=session)
+        else:
+            self.update_content(session.data_type)
 
-        data_type = self.data_type_var.get()
+    def load_gallery_image(self, img_url: str, cancel: CancelToken = None) -> Tuple[str, bytes, DecodedImage]:
+        """
+        Thumbnail one gallery image, from the thumbnail store or by downloading
+        and decoding it; runs on a worker thread. Content is None on a store hit.
+        """
         try:
-            if data_type == "Images":
-                self.result_label.configure(text="Scraping images...")
-                self.all_image_urls = scrape_images(url, self.format_var.get(), self.headers) or []
-            elif data_type == "Text":
-                self.result_label.configure(text="Scraping text...")
-                self.text_content = scrape_text(url, self.headers) or ""
-            elif data_type == "Tables":
-                self.result_label.configure(text="Scraping tables...")
-                self.table_data = scrape_tables(url) or []
-            elif data_type == "Movie Details":
-                self.result_label.configure(text="Scraping movie details...")
-                self.movie_details = scrape_movie_details(url) or {"error": "No data found!"}
-            elif data_type == "Book Details":
-                self.result_label.configure(text="Scraping book details...")
-                self.book_details = scrape_book_details(url) or {"error": "No data found!"}
-            elif data_type == "Videos":
-                self.result_label.configure(text="Scraping videos...")
-                self.video_urls = scrape_videos(url, self.format_var.get(), self.headers) or ()
-            elif data_type == "eBay Products":
-                self.result_label.configure(text="Scraping eBay products...")
-                self.ebay_products = scrape_ebay_product(url) or []
-            elif data_type == "News Headlines":
-                self.result_label.configure(text="Scraping news headlines...")
-                self.news_headlines = scrape_news_headlines(url) or ()
-            elif data_type == "PDF Links":
-                self.result_label.configure(text="Scraping PDF links...")
-                self.pdf_links = scrape_pdf_links(url) or []
-
-            if not any([self.all_image_urls, self.text_content, self.table_data, self.movie_details.get("name"), 
-                       self.book_details.get("name"), self.video_urls, self.ebay_products, self.news_headlines, self.pdf_links]):
-                self.result_label.configure(text=f"No {data_type.lower()} found!", text_color="red")
-                self.update_status(f"No {data_type.lower()} found", "red")
-            else:
-                self.update_content()
+            content, decoded = fetch_thumbnail(img_url, (400, 400), headers=self.headers, cancel=cancel)
         except Exception as e:
-            self.result_label.configure(text=f"Failed to scrape: {str(e)}", text_color="red")
-            self.update_status(f"Scraping failed: {str(e)}", "red")
-        finally:
-            self.show_loading(False)
+            logger.warning(f"Could not load image {img_url}: {e}")
+            return img_url, None, None
+        return img_url, content, decoded
 
-    def download_image(self, img_url: str) -> Tuple[str, bytes]:
-        try:
-            img_response = requests.get(img_url, headers=self.headers, timeout=5)
-            img_response.raise_for_status()
-            return img_url, img_response.content
-        except Exception:
-            return img_url, None
+    def load_thumbnail_async(self, img_url: str, size: Tuple[int, int], on_ready, after: Future = None) -> None:
+        """
+        Fetch and decode an image off the Tk thread, then call on_ready(photo)
+        on the Tk thread unless the view has changed in the meantime.
+
+        With `after`, a prefetch of the same image, the load starts once the
+        prefetch is done and so finds the image in the thumbnail store.
+        """
+        generation = self.display_generation
+
+        def work():
+            try:
+                _, decoded = fetch_thumbnail(img_url, size, headers=self.headers)
+            except Exception as e:
+                logger.error(f"Failed to load image {img_url}: {str(e)}")
+                return
+            self.ui.post(deliver, decoded)
+
+        def deliver(decoded):
+            if generation == self.display_generation:
+                on_ready(ImageTk.PhotoImage(to_image(decoded)))
+
+        if after is not None and not after.done():
+            after.add_done_callback(lambda _: self.media_executor.submit(work))
+        else:
+            self.media_executor.submit(work)
+
+    def shown_cover_prefetch(self) -> Optional[Future]:
+        """Cover prefetch of the lookup result shown, if it is still running or done."""
+        candidates = self.session.candidates
+        return candidates.cover(self.session.candidate_index) if candidates is not None else None
 
     def update_image_list(self) -> None:
-        self.image_data.clear()
+        self.gallery_generation += 1
+        generation = self.gallery_generation
+        self.gallery_cancel.cancel()
+        cancel = self.gallery_cancel = CancelToken()
         self.gallery_images.clear()
         
         allowed_formats = {
@@ -408,75 +709,200 @@ class WebScraperApp:
         filtered_urls = filtered_urls[:min(num_items, len(filtered_urls))]
         
         if not filtered_urls:
+            self.gallery_loading = False
             self.result_label.configure(text="No images match the updated criteria!", text_color="red")
             self.update_status("No images match criteria", "red")
             self.root.after(0, self.update_gallery)
             return
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            results = list(executor.map(self.download_image, filtered_urls))
-        
-        for img_url, content in results:
-            if content:
-                self.image_data[img_url] = content
-                img = Image.open(io.BytesIO(content))
-                img.thumbnail((400, 400), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.gallery_images.append((photo, img_url, img.size))
-        
+        # Show the empty canvas right away; tiles are added one by one as they are decoded
+        self.gallery_loading = True
         self.root.after(0, self.update_gallery)
+        self.start_progress()
+        progress = self.session.progress
+        progress.stage("Loading images")
+        threading.Thread(target=self.stream_gallery_images, args=(generation, filtered_urls, cancel, progress), daemon=True).start()
+
+    def stream_gallery_images(self, generation: int, image_urls: List[str], cancel: CancelToken,
+                              progress: ProgressReporter) -> None:
+        """Download and decode images in parallel, handing each to the Tk thread as soon as it is ready."""
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(self.load_gallery_image, img_url, cancel) for img_url in image_urls]
+            for fetched, future in enumerate(as_completed(futures), 1):
+                if cancel.cancelled or generation != self.gallery_generation:
+                    for pending in futures:
+                        pending.cancel()
+                    return
+                img_url, content, decoded = future.result()
+                progress.images_fetched(fetched, len(image_urls))
+                if decoded:
+                    self.ui.post(self.add_gallery_image, generation, img_url, content, decoded, len(image_urls))
+        self.ui.post(self.finish_gallery, generation)
+
+    def add_gallery_image(self, generation: int, img_url: str, content: bytes, decoded: DecodedImage, total: int) -> None:
+        if generation != self.gallery_generation:
+            return
+        if content:
+            self.image_data.put(img_url, content)
+        # PhotoImage has to be created on the Tk thread; the pixels are already decoded
+        photo = ImageTk.PhotoImage(to_image(decoded))
+        self.gallery_images.append((photo, img_url, decoded.size))
+        # A full layout per image would make loading a gallery quadratic; resizes still redo it
+        if len(self.gallery_layout.get("positions", ())) == len(self.gallery_images) - 1:
+            self.place_gallery_tile()
+        else:
+            self.layout_gallery()
+        self.schedule_gallery_render()
+        self.result_label.configure(text=f"Loading images... {len(self.gallery_images)}/{total}", text_color=self.text_color())
 
-    def update_gallery(self) -> None:
-        self.text_box.pack_forget()
-        self.image_label.pack_forget()
-        if self.ebay_scrollable_frame_visible and self.ebay_scrollable_frame.winfo_exists():
-            self.ebay_scrollable_frame.pack_forget()
-            self.ebay_scrollable_frame_visible = False
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.scrollbar.pack(side="right", fill="y")
-        
-        self.canvas.delete("all")
+    def finish_gallery(self, generation: int) -> None:
+        if generation != self.gallery_generation:
+            return
+        self.gallery_loading = False
         if not self.gallery_images:
             self.result_label.configure(text="No images match the criteria!", text_color="red")
             self.update_status("No images to display", "red")
             return
-        
+        self.layout_gallery()
+        self.render_visible_tiles()
+        self.result_label.configure(text=f"Found {len(self.gallery_images)} images", text_color=self.text_color())
+        self.update_status(f"Displaying {len(self.gallery_images)} images")
+
+    def layout_gallery(self) -> None:
+        """Compute every tile position for the current canvas width; no widgets are touched."""
         canvas_width = self.canvas.winfo_width() or 1100
         img_width = 400
         spacing = 20
         img_width_with_spacing = img_width + spacing
-        
         num_columns = max(1, canvas_width // img_width_with_spacing)
         num_images = len(self.gallery_images)
-        num_rows = (num_images + num_columns - 1) // num_columns
         
+        positions = []
+        row_tops = []
         y = 20
-        max_row_height = 0
-        for row in range(num_rows):
-            start_idx = row * num_columns
-            end_idx = min(start_idx + num_columns, num_images)
-            images_in_row = end_idx - start_idx
-            
+        row_height = 0
+        for start_idx in range(0, num_images, num_columns):
+            row = self.gallery_images[start_idx:start_idx + num_columns]
+            # While loading, the last row is laid out as if full so its tiles do not shift as it fills
+            images_in_row = num_columns if self.gallery_loading else len(row)
             row_width = images_in_row * img_width_with_spacing - spacing
             start_x = (canvas_width - row_width) // 2
-            
-            x = start_x
-            row_height = 0
-            for i in range(start_idx, end_idx):
-                photo, img_url, original_size = self.gallery_images[i]
-                img_label = ctk.CTkLabel(self.canvas, image=photo, text="", cursor="hand2")
-                img_label.image = photo
-                img_label.bind("<Button-1>", lambda e, url=img_url: self.show_image_in_popup(url))
-                self.canvas.create_window(x, y, anchor="nw", window=img_label)
-                x += img_width_with_spacing
-                row_height = max(row_height, original_size[1])
-            
+            row_tops.append(y)
+            positions.extend((start_x + column * img_width_with_spacing, y) for column in range(len(row)))
+            row_height = max(original_size[1] for _, _, original_size in row)
             y += max(220, row_height + 20)
-            max_row_height = max(max_row_height, row_height)
         
-        canvas_height = y
-        self.canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
-        self.result_label.configure(text=f"Found {len(self.gallery_images)} images", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")
+        self.gallery_layout = {
+            "canvas_width": canvas_width,
+            "columns": num_columns,
+            "positions": positions,
+            "row_tops": row_tops,
+            # What place_gallery_tile needs to append a tile to a full-width last row
+            "start_x": (canvas_width - (num_columns * img_width_with_spacing - spacing)) // 2,
+            "step": img_width_with_spacing,
+            "row_height": row_height,
+            "height": y,
+        }
+        self.canvas.configure(scrollregion=(0, 0, canvas_width, y))
+
+    def place_gallery_tile(self) -> None:
+        """
+        Add the position of the last gallery image to the current layout.
+
+        Only valid while loading, when every row is laid out as if full; a
+        tile then never moves the tiles before it, so placing it is O(1).
+        """
+        layout = self.gallery_layout
+        index = len(layout["positions"])
+        column = index % layout["columns"]
+        if column == 0:
+            layout["row_tops"].append(layout["height"])
+            layout["row_height"] = 0
+        top = layout["row_tops"][-1]
+        layout["row_height"] = max(layout["row_height"], self.gallery_images[index][2][1])
+        layout["positions"].append((layout["start_x"] + column * layout["step"], top))
+        layout["height"] = top + max(220, layout["row_height"] + 20)
+        self.canvas.configure(scrollregion=(0, 0, layout["canvas_width"], layout["height"]))
+
+    def create_gallery_tile(self) -> Tuple[ctk.CTkLabel, int]:
+        img_label = ctk.CTkLabel(self.canvas, text="", cursor="hand2")
+        img_label.gallery_url = None
+        img_label.bind("<Button-1>", lambda e, label=img_label: self.show_image_in_popup(label.gallery_url))
+        return img_label, self.canvas.create_window(0, 0, anchor="nw", window=img_label)
+
+    def release_gallery_tiles(self) -> None:
+        for img_label, item in self.gallery_tiles.values():
+            self.canvas.itemconfigure(item, state="hidden")
+            self.free_gallery_tiles.append((img_label, item))
+        self.gallery_tiles.clear()
+
+    def render_visible_tiles(self) -> None:
+        """Give widgets to the tiles within a screen of the viewport and recycle the rest."""
+        self.gallery_render_pending = None
+        layout = self.gallery_layout
+        positions = layout.get("positions", [])
+        if not positions:
+            self.release_gallery_tiles()
+            return
+        
+        view_top = self.canvas.canvasy(0)
+        view_height = self.canvas.winfo_height() or 800
+        row_tops = layout["row_tops"]
+        first_row = max(0, bisect_right(row_tops, view_top - view_height) - 1)
+        last_row = bisect_right(row_tops, view_top + 2 * view_height)
+        visible = range(first_row * layout["columns"], min(len(positions), last_row * layout["columns"]))
+        
+        for index in [i for i in self.gallery_tiles if i not in visible]:
+            img_label, item = self.gallery_tiles.pop(index)
+            self.canvas.itemconfigure(item, state="hidden")
+            self.free_gallery_tiles.append((img_label, item))
+        
+        for index in visible:
+            tile = self.gallery_tiles.get(index)
+            if tile is None:
+                tile = self.free_gallery_tiles.pop() if self.free_gallery_tiles else self.create_gallery_tile()
+                img_label, item = tile
+                photo, img_url, _ = self.gallery_images[index]
+                img_label.configure(image=photo)
+                img_label.image = photo
+                img_label.gallery_url = img_url
+                self.canvas.itemconfigure(item, state="normal")
+                self.gallery_tiles[index] = tile
+            self.canvas.coords(tile[1], *positions[index])
+
+    def schedule_gallery_render(self) -> None:
+        if self.gallery_render_pending is None:
+            self.gallery_render_pending = self.root.after_idle(self.render_visible_tiles)
+
+    def on_canvas_scroll(self, first, last) -> None:
+        self.scrollbar.set(first, last)
+        self.schedule_gallery_render()
+
+    def update_gallery(self) -> None:
+        self.text_box.pack_forget()
+        self.image_label.pack_forget()
+        if self.ebay_scrollable_frame_visible and self.ebay_scrollable_frame.winfo_exists():
+            self.ebay_scrollable_frame.pack_forget()
+            self.ebay_scrollable_frame_visible = False
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.release_gallery_tiles()
+        self.layout_gallery()
+        if not self.gallery_images:
+            if self.gallery_loading:
+                self.result_label.configure(text="Loading images...", text_color=self.text_color())
+                self.update_status("Loading images")
+            else:
+                self.result_label.configure(text="No images match the criteria!", text_color="red")
+                self.update_status("No images to display", "red")
+            return
+        
+        self.canvas.yview_moveto(0)
+        self.render_visible_tiles()
+        if self.gallery_loading:
+            return
+        self.result_label.configure(text=f"Found {len(self.gallery_images)} images", text_color=self.text_color())
         self.update_status(f"Displaying {len(self.gallery_images)} images")
 
     def update_text_display(self) -> None:
@@ -486,12 +912,56 @@ class WebScraperApp:
             self.ebay_scrollable_frame_visible = False
         self.text_box.pack(fill="both", expand=True)
         
+        text = self.text_content
+        num_lines = text.count("\n") + 1 if text else 0
+        num_bytes = len(text.encode("utf-8"))
+        self.result_label.configure(text=f"Text scraped ({len(text)} characters, {num_lines} lines, {num_bytes} bytes)", text_color=self.text_color())
+        chunk = TEXT_RENDER_CHUNK
+        self.render_text_chunked((text[i:i + chunk] for i in range(0, len(text), chunk)),
+                                 f"Text displayed ({len(text)} characters)")
+
+    def render_text_chunked(self, pieces, done_message: str) -> None:
+        """
+        Fill text_box from an iterator of strings in short after() slices, so the
+        window stays responsive and can be scrolled while a large result loads.
+        """
+        generation = self.display_generation
+        pieces = iter(pieces)
         self.text_box.configure(state="normal")
         self.text_box.delete("1.0", "end")
-        self.text_box.insert("1.0", self.text_content)
         self.text_box.configure(state="disabled")
-        self.result_label.configure(text=f"Text scraped ({len(self.text_content)} characters)", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")
-        self.update_status(f"Text displayed ({len(self.text_content)} characters)")
+        inserted = 0
+
+        def step():
+            nonlocal inserted
+            if generation != self.display_generation:
+                return
+            deadline = time.perf_counter() + TEXT_RENDER_SLICE
+            finished = False
+            self.text_box.configure(state="normal")
+            while time.perf_counter() < deadline:
+                batch = []
+                size = 0
+                for piece in pieces:
+                    batch.append(piece)
+                    size += len(piece)
+                    if size >= TEXT_RENDER_CHUNK:
+                        break
+                else:
+                    finished = True
+                if batch:
+                    self.text_box.insert("end", "".join(batch))
+                    inserted += size
+                if finished:
+                    break
+            self.text_box.configure(state="disabled")
+            if finished:
+                self.update_status(done_message)
+            else:
+                self.update_status(f"Rendering... ({inserted} characters so far)")
+                self.root.after(1, step)
+
+        step()
 
     def update_table_display(self) -> None:
         self.image_label.pack_forget()
@@ -512,15 +982,16 @@ class WebScraperApp:
         num_tables = int(num_tables) if num_tables.isdigit() and int(num_tables) > 0 else len(self.table_data)
         filtered_tables = self.table_data[:min(num_tables, len(self.table_data))]
         
-        for table_idx, table in enumerate(filtered_tables, 1):
-            self.text_box.insert("end", f"Table #{table_idx}:\n")
-            for row in table:
-                self.text_box.insert("end", "\t".join(row) + "\n")
-            self.text_box.insert("end", "\n")
+        def table_lines():
+            for table_idx, table in enumerate(filtered_tables, 1):
+                yield f"Table #{table_idx}:\n"
+                for row in table:
+                    yield "\t".join(row) + "\n"
+                yield "\n"
         
         self.text_box.configure(state="disabled")
-        self.result_label.configure(text=f"Found {len(self.table_data)} tables (Displaying {len(filtered_tables)})", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")
-        self.update_status(f"Displaying {len(filtered_tables)} of {len(self.table_data)} tables")
+        self.result_label.configure(text=f"Found {len(self.table_data)} tables (Displaying {len(filtered_tables)})", text_color=self.text_color())
+        self.render_text_chunked(table_lines(), f"Displaying {len(filtered_tables)} of {len(self.table_data)} tables")
 
     def update_movie_display(self) -> None:
         if self.ebay_scrollable_frame_visible and self.ebay_scrollable_frame.winfo_exists():
@@ -531,6 +1002,7 @@ class WebScraperApp:
         
         details_frame = ctk.CTkFrame(self.content_frame)
         details_frame.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        self.add_candidate_nav(details_frame, "Movie Details")
         
         if "error" in self.movie_details:
             self.result_label.configure(text=self.movie_details["error"], text_color="red")
@@ -538,17 +1010,8 @@ class WebScraperApp:
             return
         
         if self.movie_details.get("poster_url", "N/A") != "N/A":
-            try:
-                img_response = requests.get(self.movie_details["poster_url"], headers=self.headers, timeout=5)
-                img_response.raise_for_status()
-                img = Image.open(io.BytesIO(img_response.content))
-                img.thumbnail((400, 600), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.image_label.configure(image=photo)
-                self.image_label.image = photo
-                self.image_label.pack(side="left", padx=10, pady=10, fill="y")
-            except Exception as e:
-                logger.error(f"Failed to load poster: {str(e)}")
+            self.load_thumbnail_async(self.movie_details["poster_url"], COVER_SIZE, self.show_cover_image,
+                                      after=self.shown_cover_prefetch())
         
         details_text = ""
         for key, value in self.movie_details.items():
@@ -567,7 +1030,7 @@ class WebScraperApp:
                                             fg_color="#1e40af", hover_color="#1e3a8a", width=80)
             copy_link_button.pack(side="top", pady=5)
         
-        self.result_label.configure(text="Movie details scraped", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")  
+        self.result_label.configure(text="Movie details scraped", text_color=self.text_color())  
         self.update_status("Movie details displayed")
 
     def update_book_display(self) -> None:
@@ -579,6 +1042,7 @@ class WebScraperApp:
         
         details_frame = ctk.CTkFrame(self.content_frame)
         details_frame.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        self.add_candidate_nav(details_frame, "Book Details")
         
         if "error" in self.book_details:
             self.result_label.configure(text=self.book_details["error"], text_color="red")
@@ -586,17 +1050,8 @@ class WebScraperApp:
             return
         
         if self.book_details.get("cover_url", "N/A") != "N/A":
-            try:
-                img_response = requests.get(self.book_details["cover_url"], headers=self.headers, timeout=5)
-                img_response.raise_for_status()
-                img = Image.open(io.BytesIO(img_response.content))
-                img.thumbnail((400, 600), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.image_label.configure(image=photo)
-                self.image_label.image = photo
-                self.image_label.pack(side="left", padx=10, pady=10, fill="y")
-            except Exception as e:
-                logger.error(f"Failed to load cover: {str(e)}")
+            self.load_thumbnail_async(self.book_details["cover_url"], COVER_SIZE, self.show_cover_image,
+                                      after=self.shown_cover_prefetch())
         
         details_text = ""
         for key in ["name", "author", "year", "rating", "description"]:
@@ -615,9 +1070,92 @@ class WebScraperApp:
                                             fg_color="#1e40af", hover_color="#1e3a8a", width=80)
             copy_link_button.pack(side="top", pady=5)
         
-        self.result_label.configure(text="Book details scraped", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")  
+        self.result_label.configure(text="Book details scraped", text_color=self.text_color())  
         self.update_status("Book details displayed")
 
+    def update_bulk_display(self, data_type: str) -> None:
+        kind = self.bulk_kind = BULK_LOOKUPS[data_type]
+        columns = bulk_header(kind, TABLE_FIELDS[kind])
+        table_frame = ctk.CTkFrame(self.content_frame)
+        table_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.bulk_table = ttk.Treeview(table_frame, columns=columns, show="headings")
+        for column in columns:
+            self.bulk_table.heading(column, text=column.capitalize())
+            self.bulk_table.column(column, width=300 if column in ("query", "name", "error") else 120, anchor="w")
+        self.bulk_table.tag_configure("error", foreground="red")
+        scrollbar = ctk.CTkScrollbar(table_frame, orientation="vertical", command=self.bulk_table.yview)
+        self.bulk_table.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.bulk_table.pack(side="left", fill="both", expand=True)
+        self.bulk_table_indices = []
+        self.append_bulk_rows(self.session)
+
+    def append_bulk_rows(self, session: ScrapeSession, generation: int = None) -> None:
+        """Insert the session's results not yet in the table, BULK_ROWS_PER_FRAME at a time."""
+        generation = self.display_generation if generation is None else generation
+        if (session is not self.session or generation != self.display_generation
+                or self.bulk_table is None or not self.bulk_table.winfo_exists()):
+            return
+        kind = self.bulk_kind
+        start = len(self.bulk_table_indices)
+        pending = session.bulk_results[start:start + BULK_ROWS_PER_FRAME]
+        for result in pending:
+            values = bulk_rows(kind, [result], TABLE_FIELDS[kind])[0]
+            position = bisect_right(self.bulk_table_indices, result.index)
+            self.bulk_table_indices.insert(position, result.index)
+            self.bulk_table.insert("", position, values=values, tags=("error",) if "error" in result.details else ())
+        total = len(session.options.get("titles", ()))
+        resolved = len(self.bulk_table_indices)
+        failed = sum(1 for result in session.bulk_results[:resolved] if "error" in result.details)
+        self.result_label.configure(text=f"Resolved {resolved} of {total} titles ({failed} not found)",
+                                    text_color=self.text_color())
+        if resolved < len(session.bulk_results):
+            self.root.after(1, self.append_bulk_rows, session, generation)
+
+    def add_candidate_nav(self, parent, data_type: str) -> None:
+        """Prev/next buttons over a lookup's other search results, if it found more than one."""
+        candidates = self.session.candidates
+        if candidates is None or len(candidates) < 2 or self.session.data_type != data_type:
+            return
+        index = self.session.candidate_index
+        nav_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        nav_frame.pack(side="top", fill="x", pady=5)
+        prev_button = ctk.CTkButton(nav_frame, text="< Prev", command=lambda: self.show_candidate(-1), width=80,
+                                    state="normal" if index > 0 else "disabled")
+        prev_button.pack(side="left", padx=5)
+        ctk.CTkLabel(nav_frame, text=f"Result {index + 1} of {len(candidates)}").pack(side="left", padx=5)
+        next_button = ctk.CTkButton(nav_frame, text="Next >", command=lambda: self.show_candidate(1), width=80,
+                                    state="normal" if index < len(candidates) - 1 else "disabled")
+        next_button.pack(side="left", padx=5)
+
+    def show_candidate(self, step: int) -> None:
+        """Flip the shown lookup to another search result; prefetched ones display at once."""
+        session = self.session
+        index = session.candidate_index + step
+        if session.candidates is None or not 0 <= index < len(session.candidates):
+            return
+        session.candidate_index = index
+        if session.candidates.done(index):
+            self.apply_candidate(session, index)
+            return
+        self.result_label.configure(text=f"Loading result {index + 1}...", text_color=self.text_color())
+        session.candidates.add_done_callback(index, lambda i: self.ui.post(self.apply_candidate, session, i))
+
+    def apply_candidate(self, session: ScrapeSession, index: int) -> None:
+        if session is not self.session or session.candidate_index != index:
+            return
+        try:
+            details = session.candidates.get(index)
+        except CancelledError:
+            return
+        session.set_result(details or {"error": "No data found!"})
+        self.update_content(session.data_type)
+
+    def show_cover_image(self, photo: ImageTk.PhotoImage) -> None:
+        self.image_label.configure(image=photo)
+        self.image_label.image = photo
+        self.image_label.pack(side="left", padx=10, pady=10, fill="y")
+
     def update_video_display(self) -> None:
         self.image_label.pack_forget()
         if self.ebay_scrollable_frame_visible and self.ebay_scrollable_frame.winfo_exists():
@@ -625,16 +1163,12 @@ class WebScraperApp:
             self.ebay_scrollable_frame_visible = False
         self.text_box.pack(fill="both", expand=True)
         
-        self.text_box.configure(state="normal")
-        self.text_box.delete("1.0", "end")
         num_items = self.num_items_entry.get().strip()
         num_items = int(num_items) if num_items.isdigit() and int(num_items) > 0 else len(self.video_urls)
         video_urls_to_display = list(self.video_urls)[:num_items]
-        for i, video_url in enumerate(video_urls_to_display, 1):
-            self.text_box.insert("end", f"Video {i}: {video_url}\n")
-        self.text_box.configure(state="disabled")
-        self.result_label.configure(text=f"Found {len(self.video_urls)} videos (Displaying {len(video_urls_to_display)})", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")
-        self.update_status(f"Displaying {len(video_urls_to_display)} of {len(self.video_urls)} videos")
+        self.result_label.configure(text=f"Found {len(self.video_urls)} videos (Displaying {len(video_urls_to_display)})", text_color=self.text_color())
+        self.render_text_chunked((f"Video {i}: {video_url}\n" for i, video_url in enumerate(video_urls_to_display, 1)),
+                                 f"Displaying {len(video_urls_to_display)} of {len(self.video_urls)} videos")
 
     def update_ebay_display(self) -> None:
         self.image_label.pack_forget()
@@ -651,38 +1185,89 @@ class WebScraperApp:
                 self.update_status("eBay display error", "red")
                 return
 
-            for item in self.ebay_products:
-                item_frame = ctk.CTkFrame(self.ebay_scrollable_frame)
-                item_frame.pack(fill="x", padx=5, pady=5)
-
-                if item.get("image_url", "N/A") != "N/A":
-                    try:
-                        img_response = requests.get(item["image_url"], headers=self.headers, timeout=5)
-                        img_response.raise_for_status()
-                        img = Image.open(io.BytesIO(img_response.content))
-                        img.thumbnail((100, 100), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        img_label = ctk.CTkLabel(item_frame, image=photo, text="")
-                        img_label.image = photo
-                        img_label.pack(side="left", padx=5, pady=5)
-                    except Exception as e:
-                        logger.error(f"Failed to load eBay item image: {str(e)}")
-
-                details_text = f"Title: {item.get('title', 'N/A')}\nPrice: {item.get('price', 'N/A')}\nRating: {item.get('rating', 'N/A')}\n"
-                details_label = ctk.CTkLabel(item_frame, text=details_text, font=("Helvetica", 12), wraplength=900, anchor="w", justify="left")
-                details_label.pack(side="left", fill="both", expand=True, padx=5, pady=5)
-
-                if item.get("link", "N/A") != "N/A":
-                    copy_link_button = ctk.CTkButton(item_frame, text="Copy Link", 
-                                                    command=lambda link=item["link"]: self.copy_to_clipboard(link),
-                                                    fg_color="#1e40af", hover_color="#1e3a8a", width=80)
-                    copy_link_button.pack(side="right", padx=5, pady=5)
-
-            self.result_label.configure(text="eBay products scraped", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")
+            # Rows are built in batches as the list is scrolled, starting with the first screenful
+            self.ebay_rows_rendered = 0
+            self.ebay_view_end = 1.0
+            self.render_more_ebay_rows(self.display_generation)
+
+            self.result_label.configure(text="eBay products scraped", text_color=self.text_color())
             self.update_status(f"Displaying {len(self.ebay_products)} eBay products")
 
         self.root.after(0, update_ui)
 
+    def create_ebay_row(self, item: Dict) -> None:
+        item_frame = ctk.CTkFrame(self.ebay_scrollable_frame)
+        item_frame.pack(fill="x", padx=5, pady=5)
+
+        if item.get("image_url", "N/A") != "N/A":
+            # Reserve the slot now and fill it once the thumbnail has been fetched and decoded
+            img_label = ctk.CTkLabel(item_frame, text="", width=100, height=100)
+            img_label.pack(side="left", padx=5, pady=5)
+            self.load_thumbnail_async(item["image_url"], (100, 100),
+                                      lambda photo, label=img_label: self.set_label_image(label, photo))
+
+        details_text = f"Title: {item.get('title', 'N/A')}\nPrice: {item.get('price', 'N/A')}\nRating: {item.get('rating', 'N/A')}\n"
+        details_label = ctk.CTkLabel(item_frame, text=details_text, font=("Helvetica", 12), wraplength=900, anchor="w", justify="left")
+        details_label.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+
+        if item.get("link", "N/A") != "N/A":
+            copy_link_button = ctk.CTkButton(item_frame, text="Copy Link", 
+                                            command=lambda link=item["link"]: self.copy_to_clipboard(link),
+                                            fg_color="#1e40af", hover_color="#1e3a8a", width=80)
+            copy_link_button.pack(side="right", padx=5, pady=5)
+
+    def watch_ebay_scroll(self) -> bool:
+        """
+        Build more eBay rows whenever the list's view moves or its content grows.
+
+        CTkScrollableFrame has no public scroll event, so the yscrollcommand
+        of its canvas is chained. Returns False if this customtkinter
+        version keeps the canvas elsewhere; rows are then built in idle time.
+        """
+        canvas = getattr(self.ebay_scrollable_frame, "_parent_canvas", None)
+        if canvas is None:
+            return False
+        scrollbar_command = str(canvas.cget("yscrollcommand"))
+
+        def on_view_change(first, last):
+            if scrollbar_command:
+                canvas.tk.call(scrollbar_command, first, last)
+            self.ebay_view_end = float(last)
+            self.schedule_ebay_rows()
+
+        canvas.configure(yscrollcommand=on_view_change)
+        return True
+
+    def schedule_ebay_rows(self) -> None:
+        if self.ebay_render_pending is None:
+            self.ebay_render_pending = self.root.after_idle(self.render_more_ebay_rows, self.display_generation)
+
+    def render_more_ebay_rows(self, generation: int, batch_size: int = 12) -> None:
+        """
+        Build the next batch of eBay rows if the end of the list is in view.
+
+        Runs when the view moves, so nothing is rescheduled once every row
+        exists or the user stops scrolling.
+        """
+        self.ebay_render_pending = None
+        if generation != self.display_generation or not self.ebay_scrollable_frame.winfo_exists():
+            return
+        if self.ebay_rows_rendered >= len(self.ebay_products):
+            return
+        if self.ebay_scroll_watched and self.ebay_view_end <= 0.85:
+            return
+        end = min(self.ebay_rows_rendered + batch_size, len(self.ebay_products))
+        for item in self.ebay_products[self.ebay_rows_rendered:end]:
+            self.create_ebay_row(item)
+        self.ebay_rows_rendered = end
+        if not self.ebay_scroll_watched:
+            self.schedule_ebay_rows()
+
+    def set_label_image(self, label, photo: ImageTk.PhotoImage) -> None:
+        if label.winfo_exists():
+            label.configure(image=photo)
+            label.image = photo
+
     def update_news_display(self) -> None:
         self.image_label.pack_forget()
         if self.ebay_scrollable_frame_visible and self.ebay_scrollable_frame.winfo_exists():
@@ -690,16 +1275,12 @@ class WebScraperApp:
             self.ebay_scrollable_frame_visible = False
         self.text_box.pack(fill="both", expand=True)
         
-        self.text_box.configure(state="normal")
-        self.text_box.delete("1.0", "end")
         num_items = self.num_items_entry.get().strip()
         num_items = int(num_items) if num_items.isdigit() and int(num_items) > 0 else len(self.news_headlines)
         headlines_to_display = list(self.news_headlines)[:num_items]
-        for i, headline in enumerate(headlines_to_display, 1):
-            self.text_box.insert("end", f"Headline {i}: {headline}\n")
-        self.text_box.configure(state="disabled")
-        self.result_label.configure(text=f"Found {len(self.news_headlines)} headlines (Displaying {len(headlines_to_display)})", text_color="black" if ctk.get_appearance_mode() == "Light" else "white")
-        self.update_status(f"Displaying {len(headlines_to_display)} of {len(self.news_headlines)} headlines")
+        self.result_label.configure(text=f"Found {len(self.news_headlines)} headlines (Displaying {len(headlines_to_display)})", text_color=self.text_color())
+        self.render_text_chunked((f"Headline {i}: {headline}\n" for i, headline in enumerate(headlines_to_display, 1)),
+                                 f"Displaying {len(headlines_to_display)} of {len(self.news_headlines)} headlines")
 
     def update_pdf_display(self) -> None:
         self.image_label.pack_forget()
@@ -742,7 +1323,7 @@ class WebScraperApp:
                 copy_link_button.pack(side="left", padx=(0, 0))
 
             self.result_label.configure(text=f"Found {len(self.pdf_links)} PDF links (Displaying {len(filtered_pdfs)})", 
-                                        text_color="black" if ctk.get_appearance_mode() == "Light" else "white")
+                                        text_color=self.text_color())
             self.update_status(f"Displaying {len(filtered_pdfs)} of {len(self.pdf_links)} PDF links")
 
         self.root.after(0, update_ui)
@@ -754,32 +1335,41 @@ class WebScraperApp:
         popup.transient(self.root)
         popup.grab_set()
         
-        img_data = self.image_data.get(img_url)
-        if not img_data:
+        img_label = ctk.CTkLabel(popup, text="Loading...", width=500, height=500)
+        img_label.pack(pady=10)
+        
+        # The store of the session shown now, even if another tab is shown by the time this runs
+        images = self.image_data
+
+        def work():
             try:
-                img_response = requests.get(img_url, headers=self.headers, timeout=5)
-                img_response.raise_for_status()
-                img_data = img_response.content
-                self.image_data[img_url] = img_data
+                img_data = images.get(img_url, fetch=False)
+                if img_data:
+                    decoded = thumbnail_for(img_url, img_data, (500, 500))
+                else:
+                    img_data, decoded = fetch_thumbnail(img_url, (500, 500), headers=self.headers)
+                    if img_data:
+                        images.put(img_url, img_data)
             except Exception as e:
                 logger.error(f"Failed to load image for popup: {str(e)}")
-                popup.destroy()
+                self.ui.post(lambda: popup.winfo_exists() and popup.destroy())
                 return
+            self.ui.post(show, decoded)
         
-        img = Image.open(io.BytesIO(img_data))
-        img.thumbnail((500, 500), Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(img)
+        def show(decoded):
+            if popup.winfo_exists():
+                self.set_label_image(img_label, ImageTk.PhotoImage(to_image(decoded)))
+                img_label.configure(text="")
         
-        img_label = ctk.CTkLabel(popup, image=photo, text="")
-        img_label.image = photo
-        img_label.pack(pady=10)
+        self.media_executor.submit(work)
         
         copy_button = ctk.CTkButton(popup, text="Copy URL", command=lambda: self.copy_to_clipboard(img_url))
         copy_button.pack(pady=5)
 
     def download_pdf(self, url: str, name: str) -> None:
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            # PDFs can be large; keep them out of the page cache
+            response = fetch(url, headers=self.headers, cache=False)
             response.raise_for_status()
             downloads_dir = os.path.join(os.path.expanduser("~"), "Downloads")
             os.makedirs(downloads_dir, exist_ok=True)
@@ -794,6 +1384,21 @@ class WebScraperApp:
         pyperclip.copy(text)
         self.update_status("Link copied to clipboard", "green")
 
+    def export_images_zip(self, file_path: str, image_urls: List[str], images: ImageStore) -> None:
+        """Write the original images to a zip file; runs on a worker thread since evicted images are re-downloaded."""
+        try:
+            with zipfile.ZipFile(file_path, 'w') as zipf:
+                for img_url in image_urls:
+                    # Re-fetched if it was evicted or only seen as a stored thumbnail
+                    img_data = images.get(img_url, headers=self.headers)
+                    if img_data:
+                        img_name = img_url.split('/')[-1]
+                        zipf.writestr(img_name, img_data)
+        except Exception as e:
+            self.update_status(f"Export failed: {str(e)}", "red")
+            return
+        self.update_status(f"Images exported to {file_path}", "green")
+
     def export_data(self) -> None:
         data_type = self.data_type_var.get()
         export_format = self.export_format_var.get()
@@ -803,12 +1408,13 @@ class WebScraperApp:
         try:
             if data_type == "Images" and export_format == "zip":
                 file_path = os.path.join(downloads_dir, "scraped_images.zip")
-                with zipfile.ZipFile(file_path, 'w') as zipf:
-                    for img_url, img_data in self.image_data.items():
-                        if img_data:
-                            img_name = img_url.split('/')[-1]
-                            zipf.writestr(img_name, img_data)
-                self.update_status(f"Images exported to {file_path}", "green")
+                image_urls = [img_url for _, img_url, _ in self.gallery_images]
+                self.update_status(f"Exporting {len(image_urls)} images...")
+                self.media_executor.submit(self.export_images_zip, file_path, image_urls, self.image_data)
+            elif data_type in BULK_LOOKUPS:
+                file_path = os.path.join(downloads_dir, f"scraped_{data_type.lower().replace(' ', '_')}.{export_format}")
+                export_bulk(file_path, BULK_LOOKUPS[data_type], self.bulk_results)
+                self.update_status(f"{len(self.bulk_results)} lookups exported to {file_path}", "green")
             elif export_format == "csv":
                 file_path = os.path.join(downloads_dir, f"scraped_{data_type.lower().replace(' ', '_')}.csv")
                 with open(file_path, 'w', newline='', encoding='utf-8') as f:
@@ -889,7 +1495,17 @@ class WebScraperApp:
             self.loading_label.configure(text="")
 
     def on_canvas_resize(self, event) -> None:
-        self.update_gallery()
+        # A window drag fires <Configure> continuously; relayout once it settles
+        if self.gallery_resize_pending is not None:
+            self.root.after_cancel(self.gallery_resize_pending)
+        self.gallery_resize_pending = self.root.after(150, self.relayout_gallery)
+
+    def relayout_gallery(self) -> None:
+        """Move the existing tiles to the new layout; no widgets are rebuilt."""
+        self.gallery_resize_pending = None
+        if self.gallery_images and self.canvas.winfo_width() != self.gallery_layout.get("canvas_width"):
+            self.layout_gallery()
+        self.render_visible_tiles()
 
 if __name__ == "__main__":
     root = ctk.CTk()
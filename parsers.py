@@ -0,0 +1,125 @@
+import os
+import importlib.util
+import threading
+from bs4 import BeautifulSoup
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tree builders in order of preference; html.parser ships with Python
+BACKENDS = ("lxml", "html.parser")
+
+_backend_module = {"lxml": "lxml", "html.parser": None}
+
+# Bumped whenever make_soup builds trees differently, so results parsed under older rules are not reused
+PARSE_RULES_VERSION = 2
+_setting = os.environ.get("SCRAPER_HTML_PARSER", "auto")
+_resolved = None
+_lock = threading.Lock()
+
+
+def backend_available(name: str) -> bool:
+    if name not in _backend_module:
+        return False
+    module = _backend_module[name]
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def set_parser_backend(name: str) -> None:
+    """
+    Choose the tree builder used by every scraper.
+
+    Args:
+        name (str): "auto" (fastest installed), "lxml" or "html.parser"
+    """
+    global _setting, _resolved
+    if name != "auto" and name not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name}")
+    with _lock:
+        _setting = name
+        _resolved = None
+
+
+def parser_backend() -> str:
+    """
+    Return the tree builder in use, falling back to html.parser if the
+    configured library is not installed.
+
+    Returns:
+        str: BeautifulSoup features string
+    """
+    global _resolved
+    if _resolved is None:
+        with _lock:
+            if _resolved is None:
+                wanted = BACKENDS if _setting == "auto" else (_setting, "html.parser")
+                for name in wanted:
+                    if backend_available(name):
+                        _resolved = name
+                        break
+                if _setting not in ("auto", _resolved):
+                    logger.warning(f"Parser backend '{_setting}' is not installed, using {_resolved}")
+    return _resolved
+
+
+# Elements whose start closes an open paragraph, as in the HTML spec
+_BLOCK_TAGS = {"address", "article", "aside", "blockquote", "center", "details", "dialog", "dir", "div", "dl",
+               "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+               "hgroup", "hr", "main", "menu", "nav", "ol", "p", "pre", "section", "summary", "table", "ul"}
+
+# Start tag -> (open elements it implicitly closes, elements that stop the search for them)
+IMPLIED_END_TAGS = {
+    "td": ({"td", "th"}, {"tr", "table"}),
+    "th": ({"td", "th"}, {"tr", "table"}),
+    "tr": ({"td", "th", "tr"}, {"thead", "tbody", "tfoot", "table"}),
+    "thead": ({"td", "th", "tr", "thead", "tbody", "tfoot"}, {"table"}),
+    "tbody": ({"td", "th", "tr", "thead", "tbody", "tfoot"}, {"table"}),
+    "tfoot": ({"td", "th", "tr", "thead", "tbody", "tfoot"}, {"table"}),
+    "li": ({"li"}, {"ul", "ol", "menu", "table"}),
+    "dt": ({"dt", "dd"}, {"dl", "table"}),
+    "dd": ({"dt", "dd"}, {"dl", "table"}),
+    "option": ({"option"}, {"select", "datalist", "optgroup"}),
+    "optgroup": ({"option", "optgroup"}, {"select"}),
+}
+IMPLIED_END_TAGS.update({name: ({"p"}, {"button", "table", "td", "th", "caption"}) for name in _BLOCK_TAGS})
+
+
+class _Soup(BeautifulSoup):
+    """
+    BeautifulSoup that closes the end tags HTML leaves implied.
+
+    html.parser only closes elements at their end tag, so unclosed <td>,
+    <tr>, <li> or <p> elements swallow every following sibling. lxml closes
+    most of them itself. Applying the HTML spec's rules to both backends
+    makes them build the same tree.
+    """
+
+    def handle_starttag(self, name, *args, **kwargs):
+        rule = IMPLIED_END_TAGS.get(name)
+        if rule is not None:
+            closes, stops = rule
+            while True:
+                tag = self.currentTag
+                while tag is not None and tag is not self and tag.name not in closes and tag.name not in stops:
+                    tag = tag.parent
+                if tag is None or tag is self or tag.name not in closes:
+                    break
+                self.handle_endtag(tag.name)
+        return super().handle_starttag(name, *args, **kwargs)
+
+
+def make_soup(markup, parse_only=None) -> BeautifulSoup:
+    """
+    Parse HTML with the configured backend.
+
+    Both backends close implied end tags the way browsers do, so a page
+    parses to the same tree whichever one is installed.
+
+    Args:
+        markup (bytes | str): Document to parse
+        parse_only (SoupStrainer): Only build the tree for matching elements
+
+    Returns:
+        BeautifulSoup: Parsed document
+    """
+    return _Soup(markup, parser_backend(), parse_only=parse_only)
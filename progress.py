@@ -0,0 +1,158 @@
+import queue
+import time
+from typing import List, NamedTuple, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# How often the GUIs drain progress events and repaint the progress bar
+PROGRESS_FRAME_MS = 100
+
+BYTES = "bytes"
+ITEMS = "items"
+IMAGES = "images"
+STAGE = "stage"
+
+
+class ProgressEvent(NamedTuple):
+    kind: str                 # BYTES, ITEMS, IMAGES or STAGE
+    done: int
+    total: Optional[int]      # None when the total is not known
+    message: str
+    time: float               # time.monotonic() when the event was reported
+
+
+class ProgressReporter:
+    """
+    Thread-safe sink for the progress events of one scrape.
+
+    Scrapers and downloads report from worker threads; the UI drains the
+    queue on its own schedule, so reporting never touches a widget.
+    """
+
+    def __init__(self):
+        self._events = queue.SimpleQueue()
+
+    def report(self, kind: str, done: int, total: Optional[int] = None, message: str = "") -> None:
+        self._events.put(ProgressEvent(kind, done, total, message, time.monotonic()))
+
+    def bytes_read(self, done: int, total: Optional[int] = None) -> None:
+        """Bytes of the current page or file downloaded, against its Content-Length."""
+        self.report(BYTES, done, total)
+
+    def items_parsed(self, done: int, total: Optional[int] = None) -> None:
+        """Results (tables, links, headlines, ...) extracted so far."""
+        self.report(ITEMS, done, total)
+
+    def images_fetched(self, done: int, total: int) -> None:
+        """Gallery images downloaded out of the number found."""
+        self.report(IMAGES, done, total)
+
+    def stage(self, message: str) -> None:
+        """Start a new phase, e.g. the Selenium fallback; resets byte counts."""
+        self.report(STAGE, 0, None, message)
+
+    def drain(self) -> List[ProgressEvent]:
+        """
+        Take every event reported since the last drain.
+
+        Returns:
+            list: Events in the order they were reported
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+
+def report_items(progress: Optional[ProgressReporter], done: int, total: Optional[int] = None) -> None:
+    """Report parsed items if a reporter was given."""
+    if progress is not None:
+        progress.items_parsed(done, total)
+
+
+def report_stage(progress: Optional[ProgressReporter], message: str) -> None:
+    """Report a new phase if a reporter was given."""
+    if progress is not None:
+        progress.stage(message)
+
+
+def format_bytes(count: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+class ProgressState:
+    """
+    UI-side summary of the events drained from a ProgressReporter.
+
+    Keeps the latest event of each kind and derives throughput from when
+    the counts started moving, so a stalled download shows a falling rate
+    and a Selenium fallback shows how long the browser has been working.
+    """
+
+    def __init__(self):
+        now = time.monotonic()
+        self.stage = "Scraping"
+        self.stage_started = now
+        self.latest = {}
+        self.first_seen = {}
+
+    def apply(self, events: List[ProgressEvent]) -> None:
+        for event in events:
+            if event.kind == STAGE:
+                self.stage = event.message
+                self.stage_started = event.time
+                self.latest.pop(BYTES, None)
+                self.first_seen.pop(BYTES, None)
+                continue
+            self.first_seen.setdefault(event.kind, event.time)
+            self.latest[event.kind] = event
+
+    def rate(self, kind: str) -> Optional[float]:
+        """Units per second of `kind` since it was first reported, or None."""
+        event = self.latest.get(kind)
+        if event is None:
+            return None
+        elapsed = time.monotonic() - self.first_seen[kind]
+        return event.done / elapsed if elapsed > 0.2 else None
+
+    def fraction(self) -> Optional[float]:
+        """
+        Completed fraction for a determinate progress bar.
+
+        Returns:
+            float: 0..1 from image, item or byte counts, or None if no total is known
+        """
+        for kind in (IMAGES, ITEMS, BYTES):
+            event = self.latest.get(kind)
+            if event is not None and event.total:
+                return min(event.done / event.total, 1.0)
+        return None
+
+    def describe(self) -> str:
+        """One-line status text, e.g. 'Downloading page: 1.2 MB / 3.0 MB (420.0 KB/s)'."""
+        parts = []
+        images = self.latest.get(IMAGES)
+        if images is not None:
+            parts.append(f"{images.done}/{images.total} images")
+        items = self.latest.get(ITEMS)
+        if items is not None:
+            parts.append(f"{items.done}/{items.total} items" if items.total else f"{items.done} items")
+        received = self.latest.get(BYTES)
+        if received is not None:
+            text = format_bytes(received.done)
+            if received.total:
+                text += f" / {format_bytes(received.total)}"
+            rate = self.rate(BYTES)
+            if rate is not None:
+                text += f" ({format_bytes(rate)}/s)"
+            parts.append(text)
+        if not parts:
+            return f"{self.stage} ({time.monotonic() - self.stage_started:.0f}s)"
+        return f"{self.stage}: " + ", ".join(parts)
@@ -0,0 +1,66 @@
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+import logging
+from cancellation import CancelToken, check_cancelled
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """
+    Per-host request rate limit shared by every thread.
+
+    Each host gets a steady rate with a small burst allowance, so a single
+    lookup's handful of requests go out at once while a bulk run of
+    thousands settles at the configured rate. Hosts without a rate are not
+    limited.
+    """
+
+    def __init__(self, rates: Dict[str, float], burst: int = 5):
+        """
+        Args:
+            rates (dict): Requests per second allowed per hostname
+            burst (int): Requests a host may receive back to back before the rate applies
+        """
+        self.rates = {host.lower(): rate for host, rate in rates.items() if rate}
+        self.burst = max(1, burst)
+        # Per host, when the next request would be due if every earlier one went out on schedule
+        self._due: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str) -> float:
+        """
+        Claim the next request slot for the URL's host.
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        host = urlparse(url).hostname or ""
+        rate = self.rates.get(host)
+        if rate is None:
+            return 0.0
+        interval = 1.0 / rate
+        now = time.monotonic()
+        with self._lock:
+            due = max(self._due.get(host, now), now)
+            self._due[host] = due + interval
+        return max(0.0, due - (self.burst - 1) * interval - now)
+
+    def acquire(self, url: str, cancel: CancelToken = None) -> None:
+        """
+        Block until a request to the URL's host may be sent.
+
+        Raises:
+            CancelledError: If `cancel` fires while waiting
+        """
+        delay = self.reserve(url)
+        if delay <= 0:
+            return
+        logger.debug(f"Rate limit: waiting {delay:.2f}s for {url}")
+        if cancel is not None:
+            cancel.wait(delay)
+            check_cancelled(cancel)
+        else:
+            time.sleep(delay)
@@ -0,0 +1,63 @@
+import importlib
+from http_client import DEFAULT_HEADERS
+from cancellation import CancelToken
+from progress import ProgressReporter
+
+# data type -> (module, function, extra positional arguments after the target)
+SCRAPERS = {
+    "images": ("scrape_images", "scrape_images", ("format", "headers")),
+    "text": ("scrape_text", "scrape_text", ("headers",)),
+    "tables": ("scrape_tables", "scrape_tables", ()),
+    "movie": ("scrape_movies", "scrape_movie_details", ()),
+    "book": ("scrape_books", "scrape_book_details", ()),
+    "videos": ("scrape_videos", "scrape_videos", ("format", "headers")),
+    "ebay": ("scrape_ebay", "scrape_ebay_product", ()),
+    "news": ("scrape_news", "scrape_news_headlines", ()),
+    "pdfs": ("scrape_pdfs", "scrape_pdf_links", ()),
+}
+
+# Labels used by the GUI data type dropdowns
+DATA_TYPE_LABELS = {
+    "Images": "images",
+    "Text": "text",
+    "Tables": "tables",
+    "Movie Details": "movie",
+    "Book Details": "book",
+    "Videos": "videos",
+    "eBay Products": "ebay",
+    "News Headlines": "news",
+    "PDF Links": "pdfs",
+}
+
+
+def get_scraper(data_type: str, format: str = "all", headers: dict = None, cancel: CancelToken = None,
+                progress: ProgressReporter = None):
+    """
+    Look up a scrape_* function and bind its per-type arguments.
+
+    The scraper module is imported on first use, so callers only pay for
+    the scrapers they actually run.
+
+    Args:
+        data_type (str): Registry key ("text", "tables", ...) or GUI label ("Text", ...)
+        format (str): Image/video format filter, where the scraper takes one
+        headers (dict): HTTP headers, where the scraper takes them
+        cancel (CancelToken): Passed to every call so they can be aborted together
+        progress (ProgressReporter): Passed to every call to report download and parse progress
+
+    Returns:
+        callable: Function taking a URL or search term and returning the scraper's result
+    """
+    key = DATA_TYPE_LABELS.get(data_type, data_type)
+    if key not in SCRAPERS:
+        raise ValueError(f"Unknown data type: {data_type}")
+    module_name, function_name, arg_names = SCRAPERS[key]
+    function = getattr(importlib.import_module(module_name), function_name)
+    values = {"format": format, "headers": headers or DEFAULT_HEADERS}
+    extra_args = [values[name] for name in arg_names]
+
+    def scraper(target):
+        return function(target, *extra_args, cancel=cancel, progress=progress)
+
+    scraper.__name__ = function_name
+    return scraper
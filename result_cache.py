@@ -0,0 +1,146 @@
+import os
+import json
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+import logging
+from disk_cache import CACHE_DIR, DiskLRU
+from parsers import PARSE_RULES_VERSION, parser_backend
+
+logger = logging.getLogger(__name__)
+
+_MISS = object()
+
+_config = {
+    "memory_max_bytes": 32 * 1024 * 1024,
+    "disk_max_bytes": 100 * 1024 * 1024,
+    "disk_dir": os.path.join(CACHE_DIR, "results"),
+}
+
+
+class ResultCache:
+    """
+    Two-level cache of parsed scraper results.
+
+    Results are stored pickled, in a byte-bounded in-memory LRU in front
+    of a DiskLRU. Every hit is unpickled into a fresh object, so callers
+    may mutate what they get back.
+    """
+
+    def __init__(self, memory_max_bytes: int, disk_max_bytes: int, disk_dir: str):
+        self.memory_max_bytes = memory_max_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._disk = DiskLRU(disk_dir, disk_max_bytes) if disk_max_bytes else None
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        if len(blob) > self.memory_max_bytes:
+            return
+        with self._lock:
+            self._memory_bytes -= len(self._memory.pop(key, b""))
+            self._memory[key] = blob
+            self._memory_bytes += len(blob)
+            while self._memory_bytes > self.memory_max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+        if blob is None and self._disk is not None:
+            entry = self._disk.get(key)
+            if entry:
+                blob = entry[0]
+                self._remember(key, blob)
+        if blob is None:
+            return default
+        try:
+            return pickle.loads(blob)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cached result: {e}")
+            if self._disk is not None:
+                self._disk.delete(key)
+            return default
+
+    def put(self, key: str, value) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, blob)
+        if self._disk is not None:
+            self._disk.put(key, blob)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def configure_result_cache(**settings) -> None:
+    """
+    Change the result cache budgets.
+
+    Args:
+        **settings: Any of memory_max_bytes, disk_max_bytes (0 disables the
+            disk level) or disk_dir
+    """
+    global _cache
+    unknown = set(settings) - set(_config)
+    if unknown:
+        raise ValueError(f"Unknown result cache settings: {', '.join(sorted(unknown))}")
+    with _cache_lock:
+        _config.update(settings)
+        _cache = None
+
+
+def get_result_cache() -> ResultCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResultCache(_config["memory_max_bytes"], _config["disk_max_bytes"], _config["disk_dir"])
+    return _cache
+
+
+def result_key(scraper: str, options: dict, body: bytes) -> str:
+    """
+    Build the cache key for one parse of one response body.
+
+    The active parser backend and parse rules version are part of the
+    key, so a result is only reused if it was parsed the same way.
+
+    Args:
+        scraper (str): Name of the scraper doing the parse
+        options (dict): Options that change the parse output
+        body (bytes): Raw response body
+
+    Returns:
+        str: Hex digest identifying (scraper, options, body)
+    """
+    body_hash = hashlib.sha256(body).hexdigest()
+    return hashlib.sha256(f"{scraper}|{parser_backend()}|{PARSE_RULES_VERSION}|{json.dumps(options, sort_keys=True)}|{body_hash}".encode("utf-8")).hexdigest()
+
+
+def cached_parse(scraper: str, options: dict, body: bytes, parse):
+    """
+    Return the memoized result of parse(body), computing it on a miss.
+
+    Args:
+        scraper (str): Name of the scraper doing the parse
+        options (dict): Options that change the parse output
+        body (bytes): Raw response body
+        parse (callable): Function turning the body into the structured result
+
+    Returns:
+        The structured result, freshly built or from the cache
+    """
+    cache = get_result_cache()
+    key = result_key(scraper, options, body)
+    result = cache.get(key, _MISS)
+    if result is not _MISS:
+        logger.debug(f"Reusing parsed result for {scraper}")
+        return result
+    result = parse(body)
+    cache.put(key, result)
+    return result
@@ -1,68 +1,147 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+from http_client import fetch
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_stage
+from parsers import make_soup
+from lookup import PREFETCH_CANDIDATES, Candidates, prefetch_cover
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_book_details(book_name: str) -> dict:
+HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
+
+def search_books(book_name: str, limit: int = PREFETCH_CANDIDATES, cancel: CancelToken = None,
+                 progress: ProgressReporter = None) -> List[dict]:
     """
-    Scrape book details from Open Library.
+    Search Open Library and parse the result list.
     
     Args:
         book_name (str): Name of the book to search for
+        limit (int): Maximum number of results to return
+        cancel (CancelToken): Aborts the search when cancelled
+        progress (ProgressReporter): Receives download progress
     
     Returns:
-        dict: Book details or error message
+        list: Book details without description, best match first
     """
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
-    try:
-        search_url = f"https://openlibrary.org/search?q={book_name.replace(' ', '+')}&mode=everything"
-        search_response = requests.get(search_url, headers=headers, timeout=10)
-        search_response.raise_for_status()
-        search_soup = BeautifulSoup(search_response.content, 'html.parser')
-        first_result = search_soup.select_one('li.searchResultItem')
-        
-        if not first_result:
-            return {"error": "No book found with that name."}
-        
-        title_elem = first_result.select_one('h3.booktitle a')
+    search_url = f"https://openlibrary.org/search?q={book_name.replace(' ', '+')}&mode=everything"
+    report_stage(progress, "Searching Open Library")
+    search_response = fetch(search_url, headers=HEADERS, cancel=cancel, progress=progress)
+    search_response.raise_for_status()
+    search_soup = make_soup(search_response.content)
+    
+    books = []
+    for result in search_soup.select('li.searchResultItem')[:limit]:
+        title_elem = result.select_one('h3.booktitle a')
         title = title_elem.text.strip() if title_elem else "N/A"
         
-        cover_elem = first_result.select_one('span.bookcover img')
+        cover_elem = result.select_one('span.bookcover img')
         cover_url = "https:" + cover_elem['src'] if cover_elem else "N/A"
         
-        author_elem = first_result.select_one('span.bookauthor a')
+        author_elem = result.select_one('span.bookauthor a')
         author = author_elem.text.strip() if author_elem else "N/A"
         
-        year_elem = first_result.select_one('span.resultDetails span')
+        year_elem = result.select_one('span.resultDetails span')
         year = year_elem.text.strip().replace("First published in ", "") if year_elem else "N/A"
         
-        rating_elem = first_result.select_one('span.ratingsByline span[itemprop="ratingValue"]')
+        rating_elem = result.select_one('span.ratingsByline span[itemprop="ratingValue"]')
         rating = rating_elem.text.strip() if rating_elem else "N/A"
         
-        book_link = first_result.select_one('h3.booktitle a')['href'] if first_result.select_one('h3.booktitle a') else "N/A"
+        book_link = title_elem['href'] if title_elem else "N/A"
         detail_url = f"https://openlibrary.org{book_link}" if book_link != "N/A" else "N/A"
         
-        description = "N/A"
-        if detail_url != "N/A":
-            detail_response = requests.get(detail_url, headers=headers, timeout=10)
-            detail_response.raise_for_status()
-            detail_soup = BeautifulSoup(detail_response.content, 'html.parser')
-            description_elem = detail_soup.select_one('div.read-more__content')
-            description = " ".join([p.text.strip() for p in description_elem.find_all('p') if not p.find('a')]) if description_elem else "N/A"
-        
-        book_details = {
+        books.append({
             "name": title,
             "cover_url": cover_url,
             "author": author,
             "year": year,
             "rating": rating,
-            "description": description,
+            "description": "N/A",
             "book_link": detail_url
-        }
-        
-        return book_details
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Network error: {e}"}
+        })
+    return books
+
+def load_book_details(book: dict, cover_size: Tuple[int, int] = None, cancel: CancelToken = None,
+                      progress: ProgressReporter = None) -> Tuple[dict, Optional[Future]]:
+    """
+    Complete a search result with the description from its book page.
+    
+    The cover is fetched alongside the book page rather than after it, and
+    the details are returned without waiting for it.
+    
+    Args:
+        book (dict): One result of search_books
+        cover_size (tuple): Thumbnail size to prefetch the cover at; None skips the cover
+        cancel (CancelToken): Aborts the lookup when cancelled
+        progress (ProgressReporter): Receives download progress of the book page
+    
+    Returns:
+        tuple: Book details or error message, and the cover prefetch (None if there is none)
+    """
+    cover = prefetch_cover(book["cover_url"], cover_size, cancel=cancel)
+    try:
+        book_details = dict(book)
+        if book["book_link"] != "N/A":
+            report_stage(progress, "Loading book page")
+            detail_response = fetch(book["book_link"], headers=HEADERS, cancel=cancel, progress=progress)
+            detail_response.raise_for_status()
+            detail_soup = make_soup(detail_response.content)
+            description_elem = detail_soup.select_one('div.read-more__content')
+            book_details["description"] = " ".join([p.text.strip() for p in description_elem.find_all('p') if not p.find('a')]) if description_elem else "N/A"
+        return book_details, cover
+    except CancelledError:
+        raise
+    except RequestException as e:
+        return {"error": f"Network error: {e}"}, None
     except Exception as e:
-        return {"error": f"An error occurred: {e}"}
\ No newline at end of file
+        return {"error": f"An error occurred: {e}"}, None
+
+def lookup_books(book_name: str, top_k: int = PREFETCH_CANDIDATES, cover_size: Tuple[int, int] = None,
+                 cancel: CancelToken = None, progress: ProgressReporter = None) -> Candidates:
+    """
+    Search Open Library and load the top results' details concurrently.
+    
+    Args:
+        book_name (str): Name of the book to search for
+        top_k (int): Number of results to load
+        cover_size (tuple): Thumbnail size to prefetch covers at; None skips covers
+        cancel (CancelToken): Aborts the search and every detail load when cancelled
+        progress (ProgressReporter): Receives progress of the search and the best match
+    
+    Returns:
+        Candidates: Details of each result, or a single error message
+    """
+    try:
+        books = search_books(book_name, top_k, cancel=cancel, progress=progress)
+    except CancelledError:
+        raise
+    except RequestException as e:
+        return Candidates.of({"error": f"Network error: {e}"})
+    except Exception as e:
+        return Candidates.of({"error": f"An error occurred: {e}"})
+    if not books:
+        return Candidates.of({"error": "No book found with that name."})
+    
+    def load(book):
+        # Only the best match reports progress; the rest load quietly behind it
+        return load_book_details(book, cover_size, cancel=cancel, progress=progress if book is books[0] else None)
+    
+    return Candidates.load(books, load)
+
+def scrape_book_details(book_name: str, cancel: CancelToken = None,
+                        progress: ProgressReporter = None, cover_size: Tuple[int, int] = None) -> dict:
+    """
+    Scrape book details from Open Library.
+    
+    Args:
+        book_name (str): Name of the book to search for
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
+        cover_size (tuple): Thumbnail size to prefetch the cover at; None skips the cover
+    
+    Returns:
+        dict: Book details or error message
+    """
+    return lookup_books(book_name, 1, cover_size, cancel=cancel, progress=progress).get(0)
@@ -1,37 +1,35 @@
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+from parsers import make_soup
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_items, report_stage
+from driver_pool import lease_driver, wait_until
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_ebay_product(product_name: str) -> list:
+def scrape_ebay_product(product_name: str, cancel: CancelToken = None,
+                        progress: ProgressReporter = None) -> list:
     """
     Scrape eBay product listings for a given search term.
     
     Args:
         product_name (str): Product name to search for on eBay
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
     
     Returns:
         list: List of product dictionaries or None if unsuccessful
     """
     search_url = f"https://www.ebay.com/sch/i.html?_nkw={product_name.replace(' ', '+')}&_sop=12"
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
     try:
-        driver.get(search_url)
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'li.s-item')))
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        # Selenium is only needed for this fallback, so it is imported on first use
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.common.by import By
+        report_stage(progress, "Rendering eBay results in Chrome")
+        with lease_driver(cancel=cancel) as driver:
+            driver.get(search_url)
+            wait_until(driver, 10, EC.presence_of_element_located((By.CSS_SELECTOR, 'li.s-item')), cancel)
+            page_source = driver.page_source
+        soup = make_soup(page_source)
         product_details = []
         product_listings = soup.select('li.s-item.s-item__pl-on-bottom')
         
@@ -64,6 +62,7 @@ def scrape_ebay_product(product_name: str) -> list:
                         "price": price,
                         "rating": rating
                     })
+                    report_items(progress, len(product_details), len(product_listings))
             except AttributeError as e:
                 logger.error(f"Error parsing product: {e}")
                 continue
@@ -74,8 +73,8 @@ def scrape_ebay_product(product_name: str) -> list:
         
         logger.info(f"Scraped {len(product_details)} products from eBay for '{product_name}'")
         return product_details
+    except CancelledError:
+        raise
     except Exception as e:
         logger.error(f"Error fetching eBay with Selenium: {e}")
-        return None
-    finally:
-        driver.quit()
\ No newline at end of file
+        return None
\ No newline at end of file
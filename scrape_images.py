@@ -1,18 +1,101 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from http_client import fetch
+from html_stream import EventParser, stream_events
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_items, report_stage
 from urllib.parse import urljoin
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_driver, wait_until
+from typing import Iterator
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_images(url: str, image_format: str, headers: dict) -> list:
+class _ImageStreamParser(EventParser):
+    """Emits the source attribute of every <img>/<image> tag as it is parsed."""
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('img', 'image'):
+            attrs = dict(attrs)
+            img_url = attrs.get('src') or attrs.get('data-src') or attrs.get('data-lazy-src')
+            if img_url:
+                self.events.append(img_url)
+
+def _allowed_extensions(image_format: str) -> list:
+    return {
+        "all": ['.png', '.jpg', '.jpeg', '.webp', '.gif'],
+        "png": ['.png'],
+        "jpg": ['.jpg', '.jpeg']
+    }.get(image_format, ['.png', '.jpg', '.jpeg'])
+
+def iter_images(url: str, image_format: str, headers: dict, limit: int = None,
+                cancel: CancelToken = None, progress: ProgressReporter = None) -> Iterator[str]:
+    """
+    Yield matching image URLs from a webpage as they are parsed.
+    
+    The page is streamed through an event parser, so once `limit` matching
+    URLs have been yielded the rest of the page is neither downloaded nor
+    parsed. Selenium is only used when the static page has no match at all.
+    
+    Args:
+        url (str): The URL to scrape images from
+        image_format (str): Filter for specific image format ("all", "png", "jpg")
+        headers (dict): HTTP headers for requests
+        limit (int): Stop after this many matching URLs; None for no limit
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
+    
+    Yields:
+        str: Absolute image URL
+    """
+    if limit is not None and limit <= 0:
+        return
+    allowed_extensions = _allowed_extensions(image_format)
+    found = 0
+    
+    def matches(img_url):
+        full_url = urljoin(url, img_url)
+        return full_url if any(full_url.lower().endswith(ext) for ext in allowed_extensions) else None
+    
+    response = fetch(url, headers=headers, stream=True, cancel=cancel)
+    response.raise_for_status()
+    events = stream_events(response, _ImageStreamParser(), cancel, progress)
+    try:
+        for img_url in events:
+            full_url = matches(img_url)
+            if full_url:
+                yield full_url
+                found += 1
+                report_items(progress, found, limit)
+                if limit is not None and found >= limit:
+                    return
+    finally:
+        events.close()
+    
+    if found:
+        return
+    logger.info(f"No images found with BS4 at {url}, trying Selenium")
+    # Selenium is only needed for this fallback, so it is imported on first use
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.common.by import By
+    report_stage(progress, "Rendering page in Chrome")
+    with lease_driver(cancel=cancel) as driver:
+        driver.get(url)
+        wait_until(driver, 10, EC.presence_of_element_located((By.TAG_NAME, "img")), cancel)
+        page_source = driver.page_source
+    parser = _ImageStreamParser()
+    parser.feed(page_source)
+    parser.close()
+    for img_url in parser.events:
+        full_url = matches(img_url)
+        if full_url:
+            yield full_url
+            found += 1
+            report_items(progress, found, limit)
+            if limit is not None and found >= limit:
+                return
+
+def scrape_images(url: str, image_format: str, headers: dict, limit: int = None,
+                  cancel: CancelToken = None, progress: ProgressReporter = None) -> list:
     """
     Scrape image URLs from a webpage.
     
@@ -20,50 +103,19 @@ def scrape_images(url: str, image_format: str, headers: dict) -> list:
         url (str): The URL to scrape images from
         image_format (str): Filter for specific image format ("all", "png", "jpg")
         headers (dict): HTTP headers for requests
+        limit (int): Stop once this many matching URLs were found; None for no limit
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
     
     Returns:
         list: List of image URLs or None if unsuccessful
     """
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        images = soup.find_all(['img', 'image'])
-        image_urls = []
-        
-        # Define allowed extensions based on format
-        allowed_extensions = {
-            "all": ['.png', '.jpg', '.jpeg', '.webp', '.gif'],
-            "png": ['.png'],
-            "jpg": ['.jpg', '.jpeg']
-        }.get(image_format, ['.png', '.jpg', '.jpeg'])
-
-        for img in images:
-            img_url = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-            if img_url:
-                full_url = urljoin(url, img_url)
-                if any(full_url.lower().endswith(ext) for ext in allowed_extensions):
-                    image_urls.append(full_url)
-        
-        if not image_urls:
-            logger.info(f"No images found with BS4 at {url}, trying Selenium")
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-            driver.get(url)
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "img")))
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            images = soup.find_all(['img', 'image'])
-            for img in images:
-                img_url = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-                if img_url:
-                    full_url = urljoin(url, img_url)
-                    if any(full_url.lower().endswith(ext) for ext in allowed_extensions):
-                        image_urls.append(full_url)
-            driver.quit()
-        
+        image_urls = list(iter_images(url, image_format, headers, limit, cancel, progress))
         return image_urls if image_urls else None
-    except requests.exceptions.RequestException as e:
+    except CancelledError:
+        raise
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
     except Exception as e:
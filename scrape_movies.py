@@ -1,42 +1,106 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+from requests.exceptions import RequestException
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+from http_client import fetch
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_stage
+from parsers import make_soup
+from lookup import PREFETCH_CANDIDATES, Candidates, prefetch_cover
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_movie_details(movie_name: str) -> dict:
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+}
+
+# IMDb image URLs carry their resize options after "._V1_"; search results link tiny thumbnails
+_IMAGE_OPTIONS = re.compile(r"\._V1_[^/]*(\.\w+)$")
+
+def poster_from_thumbnail(src: str, height: int = 600) -> Optional[str]:
     """
-    Scrape movie details from IMDb.
+    Turn a search result thumbnail URL into a poster URL of the given height.
+    
+    Args:
+        src (str): Thumbnail URL from the search results
+        height (int): Poster height in pixels
+    
+    Returns:
+        str: Poster URL, or None if `src` has no IMDb resize options to rewrite
+    """
+    if not _IMAGE_OPTIONS.search(src):
+        return None
+    return _IMAGE_OPTIONS.sub(rf"._V1_UY{height}\1", src)
+
+def search_movies(movie_name: str, limit: int = PREFETCH_CANDIDATES, cancel: CancelToken = None,
+                  progress: ProgressReporter = None) -> List[dict]:
+    """
+    Search IMDb and parse the result list.
     
     Args:
         movie_name (str): Name of the movie to search for
+        limit (int): Maximum number of results to return
+        cancel (CancelToken): Aborts the search when cancelled
+        progress (ProgressReporter): Receives download progress
     
     Returns:
-        dict: Movie details or error message
+        list: Dicts with "movie_link" and "poster_url" ("N/A" unless the result has a resizable thumbnail)
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-    }
+    search_url = f"https://www.imdb.com/find?q={movie_name.replace(' ', '+')}&ref_=nv_sr_sm"
+    report_stage(progress, "Searching IMDb")
+    search_response = fetch(search_url, headers=HEADERS, cancel=cancel, progress=progress)
+    search_response.raise_for_status()
+    search_soup = make_soup(search_response.content)
+    
+    movies = []
+    for result in search_soup.select('.ipc-metadata-list-summary-item')[:limit]:
+        link_elem = result.select_one('a')
+        if not link_elem:
+            continue
+        thumbnail_elem = result.select_one('img.ipc-image')
+        poster_url = poster_from_thumbnail(thumbnail_elem['src']) if thumbnail_elem and thumbnail_elem.get('src') else None
+        # Without a resizable thumbnail the poster is taken from the movie page instead
+        movies.append({
+            "movie_link": "https://www.imdb.com" + link_elem.get('href', ''),
+            "poster_url": poster_url or "N/A"
+        })
+    return movies
+
+def load_movie_details(movie: dict, cover_size: Tuple[int, int] = None, cancel: CancelToken = None,
+                       progress: ProgressReporter = None) -> Tuple[dict, Optional[Future]]:
+    """
+    Scrape a movie page found by search_movies.
+    
+    When the search result had a thumbnail, the poster is fetched alongside
+    the movie page rather than after it. The details are returned without
+    waiting for the poster.
+    
+    Args:
+        movie (dict): One result of search_movies
+        cover_size (tuple): Thumbnail size to prefetch the poster at; None skips the poster
+        cancel (CancelToken): Aborts the lookup when cancelled
+        progress (ProgressReporter): Receives download progress of the movie page
+    
+    Returns:
+        tuple: Movie details or error message, and the poster prefetch (None if there is none)
+    """
+    movie_url = movie["movie_link"]
+    poster = prefetch_cover(movie["poster_url"], cover_size, cancel=cancel)
     try:
-        search_url = f"https://www.imdb.com/find?q={movie_name.replace(' ', '+')}&ref_=nv_sr_sm"
-        search_response = requests.get(search_url, headers=headers, timeout=10)
-        search_response.raise_for_status()
-        search_soup = BeautifulSoup(search_response.content, 'html.parser')
-        first_result = search_soup.select_one('.ipc-metadata-list-summary-item a')
-        
-        if not first_result:
-            return {"error": "No movie found with that name."}
-        
-        movie_url = "https://www.imdb.com" + first_result.get('href', '')
-        movie_response = requests.get(movie_url, headers=headers, timeout=10)
+        report_stage(progress, "Loading movie page")
+        movie_response = fetch(movie_url, headers=HEADERS, cancel=cancel, progress=progress)
         movie_response.raise_for_status()
-        soup = BeautifulSoup(movie_response.content, 'html.parser')
+        soup = make_soup(movie_response.content)
         
         title_elem = soup.select_one('h1')
         title = title_elem.text.strip() if title_elem else "N/A"
         
-        poster_elem = soup.select_one('img.ipc-image')
-        poster_url = poster_elem.get('src', "N/A") if poster_elem else "N/A"
+        poster_url = movie["poster_url"]
+        if poster_url == "N/A":
+            poster_elem = soup.select_one('img.ipc-image')
+            poster_url = poster_elem.get('src', "N/A") if poster_elem else "N/A"
+            poster = prefetch_cover(poster_url, cover_size, cancel=cancel)
         
         year_elem = soup.select_one('a[href*="/releaseinfo"]')
         year = year_elem.text.strip() if year_elem else "N/A"
@@ -60,13 +124,67 @@ def scrape_movie_details(movie_name: str) -> dict:
             "movie_link": movie_url
         }
         
-        logger.info(f"Scraped movie details for '{movie_name}': {movie_details}")
-        return movie_details
-    except requests.exceptions.RequestException as e:
+        logger.info(f"Scraped movie details for {movie_url}: {movie_details}")
+        return movie_details, poster
+    except CancelledError:
+        raise
+    except RequestException as e:
+        error_msg = {"error": f"Network error: {e}"}
+        logger.error(f"Network error in load_movie_details: {error_msg}")
+        return error_msg, None
+    except Exception as e:
+        error_msg = {"error": f"An unexpected error occurred: {e}"}
+        logger.error(f"Unexpected error in load_movie_details: {error_msg}")
+        return error_msg, None
+
+def lookup_movies(movie_name: str, top_k: int = PREFETCH_CANDIDATES, cover_size: Tuple[int, int] = None,
+                  cancel: CancelToken = None, progress: ProgressReporter = None) -> Candidates:
+    """
+    Search IMDb and load the top results' details concurrently.
+    
+    Args:
+        movie_name (str): Name of the movie to search for
+        top_k (int): Number of results to load
+        cover_size (tuple): Thumbnail size to prefetch posters at; None skips posters
+        cancel (CancelToken): Aborts the search and every detail load when cancelled
+        progress (ProgressReporter): Receives progress of the search and the best match
+    
+    Returns:
+        Candidates: Details of each result, or a single error message
+    """
+    try:
+        movies = search_movies(movie_name, top_k, cancel=cancel, progress=progress)
+    except CancelledError:
+        raise
+    except RequestException as e:
         error_msg = {"error": f"Network error: {e}"}
-        logger.error(f"Network error in scrape_movie_details: {error_msg}")
-        return error_msg
+        logger.error(f"Network error in lookup_movies: {error_msg}")
+        return Candidates.of(error_msg)
     except Exception as e:
         error_msg = {"error": f"An unexpected error occurred: {e}"}
-        logger.error(f"Unexpected error in scrape_movie_details: {error_msg}")
-        return error_msg
\ No newline at end of file
+        logger.error(f"Unexpected error in lookup_movies: {error_msg}")
+        return Candidates.of(error_msg)
+    if not movies:
+        return Candidates.of({"error": "No movie found with that name."})
+    
+    def load(movie):
+        # Only the best match reports progress; the rest load quietly behind it
+        return load_movie_details(movie, cover_size, cancel=cancel, progress=progress if movie is movies[0] else None)
+    
+    return Candidates.load(movies, load)
+
+def scrape_movie_details(movie_name: str, cancel: CancelToken = None,
+                         progress: ProgressReporter = None, cover_size: Tuple[int, int] = None) -> dict:
+    """
+    Scrape movie details from IMDb.
+    
+    Args:
+        movie_name (str): Name of the movie to search for
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
+        cover_size (tuple): Thumbnail size to prefetch the poster at; None skips the poster
+    
+    Returns:
+        dict: Movie details or error message
+    """
+    return lookup_movies(movie_name, 1, cover_size, cancel=cancel, progress=progress).get(0)
@@ -1,45 +1,59 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from http_client import fetch
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_items
+from result_cache import cached_parse
+from parsers import make_soup
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_news_headlines(url: str) -> tuple:
+def _parse_headlines(content: bytes) -> list:
+    soup = make_soup(content)
+    headlines = soup.find_all(['h1', 'h2', 'h3'])
+    
+    if not headlines:
+        headlines = soup.find_all('a', class_=lambda x: x and ('excerpt' in x.lower() or 'title' in x.lower() or 'headline' in x.lower()))
+    
+    if not headlines:
+        headlines = soup.find_all('a')
+    
+    def is_valid_headline(text):
+        if len(text) < 15 or any(phrase.lower() in text.lower() for phrase in ['home', 'about', 'contact', 'login', 'register']):
+            return False
+        return True
+    
+    headline_texts = []
+    for headline in headlines:
+        text = headline.get_text().strip()
+        if text and is_valid_headline(text) and text not in headline_texts:
+            headline_texts.append(text)
+    
+    return headline_texts
+
+def scrape_news_headlines(url: str, cancel: CancelToken = None,
+                          progress: ProgressReporter = None) -> tuple:
     """
     Scrape news headlines from a webpage.
     
     Args:
         url (str): The URL to scrape headlines from
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
     
     Returns:
         tuple: Tuple of headline strings or None if unsuccessful
     """
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = fetch(url, headers=headers, cancel=cancel, progress=progress)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        headlines = soup.find_all(['h1', 'h2', 'h3'])
-        
-        if not headlines:
-            headlines = soup.find_all('a', class_=lambda x: x and ('excerpt' in x.lower() or 'title' in x.lower() or 'headline' in x.lower()))
-        
-        if not headlines:
-            headlines = soup.find_all('a')
-        
-        def is_valid_headline(text):
-            if len(text) < 15 or any(phrase.lower() in text.lower() for phrase in ['home', 'about', 'contact', 'login', 'register']):
-                return False
-            return True
-        
-        headline_texts = []
-        for headline in headlines:
-            text = headline.get_text().strip()
-            if text and is_valid_headline(text) and text not in headline_texts:
-                headline_texts.append(text)
-        
+        headline_texts = cached_parse("scrape_news_headlines", {}, response.content, _parse_headlines)
+        report_items(progress, len(headline_texts or ()))
         return tuple(headline_texts) if headline_texts else None
-    except requests.exceptions.RequestException as e:
+    except CancelledError:
+        raise
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
     except Exception as e:
@@ -1,81 +1,88 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from http_client import fetch
+from result_cache import cached_parse
+from parsers import make_soup
+from cancellation import CancelToken, CancelledError, check_cancelled
+from progress import ProgressReporter, report_items, report_stage
 from urllib.parse import urljoin
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 import os
+from driver_pool import lease_driver, wait_until
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_pdf_links(url: str) -> list:
+def _parse_pdf_links(content: bytes) -> list:
+    soup = make_soup(content)
+    pdf_links = []
+    
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if href.lower().endswith('.pdf') and href.startswith(('http://', 'https://')):
+            pdf_name = href.split('/')[-1].split('?')[0]
+            pdf_links.append({'url': href, 'name': pdf_name})
+    
+    seen_urls = set()
+    return [link for link in pdf_links if not (link['url'] in seen_urls or seen_urls.add(link['url']))]
+
+def scrape_pdf_links(url: str, cancel: CancelToken = None,
+                     progress: ProgressReporter = None) -> list:
     """
     Scrape PDF links from a webpage.
     
     Args:
         url (str): The URL to scrape PDF links from
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
     
     Returns:
         list: List of dictionaries with PDF URLs and names or None if unsuccessful
     """
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/91.0.4472.124"}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = fetch(url, headers=headers, cancel=cancel, progress=progress)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        pdf_links = []
-        
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if href.lower().endswith('.pdf') and href.startswith(('http://', 'https://')):
-                pdf_name = href.split('/')[-1].split('?')[0]
-                pdf_links.append({'url': href, 'name': pdf_name})
-        
-        if pdf_links:
-            seen_urls = set()
-            unique_pdf_links = [link for link in pdf_links if not (link['url'] in seen_urls or seen_urls.add(link['url']))]
+        unique_pdf_links = cached_parse("scrape_pdf_links", {}, response.content, _parse_pdf_links)
+        report_items(progress, len(unique_pdf_links or ()))
+        if unique_pdf_links:
             return unique_pdf_links
         
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         logger.error(f"BS4 request failed: {e}")
 
-    logger.info("No PDFs found with BS4, falling back to Selenium")
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    check_cancelled(cancel)
 
-    driver = None
+    logger.info("No PDFs found with BS4, falling back to Selenium")
+    report_stage(progress, "Rendering page in Chrome")
     try:
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-        driver.set_page_load_timeout(30)
-        logger.info(f"Navigating to URL: {url}")
-        driver.get(url)
+        # Selenium is only needed for this fallback, so it is imported on first use
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.common.by import By
+        with lease_driver(page_load_timeout=30, cancel=cancel) as driver:
+            logger.info(f"Navigating to URL: {url}")
+            driver.get(url)
 
-        try:
-            potential_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Documents') or contains(text(), 'Resources') or contains(text(), 'Show More')]")
-            for button in potential_buttons:
-                try:
-                    logger.info(f"Clicking button with text: {button.text}")
-                    button.click()
-                    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
-                    break
-                except Exception as e:
-                    logger.warning(f"Could not click button '{button.text}': {e}")
-        except Exception as e:
-            logger.warning(f"No relevant buttons found to click: {e}")
+            try:
+                potential_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Documents') or contains(text(), 'Resources') or contains(text(), 'Show More')]")
+                for button in potential_buttons:
+                    try:
+                        logger.info(f"Clicking button with text: {button.text}")
+                        button.click()
+                        wait_until(driver, 10, EC.presence_of_element_located((By.TAG_NAME, "a")), cancel)
+                        break
+                    except CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.warning(f"Could not click button '{button.text}': {e}")
+            except CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"No relevant buttons found to click: {e}")
 
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "a")))
-        logger.info("Page loaded successfully with Selenium")
+            wait_until(driver, 15, EC.presence_of_element_located((By.TAG_NAME, "a")), cancel)
+            logger.info("Page loaded successfully with Selenium")
+            page_source = driver.page_source
         
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        soup = make_soup(page_source)
         pdf_links = []
         for link in soup.find_all('a', href=True):
             href = link['href']
@@ -88,10 +95,10 @@ def scrape_pdf_links(url: str) -> list:
 
         seen_urls = set()
         unique_pdf_links = [link for link in pdf_links if not (link['url'] in seen_urls or seen_urls.add(link['url']))]
+        report_items(progress, len(unique_pdf_links))
         return unique_pdf_links if unique_pdf_links else None
+    except CancelledError:
+        raise
     except Exception as e:
         logger.error(f"Error fetching PDFs with Selenium: {e}")
-        return None
-    finally:
-        if driver:
-            driver.quit()
\ No newline at end of file
+        return None
\ No newline at end of file
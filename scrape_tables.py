@@ -1,45 +1,307 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from http_client import fetch
+from result_cache import cached_parse
+from parsers import IMPLIED_END_TAGS, make_soup
+from bs4 import SoupStrainer
+from html_stream import EventParser, stream_events
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_items
+from typing import Iterator, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_tables(url: str) -> list:
+def _parse_tables(content: bytes) -> list:
+    # Only <table> subtrees are needed, so skip building the rest of the DOM
+    soup = make_soup(content, parse_only=SoupStrainer('table'))
+    tables = soup.find_all('table')
+    table_data = []
+    
+    for table in tables:
+        headers = table.find_all('th')
+        header_row = [header.text.strip() for header in headers] if headers else []
+        rows = table.find_all('tr')
+        table_rows = []
+        start_idx = 1 if header_row else 0
+        
+        for row in rows[start_idx:]:
+            cols = row.find_all('td')
+            if cols:
+                table_rows.append([col.text.strip() for col in cols])
+        
+        if header_row:
+            table_rows.insert(0, header_row)
+        if table_rows:
+            table_data.append(table_rows)
+    
+    return table_data
+
+# Elements bs4 never gives children, so their end tags close nothing
+_VOID_TAGS = {'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr', 'image',
+              'img', 'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid', 'param', 'source',
+              'spacer', 'track', 'wbr'}
+# Elements whose text .text leaves out
+_HIDDEN_TEXT_TAGS = {'script', 'style', 'rt', 'rp'}
+# Elements inside which bs4 keeps whitespace-only strings as they are
+_PRESERVE_WHITESPACE_TAGS = {'pre', 'textarea'}
+
+class _TableStreamParser(EventParser):
+    """
+    Emits ("row", table_index, cells) and ("end", table_index, header) events.
+
+    Builds the same tables as _parse_tables without keeping a DOM: open
+    elements are tracked only inside tables, implied end tags close by the
+    rules make_soup applies, and every lookup _parse_tables does with
+    find_all (nested tables included) is mirrored by recording each cell
+    in all of its open rows and tables. Table indexes follow the order of
+    the <table> start tags. Text is split into strings at every tag and
+    comment, and whitespace-only strings collapse as bs4 collapses them.
+
+    A table's first row is left out when the table has any <th>, which is
+    only settled once a <th> shows up or the table ends; until then its
+    rows are held back. The header row is emitted with the "end" event.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.stack = []       # (tag, record) of every open element inside a table
+        self.table_count = 0
+        self.hidden = 0       # open elements in _HIDDEN_TEXT_TAGS
+        self.preserve = 0     # open elements in _PRESERVE_WHITESPACE_TAGS
+        self.text = []        # pieces of the string being read
+
+    def handle_starttag(self, tag, attrs):
+        self._end_text()
+        if not self.stack and tag != 'table':
+            return
+        closes, stops = IMPLIED_END_TAGS.get(tag, ((), ()))
+        while closes:
+            name = next((name for name, _ in reversed(self.stack) if name in closes or name in stops), None)
+            if name is None or name in stops:
+                break
+            self.handle_endtag(name)
+        record = None
+        if tag == 'table':
+            record = {"index": self.table_count, "headers": [], "rows": [], "emitted": 0}
+            self.table_count += 1
+        elif tag == 'tr':
+            record = {"cells": [], "closed": False}
+            for name, table in self.stack:
+                if name == 'table':
+                    table["rows"].append(record)
+        elif tag in ('td', 'th'):
+            record = []
+            for name, parent in self.stack:
+                if tag == 'td' and name == 'tr':
+                    parent["cells"].append(record)
+                elif tag == 'th' and name == 'table':
+                    parent["headers"].append(record)
+                    self._flush_rows(parent)
+        if tag in _VOID_TAGS:
+            return
+        self.stack.append((tag, record))
+        if tag in _HIDDEN_TEXT_TAGS:
+            self.hidden += 1
+        elif tag in _PRESERVE_WHITESPACE_TAGS:
+            self.preserve += 1
+
+    def handle_endtag(self, tag):
+        self._end_text()
+        if tag in _VOID_TAGS:
+            return
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                break
+        else:
+            return
+        while len(self.stack) > depth:
+            self._pop()
+
+    def handle_data(self, data):
+        if self.stack and not self.hidden:
+            self.text.append(data)
+
+    def handle_comment(self, data):
+        self._end_text()
+
+    def handle_decl(self, decl):
+        self._end_text()
+
+    def handle_pi(self, data):
+        self._end_text()
+
+    def unknown_decl(self, data):
+        self._end_text()
+
+    def close(self):
+        super().close()
+        self._end_text()
+        # Like bs4, elements still open at the end of the page end there
+        while self.stack:
+            self._pop()
+
+    def _end_text(self):
+        if not self.text:
+            return
+        text = "".join(self.text)
+        self.text = []
+        if not self.preserve and not text.strip(' \n\t\f\r'):
+            text = '\n' if '\n' in text else ' '
+        for name, record in self.stack:
+            if name in ('td', 'th'):
+                record.append(text)
+
+    def _pop(self):
+        name, record = self.stack.pop()
+        if name in _HIDDEN_TEXT_TAGS:
+            self.hidden -= 1
+        elif name in _PRESERVE_WHITESPACE_TAGS:
+            self.preserve -= 1
+        elif name == 'tr':
+            record["closed"] = True
+            for parent_name, table in self.stack:
+                if parent_name == 'table':
+                    self._flush_rows(table)
+        elif name == 'table':
+            self._flush_rows(record, final=True)
+            header = ["".join(cell).strip() for cell in record["headers"]]
+            self.events.append(("end", record["index"], header))
+
+    def _flush_rows(self, table, final=False):
+        rows = table["rows"]
+        if table["emitted"] == 0 and rows:
+            if table["headers"]:
+                table["emitted"] = 1
+            elif not final:
+                return
+        while table["emitted"] < len(rows) and (final or rows[table["emitted"]]["closed"]):
+            row = rows[table["emitted"]]
+            # Emitted rows are dropped so memory stays bounded by the open ones
+            rows[table["emitted"]] = None
+            table["emitted"] += 1
+            if row["cells"]:
+                self.events.append(("row", table["index"], ["".join(cell).strip() for cell in row["cells"]]))
+
+def _table_events(url: str, headers: dict, cancel: CancelToken, progress: ProgressReporter):
+    response = fetch(url, headers=headers, stream=True, cancel=cancel)
+    response.raise_for_status()
+    return response, stream_events(response, _TableStreamParser(), cancel, progress)
+
+def iter_table_rows(url: str, headers: dict = None, cancel: CancelToken = None,
+                    progress: ProgressReporter = None) -> Iterator[Tuple[int, list, bool]]:
+    """
+    Stream table rows from a webpage without building a DOM.
+    
+    The response is read in chunks and fed to an event-based parser, so
+    memory stays bounded by the rows still open rather than the page. The
+    rows are those scrape_tables returns; a table's header row is only
+    complete when the table ends, so it is yielded after the table's other
+    rows. Stopping the iteration closes the connection.
+    
+    Args:
+        url (str): The URL to scrape tables from
+        headers (dict): HTTP headers for requests
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
+    
+    Yields:
+        tuple: (table_index, row cells, is_header)
+    """
+    _, events = _table_events(url, headers, cancel, progress)
+    for kind, table_index, cells in events:
+        if kind == "row":
+            yield table_index, cells, False
+        elif cells:
+            yield table_index, cells, True
+
+def _collect_tables(events: Iterator, max_tables: int = None, progress: ProgressReporter = None) -> Iterator[list]:
+    # Inner tables end before the tables around them, so finished tables wait for every earlier one
+    pending = {}
+    finished = set()
+    next_index = 0
+    yielded = 0
+    try:
+        for kind, table_index, cells in events:
+            if kind == "row":
+                pending.setdefault(table_index, []).append(cells)
+                continue
+            if cells:
+                pending.setdefault(table_index, []).insert(0, cells)
+            finished.add(table_index)
+            while next_index in finished:
+                finished.discard(next_index)
+                table_rows = pending.pop(next_index, None)
+                next_index += 1
+                if not table_rows:
+                    continue
+                yield table_rows
+                yielded += 1
+                report_items(progress, yielded, max_tables)
+                if max_tables is not None and yielded >= max_tables:
+                    return
+    finally:
+        events.close()
+
+def iter_tables(url: str, max_tables: int = None, headers: dict = None, cancel: CancelToken = None,
+                progress: ProgressReporter = None) -> Iterator[list]:
+    """
+    Stream complete tables from a webpage, stopping after max_tables.
+    
+    Yields the tables scrape_tables returns, in the same order. The page
+    goes through the HTTP cache; one served from it is parsed through the
+    result cache as well.
+    
+    Args:
+        url (str): The URL to scrape tables from
+        max_tables (int): Stop reading the page once this many tables were yielded
+        headers (dict): HTTP headers for requests
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
+    
+    Yields:
+        list: One table as a list of rows, header row first
+    """
+    if max_tables is not None and max_tables <= 0:
+        return
+    response, events = _table_events(url, headers, cancel, progress)
+    if not getattr(response, "from_cache", False):
+        yield from _collect_tables(events, max_tables, progress)
+        return
+    try:
+        tables = cached_parse("scrape_tables", {"max_tables": max_tables}, response.content,
+                              lambda _: list(_collect_tables(events, max_tables)))
+    finally:
+        events.close()
+    for count, table_rows in enumerate(tables or (), 1):
+        yield table_rows
+        report_items(progress, count, max_tables)
+
+def scrape_tables(url: str, max_tables: int = None, cancel: CancelToken = None,
+                  progress: ProgressReporter = None) -> list:
     """
     Scrape table data from a webpage.
     
     Args:
         url (str): The URL to scrape tables from
+        max_tables (int): If given, stream the page without a DOM and stop after this many tables
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
     
     Returns:
         list: List of tables (each table as a list of rows) or None if unsuccessful
     """
     try:
-        response = requests.get(url, timeout=10)
+        if max_tables is not None:
+            table_data = list(iter_tables(url, max_tables, cancel=cancel, progress=progress))
+            return table_data if table_data else None
+        response = fetch(url, cancel=cancel, progress=progress)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        tables = soup.find_all('table')
-        table_data = []
-        
-        for table in tables:
-            headers = table.find_all('th')
-            header_row = [header.text.strip() for header in headers] if headers else []
-            rows = table.find_all('tr')
-            table_rows = []
-            start_idx = 1 if header_row else 0
-            
-            for row in rows[start_idx:]:
-                cols = row.find_all('td')
-                if cols:
-                    table_rows.append([col.text.strip() for col in cols])
-            
-            if header_row:
-                table_rows.insert(0, header_row)
-            if table_rows:
-                table_data.append(table_rows)
-        
+        table_data = cached_parse("scrape_tables", {}, response.content, _parse_tables)
+        report_items(progress, len(table_data or ()))
         return table_data if table_data else None
-    except requests.exceptions.RequestException as e:
+    except CancelledError:
+        raise
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
     except Exception as e:
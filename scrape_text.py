@@ -1,27 +1,40 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from http_client import fetch
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_items
+from result_cache import cached_parse
+from parsers import make_soup
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_text(url: str, headers: dict) -> str:
+def _extract_text(content: bytes) -> str:
+    soup = make_soup(content)
+    return soup.get_text(separator="\n", strip=True)
+
+def scrape_text(url: str, headers: dict, cancel: CancelToken = None,
+                progress: ProgressReporter = None) -> str:
     """
     Scrape text content from a webpage.
     
     Args:
         url (str): The URL to scrape text from
         headers (dict): HTTP headers for requests
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
     
     Returns:
         str: Extracted text content or None if unsuccessful
     """
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = fetch(url, headers=headers, cancel=cancel, progress=progress)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        text_content = soup.get_text(separator="\n", strip=True)
+        text_content = cached_parse("scrape_text", {}, response.content, _extract_text)
+        report_items(progress, len(text_content.splitlines()) if text_content else 0)
         return text_content if text_content else None
-    except requests.exceptions.RequestException as e:
+    except CancelledError:
+        raise
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
     except Exception as e:
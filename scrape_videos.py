@@ -1,19 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from http_client import fetch
+from parsers import make_soup
+from cancellation import CancelToken, CancelledError
+from progress import ProgressReporter, report_items, report_stage
 from urllib.parse import urljoin, urlparse
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_driver, wait_until
 import logging
 
 logger = logging.getLogger(__name__)
 
-def scrape_videos(url: str, video_format: str, headers: dict) -> tuple:
+def scrape_videos(url: str, video_format: str, headers: dict, cancel: CancelToken = None,
+                  progress: ProgressReporter = None) -> tuple:
     """
     Scrape video URLs from a webpage.
     
@@ -21,14 +19,16 @@ def scrape_videos(url: str, video_format: str, headers: dict) -> tuple:
         url (str): The URL to scrape videos from
         video_format (str): Filter for specific video format ("all", "mp4", etc.)
         headers (dict): HTTP headers for requests
+        cancel (CancelToken): Aborts the scrape when cancelled
+        progress (ProgressReporter): Receives download and parse progress
     
     Returns:
         tuple: Tuple of video URLs or None if unsuccessful
     """
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = fetch(url, headers=headers, cancel=cancel, progress=progress)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content)
         videos = soup.find_all('video')
         video_urls = []
         
@@ -54,14 +54,18 @@ def scrape_videos(url: str, video_format: str, headers: dict) -> tuple:
                             video_url = urljoin(url, video_url)
                         video_urls.append(video_url)
         
+        report_items(progress, len(video_urls))
         if not video_urls:
             logger.info(f"No videos found with BS4 at {url}, trying Selenium")
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-            driver.get(url)
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "video")))
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            report_stage(progress, "Rendering page in Chrome")
+            # Selenium is only needed for this fallback, so it is imported on first use
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.webdriver.common.by import By
+            with lease_driver(cancel=cancel) as driver:
+                driver.get(url)
+                wait_until(driver, 10, EC.presence_of_element_located((By.TAG_NAME, "video")), cancel)
+                page_source = driver.page_source
+            soup = make_soup(page_source)
             videos = soup.find_all('video')
             for video in videos:
                 video_sources = video.find_all('source')
@@ -75,10 +79,12 @@ def scrape_videos(url: str, video_format: str, headers: dict) -> tuple:
                             if not video_url.startswith(('http://', 'https://')):
                                 video_url = urljoin(url, video_url)
                             video_urls.append(video_url)
-            driver.quit()
+            report_items(progress, len(video_urls))
         
         return tuple(video_urls) if video_urls else None
-    except requests.exceptions.RequestException as e:
+    except CancelledError:
+        raise
+    except RequestException as e:
         logger.error(f"Error fetching {url}: {e}")
         return None
     except Exception as e:
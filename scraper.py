@@ -0,0 +1,75 @@
+"""
+Headless command-line entry point for the scrape_* modules.
+
+Usage:
+    python -m scraper text https://example.com
+    python -m scraper tables -f urls.txt --concurrency 32 > tables.jsonl
+    python -m scraper book -f catalog.csv --concurrency 8 > books.jsonl
+
+Each result is written to stdout as one JSON line. Nothing from the GUI
+stack (customtkinter, PIL) is imported, and Selenium is only loaded if a
+scraper actually falls back to it.
+"""
+import argparse
+import json
+import logging
+import sys
+
+from registry import SCRAPERS, get_scraper
+
+logger = logging.getLogger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m scraper", description="Scrape web pages without the GUI.")
+    parser.add_argument("data_type", choices=sorted(SCRAPERS), help="What to scrape")
+    parser.add_argument("targets", nargs="*", help="URLs, or search terms for movie/book/ebay")
+    parser.add_argument("-f", "--file", help="Read targets from a file, one per line or a CSV title column ('-' for stdin)")
+    parser.add_argument("--format", default="all", help="Image/video format filter (default: all)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Scrapes in flight overall (default: 16)")
+    parser.add_argument("--per-host", type=int, default=4, help="Scrapes in flight per host (default: 4)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log progress to stderr")
+    return parser
+
+
+def _write(target: str, result, error: str = None) -> None:
+    record = {"target": target, "result": result, "error": error}
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def _failed(result, error: str = None) -> bool:
+    return bool(error) or not result or (isinstance(result, dict) and "error" in result)
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, stream=sys.stderr)
+
+    targets = list(args.targets)
+    if args.file == "-":
+        targets += [line.strip() for line in sys.stdin if line.strip()]
+    elif args.file:
+        from batch import read_targets
+        targets += read_targets(args.file)
+    if not targets:
+        logger.error("No targets given")
+        return 2
+
+    failures = 0
+    if len(targets) == 1:
+        scraper = get_scraper(args.data_type, format=args.format)
+        result = scraper(targets[0])
+        _write(targets[0], result)
+        failures += _failed(result)
+    else:
+        from batch import iter_batch
+        for item in iter_batch(targets, args.data_type, format=args.format,
+                               concurrency=args.concurrency, per_host=args.per_host):
+            _write(item.target, item.result, item.error)
+            failures += _failed(item.result, item.error)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
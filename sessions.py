@@ -0,0 +1,159 @@
+import itertools
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urlparse
+import logging
+from cancellation import CancelToken, CancelledError
+from image_store import ImageStore
+from progress import ProgressReporter, ProgressState
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Shown in front of a session's tab title
+STATE_MARKS = {QUEUED: "…", RUNNING: "⟳", DONE: "✓", FAILED: "✗", CANCELLED: "–"}
+
+# In-memory budget of each session's original images; older ones spill to disk
+SESSION_IMAGE_MEMORY_BYTES = 32 * 1024 * 1024
+
+# Attribute of ScrapeSession holding the result of each data type
+RESULT_FIELDS = {
+    "Images": "all_image_urls",
+    "Text": "text_content",
+    "Tables": "table_data",
+    "Movie Details": "movie_details",
+    "Book Details": "book_details",
+    "Videos": "video_urls",
+    "eBay Products": "ebay_products",
+    "News Headlines": "news_headlines",
+    "PDF Links": "pdf_links",
+    "Book List": "bulk_results",
+    "Movie List": "bulk_results",
+}
+
+
+class ScrapeSession:
+    """
+    One scrape and everything it produced.
+
+    Each GUI tab shows one session. Sessions own their results, their
+    CancelToken and their progress reporter, so a slow scrape keeps
+    running in its tab while others are started and looked at.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, url: str, data_type: str, options: Dict = None):
+        """
+        Args:
+            url (str): URL or search term to scrape
+            data_type (str): GUI label of the scraper to run
+            options (dict): Per-type settings read from the form (format, limit, max_tables)
+        """
+        self.id = next(self._ids)
+        self.url = url
+        self.data_type = data_type
+        self.options = dict(options or {})
+        self.state = QUEUED
+        self.error = None
+        self.cancel = CancelToken()
+        self.progress = ProgressReporter()
+        self.progress_state = ProgressState()
+        self.future = None
+
+        self.all_image_urls: List[str] = []
+        self.text_content: str = ""
+        self.table_data: List[List[List[str]]] = []
+        self.movie_details: Dict = {}
+        self.book_details: Dict = {}
+        self.video_urls: Tuple[str, ...] = ()
+        self.ebay_products: List[Dict] = []
+        self.news_headlines: Tuple[str, ...] = ()
+        self.pdf_links: List[Dict] = []
+        # TitleResults of a title list lookup, appended as they arrive
+        self.bulk_results: List = []
+        # Original bytes of the gallery images, for export and preview
+        self.image_data = ImageStore(memory_max_bytes=SESSION_IMAGE_MEMORY_BYTES)
+        # Book and movie lookups keep every prefetched search result; the details fields hold the one shown
+        self.candidates = None
+        self.candidate_index = 0
+
+    @property
+    def active(self) -> bool:
+        return self.state in (QUEUED, RUNNING)
+
+    @property
+    def title(self) -> str:
+        # Host of a URL, file name of a title list, or the search term itself
+        target = urlparse(self.url).netloc or os.path.basename(self.url) or self.url
+        if len(target) > 24:
+            target = target[:21] + "..."
+        return f"{STATE_MARKS[self.state]} {self.id}. {self.data_type}: {target}"
+
+    def set_result(self, result) -> None:
+        setattr(self, RESULT_FIELDS[self.data_type], result)
+
+    def has_results(self) -> bool:
+        return any([self.all_image_urls, self.text_content, self.table_data, self.movie_details.get("name"),
+                    self.book_details.get("name"), self.video_urls, self.ebay_products, self.news_headlines,
+                    self.pdf_links, self.bulk_results])
+
+
+class SessionScheduler:
+    """
+    Runs session jobs on one shared pool of worker threads.
+
+    Jobs beyond `max_workers` wait in the pool's queue; a session
+    cancelled before its job started never runs.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape")
+
+    def submit(self, session: ScrapeSession, job: Callable[[ScrapeSession], None],
+               on_finished: Callable[[ScrapeSession], None] = None) -> Future:
+        """
+        Queue `job(session)` and track its outcome in `session.state`.
+
+        Args:
+            session (ScrapeSession): Session the job fills in
+            job (callable): Does the scrape; runs on a worker thread
+            on_finished (callable): Called with the session on the worker thread once it is done
+
+        Returns:
+            Future: The queued job
+        """
+        def run():
+            try:
+                session.cancel.raise_if_cancelled()
+                session.state = RUNNING
+                job(session)
+                session.cancel.raise_if_cancelled()
+                session.state = DONE
+            except CancelledError:
+                session.state = CANCELLED
+            except Exception as e:
+                logger.error(f"Scrape of {session.url} failed: {e}")
+                session.error = str(e)
+                session.state = FAILED
+            if on_finished is not None:
+                on_finished(session)
+
+        session.future = self._executor.submit(run)
+        return session.future
+
+    def cancel(self, session: ScrapeSession) -> None:
+        """Abort a running session, or drop it from the queue if it has not started."""
+        session.cancel.cancel()
+        if session.future is not None and session.future.cancel():
+            session.state = CANCELLED
+
+    def shutdown(self) -> None:
+        """Drop queued jobs and stop accepting new ones; running jobs end once cancelled."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The scrapers are flat top-level modules; make them importable from the tests
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
@@ -0,0 +1,61 @@
+import codecs
+import os
+
+import pytest
+
+from conftest import FIXTURES
+from html_stream import SNIFF_BYTES, iter_response_text, response_encoding
+
+
+class FakeResponse:
+    """Just enough of a streamed requests.Response for iter_response_text."""
+
+    def __init__(self, body: bytes, content_type: str = "text/html", chunk: int = 7):
+        self.body = body
+        self.headers = {"Content-Type": content_type}
+        charset = content_type.partition("charset=")[2]
+        self.encoding = charset or "ISO-8859-1"
+        self.chunk = chunk
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), self.chunk):
+            yield self.body[start:start + self.chunk]
+
+
+def decode(body: bytes, **kwargs) -> str:
+    return "".join(iter_response_text(FakeResponse(body, **kwargs)))
+
+
+def test_meta_charset_is_used_without_a_header_charset():
+    with open(os.path.join(FIXTURES, "latin1_table.html"), "rb") as f:
+        body = f.read()
+    text = decode(body)
+    assert "Café crème" in text and "Crêpe sucrée" in text
+
+
+def test_header_charset_wins_over_meta():
+    body = '<meta charset="iso-8859-1"><p>Ωμέγα</p>'.encode("utf-8")
+    assert decode(body, content_type="text/html; charset=utf-8") == body.decode("utf-8")
+
+
+@pytest.mark.parametrize("bom, encoding", [(codecs.BOM_UTF8, "utf-8"), (codecs.BOM_UTF16_LE, "utf-16-le")])
+def test_byte_order_mark_wins_over_header(bom, encoding):
+    body = bom + "<p>naïve</p>".encode(encoding)
+    assert decode(body, content_type="text/html; charset=iso-8859-1") == "<p>naïve</p>"
+
+
+def test_undeclared_non_utf8_falls_back_to_windows_1252():
+    body = "<p>“Smart quotes” and café</p>".encode("windows-1252")
+    assert decode(body) == "<p>“Smart quotes” and café</p>"
+
+
+def test_undeclared_utf8_split_across_chunks():
+    body = ("<p>" + "日本語 " * 400 + "</p>").encode("utf-8")
+    assert len(body) > SNIFF_BYTES
+    assert decode(body, chunk=5) == body.decode("utf-8")
+
+
+def test_requests_latin1_default_is_ignored():
+    response = FakeResponse("<p>€</p>".encode("utf-8"))
+    assert response.encoding == "ISO-8859-1"
+    assert response_encoding(response, response.body) == "utf-8"
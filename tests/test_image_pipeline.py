@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+pytest.importorskip("PIL")
+
+# Stands in for the GUI's main script: it records every run of its guarded entry point
+_MAIN_SCRIPT = """
+import io, os, sys
+sys.path.insert(0, {root!r})
+from PIL import Image
+import image_pipeline
+
+if __name__ == "__main__":
+    open(os.path.join({tmp!r}, "ran-main-" + str(os.getpid())), "w").close()
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 320), "red").save(buffer, format="PNG")
+    pool = image_pipeline.get_decode_pool()
+    decoded = pool.submit(image_pipeline.decode_thumbnail, buffer.getvalue(), (64, 64)).result(timeout=60)
+    assert pool.submit(os.getpid).result(timeout=60) != os.getpid()
+    image_pipeline.shutdown_decode_pool()
+    print(decoded.mode, decoded.size)
+"""
+
+
+def test_decode_workers_do_not_run_the_main_script(tmp_path):
+    script = tmp_path / "gui_main.py"
+    script.write_text(_MAIN_SCRIPT.format(root=ROOT, tmp=str(tmp_path)))
+    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=120,
+                            cwd=str(tmp_path))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["RGB", "(64,", "32)"]
+    assert len([name for name in os.listdir(tmp_path) if name.startswith("ran-main-")]) == 1
@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+# Headless modules that must stay cheap to import
+MODULES = [
+    "scrape_images",
+    "scrape_text",
+    "scrape_tables",
+    "scrape_movies",
+    "scrape_books",
+    "scrape_videos",
+    "scrape_ebay",
+    "scrape_news",
+    "scrape_pdfs",
+    "scraper",
+]
+
+# Loaded on first use only: Selenium fallbacks, chromedriver resolution, the image pipeline and the GUI
+HEAVY_MODULES = ["selenium", "webdriver_manager", "PIL", "tkinter"]
+
+# Time to import one module once requests and bs4, which every scraper needs, are loaded.
+# Each module takes ~10 ms; importing Selenium and webdriver_manager alone takes well over 100 ms.
+IMPORT_BUDGET = 0.1
+
+_PROBE = """
+import json, sys, time
+import requests, bs4
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def probe(module: str) -> dict:
+    """Import `module` in a fresh interpreter and report what it cost."""
+    output = subprocess.run([sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                            cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_skips_heavy_dependencies(module):
+    assert probe(module)["loaded"] == []
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_time_budget(module):
+    # Best of three, so a busy machine does not fail the budget
+    elapsed = min(probe(module)["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET, f"import {module} took {elapsed * 1000:.0f} ms"
@@ -0,0 +1,53 @@
+from concurrent.futures import Future
+
+import scrape_books
+import scrape_movies
+from lookup import Candidates
+
+
+def test_details_do_not_wait_for_the_cover(monkeypatch):
+    cover = Future()  # a cover download that never finishes
+    monkeypatch.setattr(scrape_books, "prefetch_cover", lambda url, size, cancel=None: cover)
+    book = {"name": "Dune", "cover_url": "http://example.test/dune.jpg", "book_link": "N/A"}
+
+    candidates = Candidates.load([book], lambda item: scrape_books.load_book_details(item, (400, 600)))
+
+    assert candidates.get(0) == book
+    assert candidates.cover(0) is cover
+
+
+def test_single_result_has_no_cover():
+    candidates = Candidates.of({"error": "No book found with that name."})
+    assert candidates.get(0) == {"error": "No book found with that name."}
+    assert candidates.cover(0) is None
+
+
+class FakeResponse:
+    def __init__(self, body: str):
+        self.content = body.encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+def test_thumbnail_without_resize_options_takes_the_poster_from_the_movie_page(monkeypatch):
+    search_page = ('<ul><li class="ipc-metadata-list-summary-item"><a href="/title/tt1/">Dune</a>'
+                   '<img class="ipc-image" src="http://example.test/thumb.jpg"></li></ul>')
+    movie_page = '<h1>Dune</h1><img class="ipc-image" src="http://example.test/poster.jpg">'
+    pages = {"https://www.imdb.com/title/tt1/": movie_page}
+    monkeypatch.setattr(scrape_movies, "fetch", lambda url, **kwargs: FakeResponse(pages.get(url, search_page)))
+    prefetched = []
+    monkeypatch.setattr(scrape_movies, "prefetch_cover",
+                        lambda url, size, cancel=None: prefetched.append(url) or None)
+
+    assert scrape_movies.poster_from_thumbnail("http://example.test/thumb.jpg") is None
+    movie = scrape_movies.search_movies("Dune")[0]
+    assert movie["poster_url"] == "N/A"
+    details, _ = scrape_movies.load_movie_details(movie, (400, 600))
+    assert details["poster_url"] == "http://example.test/poster.jpg"
+    assert prefetched[-1] == "http://example.test/poster.jpg"
+
+
+def test_thumbnail_with_resize_options_is_rewritten():
+    src = "https://m.media-amazon.com/images/M/abc._V1_QL75_UX50_CR0,0,50,74_.jpg"
+    assert scrape_movies.poster_from_thumbnail(src) == "https://m.media-amazon.com/images/M/abc._V1_UY600.jpg"
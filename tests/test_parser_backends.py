@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+import parsers
+from conftest import FIXTURES
+from scrape_news import _parse_headlines
+from scrape_pdfs import _parse_pdf_links
+from scrape_tables import _parse_tables
+from scrape_text import _extract_text
+
+pytest.importorskip("lxml")
+
+FIXTURE_PAGES = ["tables_wiki.html", "news.html", "pdf_links.html", "article_text.html"]
+
+EXTRACTORS = {
+    "tables": _parse_tables,
+    "text": _extract_text,
+    "headlines": _parse_headlines,
+    "pdf_links": _parse_pdf_links,
+}
+
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+def parse_with(backend: str, extract, content: bytes):
+    parsers.set_parser_backend(backend)
+    try:
+        return extract(content)
+    finally:
+        parsers.set_parser_backend("auto")
+
+
+@pytest.mark.parametrize("extractor", sorted(EXTRACTORS))
+@pytest.mark.parametrize("page", FIXTURE_PAGES)
+def test_backends_agree_on_fixture_pages(page, extractor):
+    content = load_fixture(page)
+    extract = EXTRACTORS[extractor]
+    assert parse_with("html.parser", extract, content) == parse_with("lxml", extract, content)
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def test_unclosed_cells_close_like_a_browser(backend):
+    content = b"<table><tr><td>a<td>b<tr><td>c</table>"
+    assert parse_with(backend, _parse_tables, content) == [[["a", "b"], ["c"]]]
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def test_unclosed_list_items_and_paragraphs(backend):
+    content = b"<ul><li>one<li><b>two<li>three</ul><p>first<div>block</div><p>second"
+    parsers.set_parser_backend(backend)
+    try:
+        soup = parsers.make_soup(content)
+    finally:
+        parsers.set_parser_backend("auto")
+    assert [li.get_text() for li in soup.find_all("li")] == ["one", "two", "three"]
+    assert [p.get_text() for p in soup.find_all("p")] == ["first", "second"]
+
+
+def test_tables_fixture_content():
+    tables = parse_with("html.parser", _parse_tables, load_fixture("tables_wiki.html"))
+    assert tables[0][:3] == [["Rank", "Name", "City", "Height (m)"],
+                             ["1", "Burj Khalifa", "Dubai", "828"],
+                             ["2", "Merdeka\xa0118", "Kuala Lumpur", "678.9"]]
+
+
+def test_missing_backend_falls_back_to_html_parser(monkeypatch):
+    monkeypatch.setitem(parsers._backend_module, "lxml", "no_such_module_for_tests")
+    parsers.set_parser_backend("lxml")
+    try:
+        assert parsers.parser_backend() == "html.parser"
+    finally:
+        parsers.set_parser_backend("auto")
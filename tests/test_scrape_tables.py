@@ -0,0 +1,131 @@
+import io
+import os
+
+import pytest
+import requests
+from urllib3 import HTTPResponse
+
+import http_client
+import result_cache
+import scrape_tables
+from conftest import FIXTURES
+from parsers import set_parser_backend
+from scrape_tables import _parse_tables, iter_table_rows, iter_tables
+
+PAGES = ["tables_wiki.html", "latin1_table.html", "news.html", "article_text.html", "pdf_links.html"]
+
+SNIPPETS = [
+    # <th> row headers next to <td> cells
+    "<table><tr><th>h<td>x</td></tr><tr><th>k</th><td>a<td>b</table>",
+    # a <th> after the first row still drops that row
+    "<table><tr><td>1</td></tr><tr><td>2</td></tr><tr><th>late</th><td>3</td></tr></table>",
+    # nested tables: listed after their parent, their cells counted in it too
+    "<table><tr><td>o<table><tr><th>H</th></tr><tr><td>in</td></tr></table>tail</td><td>z</td></tr>"
+    "<tr><td>r2</td></tr></table>",
+    "<table><caption>c</caption><thead><tr><th>A<th>B<tbody><tr><td>1<td>2<tr><td>3<td>4<tfoot><tr><td>f</table>",
+    "<table><tr><td>a<p>b<script>s</script><style>y</style><br>c<ruby>x<rp>(</rp><rt>r</rt></ruby></td></tr></table>",
+    "<table><tr><td> <!-- c --> a <pre>  </pre>\n \n<b> </b>&amp;&nbsp;x<td/><td>y</table>",
+    "<table><td>lone</td></table><table></table><table><tr><th></th></tr></table>",
+    "<table><tr><td>a</tr></td><td>b</table></table><table><tr><td>unclosed",
+]
+
+
+class FakeResponse:
+    """Just enough of a streamed requests.Response for iter_tables."""
+
+    def __init__(self, body: bytes, chunk: int = 7):
+        self.body = body
+        self.headers = {"Content-Type": "text/html"}
+        self.encoding = "ISO-8859-1"
+        self.chunk = chunk
+        self.from_cache = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), self.chunk):
+            yield self.body[start:start + self.chunk]
+
+    def close(self):
+        pass
+
+
+def read_page(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    def serve(body: bytes):
+        monkeypatch.setattr(scrape_tables, "fetch", lambda url, **kwargs: FakeResponse(body))
+    return serve
+
+
+@pytest.fixture(params=["html.parser", "lxml"])
+def backend(request):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    set_parser_backend(request.param)
+    yield request.param
+    set_parser_backend("auto")
+
+
+@pytest.mark.parametrize("body", [read_page(name) for name in PAGES] + [s.encode("utf-8") for s in SNIPPETS],
+                         ids=PAGES + [f"snippet{i}" for i in range(len(SNIPPETS))])
+def test_streamed_tables_match_dom(serve, backend, body):
+    serve(body)
+    assert list(iter_tables("http://example.test/")) == _parse_tables(body)
+
+
+def test_streamed_rows_match_dom(serve):
+    body = read_page("tables_wiki.html")
+    serve(body)
+    streamed = {}
+    for table_index, cells, is_header in iter_table_rows("http://example.test/"):
+        rows = streamed.setdefault(table_index, [])
+        rows.insert(0, cells) if is_header else rows.append(cells)
+    assert [rows for _, rows in sorted(streamed.items())] == _parse_tables(body)
+
+
+def test_max_tables_stops_after_the_first_tables(serve):
+    body = read_page("tables_wiki.html")
+    serve(body)
+    assert list(iter_tables("http://example.test/", max_tables=2)) == _parse_tables(body)[:2]
+
+
+def make_response(status: int, body: bytes = b"", headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.url = "http://example.test/tables"
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    response.encoding = "utf-8"
+    return response
+
+
+def test_streamed_page_goes_through_the_caches(monkeypatch, tmp_path):
+    monkeypatch.setitem(http_client._config, "cache_dir", str(tmp_path / "http"))
+    monkeypatch.setattr(http_client, "_response_cache", None)
+    monkeypatch.setattr(result_cache, "_cache", result_cache.ResultCache(1 << 20, 1 << 20, str(tmp_path / "results")))
+    body = read_page("tables_wiki.html")
+    sent = []
+
+    def get(url, headers, *args, **kwargs):
+        sent.append(headers)
+        if "If-None-Match" in headers:
+            return make_response(304)
+        return make_response(200, body, {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"})
+
+    monkeypatch.setattr(http_client, "_get", get)
+    expected = _parse_tables(body)
+    assert list(iter_tables("http://example.test/tables")) == expected
+
+    parsed = []
+    monkeypatch.setattr(scrape_tables, "_collect_tables",
+                        lambda *args, **kwargs: parsed.append(1) or iter(expected))
+    assert list(iter_tables("http://example.test/tables")) == expected
+    assert list(iter_tables("http://example.test/tables")) == expected
+    assert sent[1] == {"If-None-Match": '"v1"'}
+    assert parsed == [1]
@@ -0,0 +1,77 @@
+import os
+import threading
+from typing import Optional, Tuple
+import logging
+from disk_cache import CACHE_DIR, DiskLRU
+
+logger = logging.getLogger(__name__)
+
+_config = {
+    "max_bytes": 100 * 1024 * 1024,
+    "directory": os.path.join(CACHE_DIR, "thumbnails"),
+}
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def configure_thumbnail_cache(**settings) -> None:
+    """
+    Change the thumbnail store location or budget.
+
+    Args:
+        **settings: Any of max_bytes or directory
+    """
+    global _cache
+    unknown = set(settings) - set(_config)
+    if unknown:
+        raise ValueError(f"Unknown thumbnail cache settings: {', '.join(sorted(unknown))}")
+    with _cache_lock:
+        _config.update(settings)
+        _cache = None
+
+
+def get_thumbnail_cache() -> DiskLRU:
+    """
+    Return the process-wide thumbnail store, creating it on first use.
+
+    Returns:
+        DiskLRU: Encoded thumbnails keyed by image URL and size
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DiskLRU(_config["directory"], _config["max_bytes"])
+    return _cache
+
+
+def thumbnail_key(url: str, size: Tuple[int, int]) -> str:
+    return f"{url}|{size[0]}x{size[1]}"
+
+
+def get_thumbnail(url: str, size: Tuple[int, int]) -> Optional[bytes]:
+    """
+    Look up the encoded thumbnail of an image.
+
+    Args:
+        url (str): Image URL
+        size (tuple): Bounding box the thumbnail was made for
+
+    Returns:
+        bytes: PNG-encoded thumbnail, or None on a miss
+    """
+    entry = get_thumbnail_cache().get(thumbnail_key(url, size))
+    return entry[0] if entry else None
+
+
+def put_thumbnail(url: str, size: Tuple[int, int], encoded: bytes) -> None:
+    """
+    Store the encoded thumbnail of an image.
+
+    Args:
+        url (str): Image URL
+        size (tuple): Bounding box the thumbnail was made for
+        encoded (bytes): PNG-encoded thumbnail
+    """
+    get_thumbnail_cache().put(thumbnail_key(url, size), encoded, {"url": url, "size": list(size)})
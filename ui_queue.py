@@ -0,0 +1,84 @@
+import itertools
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class UIDispatcher:
+    """
+    Queue of UI updates posted by worker threads and applied on the Tk thread.
+
+    Tk is not thread-safe, so workers never touch widgets themselves: they
+    post a callable, and the Tk thread applies everything pending once per
+    frame. Posts sharing a key coalesce, so only the latest pending status
+    or label update is applied and a burst of them costs one repaint.
+    """
+
+    def __init__(self, root: tk.Misc, interval_ms: int = 16, budget: float = 0.012):
+        """
+        Args:
+            root (tk.Misc): Widget whose after() drives the drain loop
+            interval_ms (int): Delay between drains
+            budget (float): Seconds of updates applied per drain; the rest wait for the next frame
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.budget = budget
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._after_id = None
+
+    def post(self, callback, *args, key: str = None, **kwargs) -> None:
+        """
+        Schedule `callback(*args, **kwargs)` on the Tk thread. Safe from any thread.
+
+        Args:
+            callback (callable): UI update to apply
+            *args: Positional arguments for the callback
+            key (str): Coalescing key; replaces a pending update with the same key
+            **kwargs: Keyword arguments for the callback
+        """
+        if key is None:
+            key = next(self._sequence)
+        with self._lock:
+            # A replaced update moves to the back so it still runs after anything posted before it
+            self._pending.pop(key, None)
+            self._pending[key] = (callback, args, kwargs)
+
+    def start(self) -> None:
+        """Start draining; call from the Tk thread."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self) -> None:
+        """Stop draining and drop pending updates."""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        with self._lock:
+            self._pending.clear()
+
+    def _drain(self) -> None:
+        deadline = time.perf_counter() + self.budget
+        while time.perf_counter() < deadline:
+            with self._lock:
+                if not self._pending:
+                    break
+                _, (callback, args, kwargs) = self._pending.popitem(last=False)
+            try:
+                callback(*args, **kwargs)
+            except Exception:
+                logger.exception(f"UI update {getattr(callback, '__name__', callback)} failed")
+        try:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+        except tk.TclError:
+            # The window was destroyed
+            self._after_id = None